@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark: vectorized score_bounties() vs per-bounty score_bounty().
+
+Checks both give identical scores on every bounty (edge cases included:
+missing/None/zero fields, filled-up spots, float prices), then times them.
+Also times building the columnar table and scoring a prebuilt table
+separately — backfills build the table once and rescore it in place.
+
+python bench/bench_batch_score.py                # 10000 bounties
+python bench/bench_batch_score.py --n 50000
+"""
+
+import sys
+import json
+import random
+import argparse
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "rent" / "scripts"))
+
+import bounty_hunter as bh  # noqa: E402
+from batch_score import to_columns, score_columns  # noqa: E402
+from bench_matcher import make_bounties  # noqa: E402
+
+CATEGORIES = ["research", "physical-tasks", "errands", "development", "design", "writing", "", None]
+
+
+def add_numeric_fields(bounties, seed=3):
+    """Fill in the numeric and location fields score_bounty() reads, with edge cases."""
+    rng = random.Random(seed)
+    for b in bounties:
+        b["price"] = rng.choice([None, 0, 5, 20, 49.5, 75, 150, 400, 1200, rng.uniform(0, 2000)])
+        b["estimatedHours"] = rng.choice([None, 0, 0.5, 1, 2, 4, 8, 40])
+        spots = rng.choice([None, 0, 1, 2, 5])
+        b["spotsAvailable"] = spots
+        b["spotsFilled"] = rng.choice([None, 0, 1, 3, 6])
+        b["category"] = rng.choice(CATEGORIES)
+        if rng.random() < 0.9:
+            b["location"] = {"isRemoteAllowed": rng.choice([True, False, None])}
+        if rng.random() < 0.05:
+            del b["description"]
+        for key in ("price", "estimatedHours", "spotsAvailable", "spotsFilled", "category"):
+            if rng.random() < 0.03:
+                del b[key]
+    return bounties
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--n", type=int, default=10000, help="bounties")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    bounties = add_numeric_fields(make_bounties(args.n))
+    scalar = [bh.score_bounty(b) for b in bounties]
+    batch = bh.score_bounties(bounties)
+    mismatches = [i for i, (a, c) in enumerate(zip(scalar, batch)) if a != c]
+    if mismatches or len(scalar) != len(batch):
+        i = mismatches[0] if mismatches else 0
+        sys.exit(f"{len(mismatches)} scores differ, e.g. {bounties[i]} -> {scalar[i]} vs {batch[i]}")
+
+    # Signal hits are cached per bounty after the first pass, as in a real scan
+    def best(fn):
+        return min(timeit.repeat(fn, number=1, repeat=args.repeat))
+
+    cols = to_columns(bounties, bh._signal_hits, bh.EASY_CATEGORIES)
+    scalar_s = best(lambda: [bh.score_bounty(b) for b in bounties])
+    batch_s = best(lambda: bh.score_bounties(bounties))
+    columns_s = best(lambda: to_columns(bounties, bh._signal_hits, bh.EASY_CATEGORIES))
+    score_s = best(lambda: score_columns(cols))
+    print(json.dumps({
+        "bench": "batch_score",
+        "bounties": args.n,
+        "scalar_ms": round(scalar_s * 1000, 2),
+        "batch_ms": round(batch_s * 1000, 2),
+        "columns_ms": round(columns_s * 1000, 2),
+        "score_columns_ms": round(score_s * 1000, 2),
+        "speedup": round(scalar_s / batch_s, 2) if batch_s else None,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
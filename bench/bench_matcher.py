@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: single-pass signal matcher vs the per-signal `in` loops.
+
+Checks both paths agree on every bounty, then times them.
+
+python bench/bench_matcher.py                  # 2000 bounties
+python bench/bench_matcher.py --n 20000 --signals 200
+"""
+
+import sys
+import json
+import random
+import argparse
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "rent" / "scripts"))
+
+import bounty_hunter as bh  # noqa: E402
+
+WORDS = (
+    "need help with a small python script to scrape listings and export csv "
+    "pick up groceries deliver package photograph event write blog post research "
+    "competitors design logo landing page react node automation data entry remote "
+    "local errand quick task hourly fixed price deadline tomorrow clear deliverables"
+).split()
+
+
+def make_bounties(n, seed=1):
+    """Random bounties with signals sprinkled into some descriptions."""
+    rng = random.Random(seed)
+    signals = bh.FOR_HIRE_SIGNALS + bh.SCAM_SIGNALS
+    bounties = []
+    for i in range(n):
+        words = rng.choices(WORDS, k=rng.randint(5, 120))
+        for _ in range(rng.choice((0, 0, 0, 1, 2))):
+            words.insert(rng.randrange(len(words) + 1), rng.choice(signals))
+        bounties.append({
+            "id": f"bench-{i}",
+            "title": " ".join(rng.choices(WORDS, k=rng.randint(3, 9))).title(),
+            "description": " ".join(words),
+            "skillsNeeded": rng.sample(bh.MY_SKILLS + ["plumbing", "driving", "excel", "ui"], k=rng.randint(0, 4)),
+        })
+    return bounties
+
+
+def legacy_counts(b):
+    """The original per-signal loops from filter_jobs_only() and score_bounty()."""
+    text = f"{b.get('title', '')} {b.get('description', '')}".lower()
+    for_hire = sum(1 for s in bh.FOR_HIRE_SIGNALS if s in text)
+    text = f"{b.get('title', '')} {b.get('description', '')}".lower()
+    scam = sum(1 for s in bh.SCAM_SIGNALS if s in text)
+    needed = [s.lower() for s in b.get("skillsNeeded", [])]
+    skills = sum(1 for s in needed if any(ms in s or s in ms for ms in bh.MY_SKILLS))
+    return for_hire, scam, skills
+
+
+def matcher_counts(b):
+    b.pop("_hits", None)  # Time a cold match, not the per-bounty cache
+    hits = bh._signal_hits(b)
+    return hits["for_hire"], hits["scam"], hits["skills"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--n", type=int, default=2000, help="bounties")
+    parser.add_argument("--signals", type=int, default=0, help="extra synthetic scam signals")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(2)
+    bh.SCAM_SIGNALS = bh.SCAM_SIGNALS + [
+        f"{rng.choice(WORDS)} {rng.choice(WORDS)} {i}" for i in range(args.signals)
+    ]
+    bounties = make_bounties(args.n)
+
+    mismatches = sum(1 for b in bounties if legacy_counts(b) != matcher_counts(b))
+    if mismatches:
+        sys.exit(f"{mismatches} bounties disagree between legacy loops and matcher")
+
+    legacy = min(timeit.repeat(lambda: [legacy_counts(b) for b in bounties], number=1, repeat=args.repeat))
+    matcher = min(timeit.repeat(lambda: [matcher_counts(b) for b in bounties], number=1, repeat=args.repeat))
+    print(json.dumps({
+        "bench": "signal_matcher",
+        "bounties": args.n,
+        "signals": len(bh.FOR_HIRE_SIGNALS) + len(bh.SCAM_SIGNALS),
+        "legacy_ms": round(legacy * 1000, 2),
+        "matcher_ms": round(matcher * 1000, 2),
+        "speedup": round(legacy / matcher, 2) if matcher else None,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark: memory of a fetched board, compact records vs plain dicts.
+
+Encodes a synthetic board (with the API's unread fields, see
+synthetic.api_payload) as pages, then for each path decodes every page,
+filters and heuristically scores the board, tracing allocations with
+tracemalloc. Reports peak and retained memory and untraced wall time.
+"dicts" is the old r.json() path; "records" is records.decode_page over
+64KB chunks. Checks both paths keep and score the same bounties.
+
+python bench/bench_memory.py                    # 20k bounties
+python bench/bench_memory.py --n 200000         # a historical backfill
+"""
+
+import sys
+import json
+import time
+import argparse
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "rent" / "scripts"))
+
+import records  # noqa: E402
+import bounty_hunter as bh  # noqa: E402
+from synthetic import api_payload, make_board  # noqa: E402
+
+CHUNK = 1 << 16
+
+
+def dict_board(pages):
+    board = []
+    for body in pages:
+        board.extend(json.loads(body).get("bounties", []))
+    return board
+
+
+def record_board(pages):
+    board = []
+    for body in pages:
+        chunks = (body[i:i + CHUNK] for i in range(0, len(body), CHUNK))
+        board.extend(records.decode_page(chunks))
+    return board
+
+
+def run(decode, pages):
+    """Decode, filter and score; returns (board, scores)."""
+    board = decode(pages)
+    jobs = bh.filter_jobs_only(board)
+    return board, bh.score_bounties(jobs)
+
+
+def measure(decode, pages):
+    start = time.perf_counter()
+    run(decode, pages)
+    elapsed = (time.perf_counter() - start) * 1000
+    tracemalloc.start()
+    board, scores = run(decode, pages)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"peak_mb": round(peak / 2**20, 1), "retained_mb": round(current / 2**20, 1),
+            "ms": round(elapsed, 1)}, scores
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--n", type=int, default=20000, help="bounties")
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    board = api_payload(make_board(args.n, seed=args.seed, scam_signals=bh.SCAM_SIGNALS,
+                                   for_hire_signals=bh.FOR_HIRE_SIGNALS), seed=args.seed)
+    pages = [json.dumps({"bounties": board[i:i + args.page_size], "hasMore": True}).encode()
+             for i in range(0, len(board), args.page_size)]
+    del board
+
+    report = {"bounties": args.n, "payload_mb": round(sum(map(len, pages)) / 2**20, 1)}
+    report["dicts"], dict_scores = measure(dict_board, pages)
+    report["records"], record_scores = measure(record_board, pages)
+    if dict_scores != record_scores:
+        sys.exit("dict and record paths disagree on the filtered board's scores")
+    report["peak_ratio"] = round(report["records"]["peak_mb"] / report["dicts"]["peak_mb"], 2)
+    report["retained_ratio"] = round(report["records"]["retained_mb"] / report["dicts"]["retained_mb"], 2)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark: CLI startup — import cost, --help, and a cache-hit scan.
+
+Runs each command in a fresh interpreter (bytecode cache warmed first, as
+on a real install) and fails if the cache-hit scan exceeds its budget or
+if it, or a plain import of bounty_hunter, pulls in a heavy module that
+should load lazily. The budget is over bare interpreter startup, which
+varies with whatever site-packages hooks the machine has installed.
+
+python bench/bench_startup.py                   # 20 runs each, 100ms budget
+python bench/bench_startup.py --budget-ms 150
+"""
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+SCRIPTS = Path(__file__).resolve().parent.parent / "rent" / "scripts"
+sys.path.insert(0, str(SCRIPTS))
+
+# Modules a plain import (and so --help or a cache hit) must not load
+HEAVY = ["requests", "urllib3", "dotenv", "asyncio", "concurrent.futures", "numpy"]
+
+
+def child_env(cache_dir):
+    env = dict(os.environ, RENT_CACHE_DIR=str(cache_dir))
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return env
+
+
+def timed_runs(cmd, env, repeat):
+    """Best and median wall time (ms) of `repeat` runs of cmd."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(cmd, env=env, cwd=SCRIPTS, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        times.append((time.perf_counter() - start) * 1000)
+    times.sort()
+    return round(times[0], 1), round(times[len(times) // 2], 1)
+
+
+def import_profile(cmd, env):
+    """({module: cumulative import us}, heavy modules loaded) for one run of cmd."""
+    out = subprocess.run([sys.executable, "-X", "importtime", *cmd], env=env, cwd=SCRIPTS,
+                         check=True, capture_output=True, text=True)
+    modules = {}
+    for line in out.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                modules[name.strip()] = int(cumulative)
+    return modules, [m for m in HEAVY if m in modules]
+
+
+def seed_cache(cache_dir):
+    """Write a fresh ranking so the scan below is a cache hit."""
+    import bounty_store
+    conn = bounty_store.connect(cache_dir / "bounties.db")
+    entries = [{"id": f"b{i:04d}", "title": f"Bounty {i}", "score": 90 - i % 70,
+                "reason": "synthetic", "source": "grok"} for i in range(200)]
+    bounty_store.save_ranking(conn, entries, 2, "bench", datetime.now().isoformat())
+    conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--budget-ms", type=float, default=100, help="cache-hit scan budget")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_dir = Path(tmp)
+        seed_cache(cache_dir)
+        env = child_env(cache_dir)
+        script = str(SCRIPTS / "bounty_hunter.py")
+        subprocess.run([sys.executable, "-c", "import bounty_hunter"], env=env, cwd=SCRIPTS, check=True)
+
+        modules, import_heavy = import_profile(["-c", "import bounty_hunter"], env)
+        _, scan_heavy = import_profile([script, "--no-telegram"], env)
+        baseline = timed_runs([sys.executable, "-c", "pass"], env, args.repeat)
+        help_ms = timed_runs([sys.executable, script, "--help"], env, args.repeat)
+        scan_ms = timed_runs([sys.executable, script, "--no-telegram"], env, args.repeat)
+
+    scan_over = round(scan_ms[1] - baseline[1], 1)
+    report = {
+        "bench": "startup",
+        "import_ms": round(modules["bounty_hunter"] / 1000, 1),
+        "heavy_on_import": import_heavy,
+        "heavy_on_cache_hit": scan_heavy,
+        "interpreter_ms": {"best": baseline[0], "median": baseline[1]},
+        "help_ms": {"best": help_ms[0], "median": help_ms[1]},
+        "cache_hit_scan_ms": {"best": scan_ms[0], "median": scan_ms[1]},
+        "cache_hit_over_interpreter_ms": scan_over,
+        "budget_ms": args.budget_ms,
+    }
+    print(json.dumps(report, indent=2))
+    if import_heavy or scan_heavy:
+        sys.exit(f"heavy modules loaded: {', '.join(sorted(set(import_heavy + scan_heavy)))}")
+    if scan_over > args.budget_ms:
+        sys.exit(f"cache-hit scan {scan_over}ms over interpreter startup, budget {args.budget_ms}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark suite: the scanner's hot paths against a synthetic board.
+
+Everything runs locally — bounties come from bench/synthetic.py and the
+RentAHuman, x.ai and Telegram APIs are the stubs in bench/stubs.py — so
+results are comparable run to run. Prints one JSON report on stdout
+(scanner logs go to stderr); keep it to diff against later runs.
+
+python bench/bench_suite.py                          # 100, 1k, 10k, 100k bounties
+python bench/bench_suite.py --sizes 1000 --grok-latency 0.2 --malformed 0.1
+python bench/bench_suite.py --sizes 100,1000 --out bench_output.json
+"""
+
+import sys
+import json
+import time
+import argparse
+import platform
+import tempfile
+import contextlib
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "rent" / "scripts"))
+
+import board_diff  # noqa: E402
+import bounty_hunter as bh  # noqa: E402
+from stubs import BoardStub, GrokStub, TelegramStub  # noqa: E402
+from synthetic import churn, make_board  # noqa: E402
+
+
+def timed(fn, repeat=1, setup=None):
+    """Best wall time in ms over `repeat` runs, and the last result.
+
+    setup() runs untimed before each run and its result is passed to fn.
+    """
+    best, result = None, None
+    for _ in range(repeat):
+        arg = setup() if setup else None
+        start = time.perf_counter()
+        result = fn(arg) if setup else fn()
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return round(best, 2), result
+
+
+def fresh(board):
+    """Copies without the scanner's per-bounty annotations, for cold runs."""
+    return [{k: v for k, v in b.items() if not k.startswith("_")} for b in board]
+
+
+def use_cache_dir(path):
+    """Point the scanner's store and exports at path, dropping open connections."""
+    bh.CACHE_DIR = path
+    bh.STORE_FILE = path / "bounties.db"
+    bh.CACHE_FILE = path / "bounties_cache.json"
+    bh.CACHE_TXT_FILE = path / "bounties_ranked.txt"
+    bh.BOARD_SNAPSHOT_FILE = path / "board_snapshot.json"
+    bh.RESCORE_LOCK_FILE = path / "rescore.lock"
+    conn = getattr(bh._store_local, "conn", None)
+    if conn is not None:
+        conn.close()
+    bh._store_local.conn = None
+    bh._dedupe.pop("index", None)
+    bh._dedupe.pop("known", None)
+    bh._relevance["index"] = None
+    bh._board_changes.update(log=None, by_id={}, shifted=set())
+
+
+def bench_size(n, args, grok, tmp):
+    board = make_board(n, seed=args.seed, scam_ratio=args.scam_ratio, for_hire_ratio=args.for_hire_ratio,
+                       scam_signals=bh.SCAM_SIGNALS, for_hire_signals=bh.FOR_HIRE_SIGNALS)
+    repeat = max(1, min(args.repeat, 200_000 // n))
+    r = {"bounties": n}
+
+    r["filter_jobs_only_ms"], jobs = timed(bh.filter_jobs_only, repeat, lambda: fresh(board))
+    r["filter_jobs_only_kept"] = len(jobs)
+    r["filter_recent_ms"], recent = timed(lambda: bh.filter_recent(jobs, hours=140), repeat)
+    r["filter_recent_kept"] = len(recent)
+    later = churn(board, seed=args.seed)
+    r["board_diff_ms"], changes = timed(lambda: board_diff.diff(board, later), repeat)
+    r["board_changes"] = len(changes)
+    # Signal hits are cached on each bounty by the filter pass, as in a real scan
+    r["score_bounty_ms"], _ = timed(lambda: [bh.score_bounty(b) for b in recent], repeat)
+    r["score_bounties_ms"], heuristic = timed(lambda: bh.score_bounties(recent), repeat)
+
+    r["pack_prompts_ms"], packed = timed(lambda: bh._pack_prompts(recent, bh.GROK_BATCH_SIZE), repeat)
+    r["prompt_chars_per_bounty"] = round(sum(len(p) for _, p in packed) / max(1, len(recent)), 1)
+    grok_input = fresh(recent)
+    requests_before = grok.requests
+    r["grok_score_bounties_ms"], scored = timed(lambda: bh.grok_score_bounties(grok_input))
+    r["grok_requests"] = grok.requests - requests_before
+    r["grok_scored"] = sum(1 for b, _ in scored or () if b.get("_score_source") == "grok")
+
+    cache_dir = Path(tmp) / f"n{n}"
+    cache_dir.mkdir()
+    use_cache_dir(cache_dir)
+    r["collapse_duplicates_ms"], reps = timed(lambda: bh.collapse_duplicates(fresh(recent), {}))
+    r["collapse_duplicates_kept"] = len(reps)
+    r["rank_relevance_cold_ms"], _ = timed(lambda: bh.rank_relevance(reps))
+    r["rank_relevance_warm_ms"], _ = timed(lambda: bh.rank_relevance(reps), repeat)
+    r["select_for_grok_ms"], (picked, _) = timed(lambda: bh.select_for_grok(reps), repeat)
+    r["grok_selected"] = len(picked)
+    pairs = list(zip(recent, heuristic))
+    r["rank_ms"], ranked = timed(lambda: bh.rank(pairs), repeat)
+
+    def push_all():
+        top = bh.new_ranking()
+        for b, s in pairs:
+            bh.rank_push(top, b, s)
+        return top
+    r["rank_incremental_ms"], _ = timed(push_all, repeat)
+    r["save_cache_ms"], _ = timed(lambda: bh.save_cache(ranked), repeat)
+    r["load_cache_ms"], _ = timed(bh.load_cache, repeat)
+    # --serve: the first read loads the ranking, later ones check the version and hit the memo
+    view = bh._ranking_view()
+    r["query_cold_ms"], _ = timed(lambda: view.query(limit=20))
+    r["query_top_ms"], _ = timed(lambda: view.query(limit=20), repeat)
+    r["query_filtered_ms"], _ = timed(lambda: view.query(limit=20, min_score=40, remote=True), repeat)
+    r["query_digest_ms"], _ = timed(lambda: view.digest(20), repeat)
+
+    # End to end: fetch (paged) → filter → score → save, then the cache-hit path
+    with BoardStub(fresh(board)) as api:
+        bh.RENTAHUMAN_BASE = api.url
+        use_cache_dir(cache_dir / "scan")
+        (cache_dir / "scan").mkdir()
+        r["scan_force_cold_ms"], _ = timed(lambda: bh.scan(hours=140, force=True))
+        r["scan_force_warm_ms"], _ = timed(lambda: bh.scan(hours=140, force=True))
+        r["scan_cached_ms"], _ = timed(lambda: bh.scan(hours=140), repeat)
+        r["board_requests"] = api.requests
+        # --record, then --replay of the capture (no network)
+        bh.start_recording(cache_dir / "capture")
+        r["scan_force_recorded_ms"], _ = timed(lambda: bh.scan(hours=140, force=True))
+        bh.stop_recording()
+    r["replay_ms"], _ = timed(lambda: bh.replay(cache_dir / "capture"), repeat)
+    return r
+
+
+def bench_telegram(args):
+    """Deliver a 60-bounty digest (several messages) to the Telegram stub."""
+    board = make_board(60, seed=args.seed, scam_signals=bh.SCAM_SIGNALS, for_hire_signals=bh.FOR_HIRE_SIGNALS)
+    digest = bh.format_digest(list(zip(board, bh.score_bounties(board))), limit=60)
+    with TelegramStub() as tg:
+        bh.TELEGRAM_API_BASE = tg.url
+        bh._telegram_target = lambda: ("bench-chat", "bench-token")
+        ms, _ = timed(lambda: bh.send_telegram(digest))
+        return {"digest_chars": len(digest), "messages": len(tg.sent), "send_telegram_ms": ms}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="100,1000,10000,100000", help="comma-separated board sizes")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per timing (fewer for big boards)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--scam-ratio", type=float, default=0.05)
+    parser.add_argument("--for-hire-ratio", type=float, default=0.15)
+    parser.add_argument("--grok-latency", type=float, default=0.02, help="seconds per stub Grok call")
+    parser.add_argument("--malformed", type=float, default=0.0, help="share of malformed Grok replies")
+    parser.add_argument("--out", help="also write the report here")
+    args = parser.parse_args()
+
+    bh.load_config()  # Apply .env first so the stub URLs below stick
+    bh.RENTAHUMAN_API_KEY = bh.XAI_API_KEY = "bench"
+    bh.GROK_RETRIES = 0  # Count malformed replies as failures instead of sleeping on them
+
+    report = {
+        "bench": "suite",
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "grok_latency_s": args.grok_latency,
+        "malformed_rate": args.malformed,
+        "scam_ratio": args.scam_ratio,
+        "for_hire_ratio": args.for_hire_ratio,
+        "sizes": [],
+    }
+    with tempfile.TemporaryDirectory() as tmp, contextlib.redirect_stdout(sys.stderr):
+        with GrokStub(latency=args.grok_latency, malformed_rate=args.malformed, seed=args.seed) as grok:
+            bh.XAI_CHAT_URL = grok.url
+            for n in (int(s) for s in args.sizes.split(",")):
+                report["sizes"].append(bench_size(n, args, grok, tmp))
+                use_cache_dir(Path(tmp))
+        report["telegram"] = bench_telegram(args)
+
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.out:
+        Path(args.out).write_text(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""
+Local stand-ins for the RentAHuman, x.ai and Telegram APIs.
+
+Each stub is a threaded HTTP server on a free localhost port. Point the
+scanner's RENTAHUMAN_BASE / XAI_CHAT_URL / TELEGRAM_API_BASE at `.url`.
+
+    board = BoardStub(bounties)         # GET /api/bounties, cursor pages, per-page ETag/304
+    grok = GrokStub(latency=0.05, malformed_rate=0.1)   # chat completions, JSON or SSE
+    tg = TelegramStub(fail_rate=0.0)    # POST /bot<token>/sendMessage
+"""
+
+import json
+import time
+import random
+import hashlib
+import threading
+from urllib.parse import urlparse, parse_qs
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+
+class Stub:
+    """Base stub: serves from a daemon thread until close(). Counts requests."""
+
+    path = ""
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.requests = 0
+        self.lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep-alive, like the real APIs
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                stub._count()
+                stub.handle_get(self)
+
+            def do_POST(self):
+                stub._count()
+                length = int(self.headers.get("Content-Length", 0))
+                stub.handle_post(self, json.loads(self.rfile.read(length) or b"{}"))
+
+        self.server = _Server(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}{self.path}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def _count(self):
+        with self.lock:
+            self.requests += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def handle_get(self, h):
+        h.send_error(405)
+
+    def handle_post(self, h, body):
+        h.send_error(405)
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _send_json(h, status, data, headers=()):
+    out = json.dumps(data).encode()
+    h.send_response(status)
+    h.send_header("Content-Type", "application/json")
+    h.send_header("Content-Length", str(len(out)))
+    for name, value in headers:
+        h.send_header(name, value)
+    h.end_headers()
+    h.wfile.write(out)
+
+
+class BoardStub(Stub):
+    """GET /api/bounties with ?limit and ?cursor paging, per-page ETags and 304s.
+
+    Each page's ETag hashes its content and the board version, so a
+    conditional fetch of a page sees any change to that page. Replace
+    .bounties (or call touch()) to change the board. Set .loop_cursor to
+    keep answering with the same nextCursor (a misbehaving API), and
+    .bare_304 to send 304s without repeating the ETag (which HTTP allows).
+    """
+
+    path = "/api"
+
+    def __init__(self, bounties, latency=0.0):
+        self.bounties = bounties
+        self.version = 1
+        self.loop_cursor = False
+        self.bare_304 = False
+        super().__init__(latency)
+
+    def touch(self):
+        self.version += 1
+
+    def handle_get(self, h):
+        url = urlparse(h.path)
+        if url.path != "/api/bounties":
+            return h.send_error(404)
+        query = parse_qs(url.query)
+        cursor = int(query.get("cursor", ["0"])[0])
+        limit = int(query.get("limit", ["100"])[0])
+        page = {"bounties": self.bounties[cursor:cursor + limit]}
+        if self.loop_cursor:
+            page["nextCursor"] = str(cursor)
+        elif cursor + limit < len(self.bounties):
+            page["nextCursor"] = str(cursor + limit)
+        body = json.dumps(page)
+        etag = f'"{self.version}-{hashlib.sha1(body.encode()).hexdigest()[:16]}"'
+        if h.headers.get("If-None-Match") == etag:
+            h.send_response(304)
+            if not self.bare_304:
+                h.send_header("ETag", etag)
+            h.send_header("Content-Length", "0")
+            h.end_headers()
+            return
+        _send_json(h, 200, page, [("ETag", etag)])
+
+
+def stub_score(summary):
+    """Deterministic 0-100 score for a bounty summary, so runs are comparable."""
+    digest = hashlib.sha1(json.dumps(summary, sort_keys=True).encode()).digest()
+    return digest[0] * 100 // 255
+
+
+class GrokStub(Stub):
+    """OpenAI-style chat completions that score every bounty in the prompt (for each listed person).
+
+    latency is per request; malformed_rate is the share of replies that are
+    not valid JSON (or, when streaming, cut off halfway). Reports token
+    usage estimated at 4 characters per token.
+    """
+
+    path = "/v1/chat/completions"
+
+    def __init__(self, latency=0.0, malformed_rate=0.0, seed=0):
+        self.malformed_rate = malformed_rate
+        self.rng = random.Random(seed)
+        super().__init__(latency)
+
+    def handle_post(self, h, body):
+        prompt = body["messages"][-1]["content"]
+        try:
+            summaries = json.loads(prompt.split("Bounties:\n", 1)[1].split("\n\nRespond", 1)[0])
+            if isinstance(summaries, dict):  # Columnar table: {"cols": [...], "rows": [[...], ...]}
+                summaries = [dict(zip(summaries["cols"], row)) for row in summaries["rows"]]
+        except (IndexError, KeyError, TypeError, ValueError):
+            return _send_json(h, 400, {"error": "no bounties in prompt"})
+        # Multi-profile prompts have a "for" column: one score per listed person
+        content = json.dumps([
+            dict({"idx": s["idx"], "score": stub_score(s), "reason": "stub score"}, **({"for": who} if who else {}))
+            for s in summaries for who in (s["for"].split(",") if s.get("for") else [None])
+        ])
+        with self.lock:
+            malformed = self.rng.random() < self.malformed_rate
+        usage = {"prompt_tokens": len(prompt) // 4, "completion_tokens": len(content) // 4}
+        usage["total_tokens"] = usage["prompt_tokens"] + usage["completion_tokens"]
+        if not body.get("stream"):
+            if malformed:
+                content = "Sure! Here are the scores: " + content[: len(content) // 2]
+            reply = {"choices": [{"message": {"role": "assistant", "content": content}}], "usage": usage}
+            return _send_json(h, 200, reply)
+
+        if malformed:
+            content = content[: len(content) // 2]
+        h.send_response(200)
+        h.send_header("Content-Type", "text/event-stream")
+        h.send_header("Connection", "close")
+        h.end_headers()
+        for i in range(0, len(content), 64):
+            delta = {"choices": [{"delta": {"content": content[i:i + 64]}}]}
+            h.wfile.write(f"data: {json.dumps(delta)}\n\n".encode())
+        if not malformed:
+            h.wfile.write(f"data: {json.dumps({'choices': [], 'usage': usage})}\n\n".encode())
+            h.wfile.write(b"data: [DONE]\n\n")
+        h.wfile.flush()
+        h.close_connection = True
+
+
+class TelegramStub(Stub):
+    """POST /bot<token>/sendMessage. fail_rate is the share answered with a 500."""
+
+    def __init__(self, latency=0.0, fail_rate=0.0, seed=0):
+        self.fail_rate = fail_rate
+        self.rng = random.Random(seed)
+        self.sent = []
+        super().__init__(latency)
+
+    def handle_post(self, h, body):
+        if not h.path.endswith("/sendMessage"):
+            return h.send_error(404)
+        if len(body.get("text", "")) > 4096:
+            return _send_json(h, 400, {"ok": False, "description": "Bad Request: message is too long"})
+        with self.lock:
+            fail = self.rng.random() < self.fail_rate
+            if not fail:
+                self.sent.append(body)
+            message_id = len(self.sent)
+        if fail:
+            return _send_json(h, 500, {"ok": False, "description": "Internal Server Error"})
+        _send_json(h, 200, {"ok": True, "result": {"message_id": message_id}})
@@ -0,0 +1,238 @@
+"""
+Synthetic RentAHuman boards for the offline benchmarks.
+
+Bounties look like the real API's: category-dependent titles, pay and
+hours, skill lists skewed toward common skills, descriptions from a few
+words to a few paragraphs, and createdAt spread over the last days (with
+the odd missing or malformed timestamp). A configurable share are scams
+or "for hire" self-promotions built from the scanner's own signal lists,
+and a share are reposts: an earlier bounty (spam most of all) copied
+under a new ID with a small edit.
+"""
+
+import random
+from datetime import datetime, timedelta, timezone
+
+# category: (weight, median price $, median hours, share remote)
+CATEGORIES = {
+    "development": (0.22, 300, 8, 0.9),
+    "research": (0.14, 60, 2, 0.95),
+    "writing": (0.12, 80, 3, 0.95),
+    "design": (0.10, 150, 5, 0.9),
+    "marketing": (0.10, 120, 4, 0.8),
+    "physical-tasks": (0.12, 40, 1.5, 0.05),
+    "errands": (0.10, 30, 1, 0.0),
+    "data-entry": (0.10, 25, 2, 1.0),
+}
+
+TASKS = {
+    "development": ["Build a {thing} in {tech}", "Fix bugs in our {tech} {thing}",
+                    "Automate {chore} with {tech}", "Add {feature} to a {tech} app"],
+    "research": ["Research {n} competitors in {field}", "Find contact info for {n} {field} companies",
+                 "Summarize recent papers on {field}", "Compile pricing data for {field} tools"],
+    "writing": ["Write {n} blog posts about {field}", "Edit a {n}-page {field} report",
+                "Draft product descriptions for a {field} store", "Ghostwrite a newsletter on {field}"],
+    "design": ["Design a logo for a {field} startup", "Create {n} social media graphics",
+               "Redesign the landing page for our {thing}", "Make a pitch deck for a {field} company"],
+    "marketing": ["Run a {field} outreach campaign", "Grow our {platform} following",
+                  "Set up email sequences for a {field} launch", "Post flyers about our {field} event"],
+    "physical-tasks": ["Photograph a storefront in {city}", "Assemble furniture in {city}",
+                       "Check a rental property in {city}", "Hand out samples at a {city} market"],
+    "errands": ["Pick up a package in {city}", "Deliver documents across {city}",
+                "Wait in line for tickets in {city}", "Buy and ship groceries in {city}"],
+    "data-entry": ["Enter {n} invoices into a spreadsheet", "Clean up a CRM export of {n} rows",
+                   "Transcribe {n} minutes of audio", "Tag {n} product images"],
+}
+
+FILL = {
+    "thing": ["dashboard", "scraper", "chrome extension", "landing page", "telegram bot", "API", "CLI tool"],
+    "tech": ["Python", "React", "Node", "Django", "Next.js", "Go", "Flutter"],
+    "chore": ["invoice exports", "lead scraping", "report emails", "CSV cleanup"],
+    "feature": ["Stripe checkout", "OAuth login", "CSV import", "dark mode", "search"],
+    "field": ["fintech", "healthcare", "real estate", "AI", "ecommerce", "fitness", "education"],
+    "platform": ["Twitter", "TikTok", "LinkedIn", "Instagram"],
+    "city": ["Cleveland", "Austin", "Denver", "Toledo", "Chicago", "Columbus", "Seattle"],
+    "n": ["3", "5", "10", "20", "50", "100", "500"],
+    "team": ["small", "growing", "two-person", "remote-first", "family-run", "early-stage"],
+    "purpose": ["an investor update", "a product launch", "our spring sale", "a grant application",
+                "a client pitch", "onboarding new hires", "our quarterly review", "a trade show"],
+    "when": ["by Friday", "within two weeks", "before the end of the month", "this weekend", "asap"],
+}
+
+BRIEFS = [
+    "We are a {team} {field} team in {city} and need this for {purpose}.",
+    "This is for {purpose}, so we need it {when}.",
+    "Our {team} {field} shop needs help with this {when}.",
+    "Part of {purpose} at a {team} {field} company.",
+]
+
+EDITS = [" Updated budget.", " Still looking!", " Reposting, please apply.", " (urgent)", " Thanks!"]
+
+DETAILS = [
+    "Clear deliverables and a short call to kick off.",
+    "Please include a rough timeline in your application.",
+    "Must be done by the end of the week.",
+    "We will share access to the shared drive once you start.",
+    "Payment on completion, milestones possible for larger work.",
+    "Previous work samples are a plus but not required.",
+    "Expect a couple of rounds of feedback.",
+    "The brief and reference material are attached to the task.",
+    "Quality matters more than speed on this one.",
+    "Happy to answer questions in the comments before you apply.",
+]
+
+SKILLS = {
+    "development": ["python", "javascript", "react", "node", "web development", "full stack", "api", "sql"],
+    "research": ["research", "excel", "google sheets", "analysis"],
+    "writing": ["writing", "copywriting", "editing", "seo"],
+    "design": ["design", "figma", "photoshop", "branding", "ui"],
+    "marketing": ["marketing", "social media", "email marketing", "seo"],
+    "physical-tasks": ["photography", "driving", "assembly", "local"],
+    "errands": ["driving", "local", "errands"],
+    "data-entry": ["data entry", "excel", "typing", "transcription"],
+}
+
+NAMES = ["Alex M.", "Priya S.", "Jordan K.", "Sam T.", "Chen L.", "Maria G.", "Omar F."]
+
+
+def _pick(rng, words):
+    """Zipf-ish choice: earlier entries are more common."""
+    return words[min(int(rng.paretovariate(1.2)) - 1, len(words) - 1)]
+
+
+def _fill(rng, template):
+    return template.format(**{k: rng.choice(v) for k, v in FILL.items() if "{" + k + "}" in template})
+
+
+def _job(rng, category):
+    _, price, hours, remote = CATEGORIES[category]
+    title = _fill(rng, rng.choice(TASKS[category]))
+    sentences = [title + ".", _fill(rng, rng.choice(BRIEFS))] + rng.sample(DETAILS, k=rng.choice((0, 1, 2, 3)))
+    return {
+        "title": title,
+        "description": " ".join(sentences),
+        "category": category,
+        "price": round(price * rng.lognormvariate(0, 0.7), 2),
+        "estimatedHours": max(0.5, round(hours * rng.lognormvariate(0, 0.6) * 2) / 2),
+        "skillsNeeded": sorted({_pick(rng, SKILLS[category]) for _ in range(rng.randint(0, 3))}),
+        "location": {"isRemoteAllowed": rng.random() < remote},
+    }
+
+
+def _scam(rng, category, scam_signals):
+    b = _job(rng, category)
+    bait = rng.sample(scam_signals, k=rng.randint(2, 3))
+    b["description"] = (f"Easy money! {bait[0]} and {bait[1]} to get started. "
+                        + " ".join(bait[2:]) + " Quick payout guaranteed.")
+    b["price"] = rng.choice((500, 1000, 2500))
+    return b
+
+
+def _for_hire(rng, category, for_hire_signals):
+    b = _job(rng, category)
+    pitch = rng.sample(for_hire_signals, k=rng.randint(1, 3))
+    role = _pick(rng, SKILLS[category]).title()
+    b["title"] = f"{role} Specialist – {rng.choice(NAMES)}" if rng.random() < 0.7 else f"{role} services"
+    b["description"] = " ".join(f"{p.strip().capitalize()} {role.lower()} work." for p in pitch)
+    return b
+
+
+def _repost(rng, board, scams):
+    """Copy of an earlier bounty (a scam when there are some, half the time) with a small edit."""
+    source = rng.choice(scams) if scams and rng.random() < 0.5 else rng.choice(board)
+    b = {k: v for k, v in source.items() if k not in ("id", "createdAt")}
+    b["description"] = (b.get("description") or "") + rng.choice(EDITS)
+    if rng.random() < 0.5:
+        b["price"] = round((b.get("price") or 0) * rng.choice((0.9, 1.1, 1.25)), 2)
+    return b
+
+
+def make_board(n, seed=0, scam_ratio=0.05, for_hire_ratio=0.15, repost_ratio=0.1, max_age_hours=240,
+               scam_signals=(), for_hire_signals=(), now=None):
+    """n synthetic open bounties.
+
+    scam_signals / for_hire_signals are the phrases to plant (pass the
+    scanner's lists); scam_ratio, for_hire_ratio and repost_ratio are the
+    shares of scams, self-promotions and near-duplicate reposts.
+    """
+    rng = random.Random(seed)
+    now = now or datetime.now(timezone.utc)
+    categories = list(CATEGORIES)
+    weights = [CATEGORIES[c][0] for c in categories]
+    board, scams = [], []
+    for i in range(n):
+        category = rng.choices(categories, weights)[0]
+        roll = rng.random()
+        if board and rng.random() < repost_ratio:
+            b = _repost(rng, board, scams)
+        elif roll < scam_ratio and scam_signals:
+            b = _scam(rng, category, list(scam_signals))
+            scams.append(b)
+        elif roll < scam_ratio + for_hire_ratio and for_hire_signals:
+            b = _for_hire(rng, category, list(for_hire_signals))
+        else:
+            b = _job(rng, category)
+        spots = rng.choice((1, 1, 1, 2, 3, 5))
+        filled = min(spots, rng.choice((0, 0, 0, 1, 2)))
+        age = timedelta(hours=rng.uniform(0, max_age_hours))
+        created = (now - age).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+        b.update({
+            "id": "%08x-%04x-%04x-%04x-%012x" % (rng.getrandbits(32), rng.getrandbits(16), i % 65536,
+                                                rng.getrandbits(16), rng.getrandbits(48)),
+            "createdAt": rng.choices((created, "", "last tuesday"), (0.96, 0.03, 0.01))[0],
+            "spotsAvailable": spots,
+            "spotsFilled": filled,
+            "spotsRemaining": spots - filled,
+            "applicationCount": rng.randint(0, 40),
+            "status": "open",
+        })
+        board.append(b)
+    return board
+
+
+def churn(board, seed=0, share=0.05):
+    """The board some time later: a share of bounties closed, repriced, taking applicants or
+    filling up, and as many new ones posted."""
+    rng = random.Random(seed + 1)
+    out = []
+    for b in board:
+        roll = rng.random()
+        if roll < share:
+            continue
+        b = dict(b)
+        if roll < share * 2:
+            b["price"] = round((b.get("price") or 0) * rng.choice((0.8, 1.25, 1.5)), 2)
+        elif roll < share * 3:
+            b["spotsFilled"] = b["spotsAvailable"]
+            b["spotsRemaining"] = 0
+        elif roll < share * 4:
+            b["applicationCount"] = b.get("applicationCount", 0) + rng.randint(1, 5)
+        out.append(b)
+    fresh = make_board(max(1, int(len(board) * share)), seed=seed + 2)
+    return out + fresh
+
+
+def api_payload(board, seed=0):
+    """Copies of board's bounties with the fields the real API also sends but the scanner
+    doesn't read: poster details, timestamps, tags, a fuller location."""
+    rng = random.Random(seed + 3)
+    out = []
+    for b in board:
+        b = dict(b)
+        created = b.get("createdAt") or "2026-01-01T00:00:00.000Z"
+        b.update({
+            "agentId": "agent_%012x" % rng.getrandbits(48),
+            "agentName": rng.choice(NAMES),
+            "agentType": rng.choice(("openclaw", "custom", "mcp")),
+            "agentAvatarUrl": "https://rentahuman.ai/avatars/%08x.png" % rng.getrandbits(32),
+            "updatedAt": created,
+            "expiresAt": created,
+            "currency": "USD",
+            "paymentMethod": rng.choice(("escrow", "crypto", "stripe")),
+            "tags": rng.sample(FILL["field"], k=rng.randint(0, 3)),
+            "requirements": rng.sample(DETAILS, k=rng.randint(0, 2)),
+            "location": dict(b.get("location") or {}, city=rng.choice(FILL["city"]), country="US",
+                             coordinates={"lat": round(rng.uniform(25, 48), 4), "lng": round(rng.uniform(-122, -71), 4)}),
+        })
+        out.append(b)
+    return out
@@ -0,0 +1,64 @@
+"""
+Vectorized heuristic scoring over a columnar bounty table.
+
+Same rules and results as bounty_hunter.score_bounty(), computed for the
+whole board at once with NumPy. Requires numpy; bounty_hunter falls back
+to the scalar scorer when it isn't installed.
+"""
+
+import numpy as np
+
+
+def to_columns(bounties, signal_hits, easy_categories):
+    """Pull the fields score_bounty() reads into parallel arrays.
+
+    signal_hits(b) -> {"scam": n, "skills": n, ...} is the scanner's cached
+    matcher, so text and skill matching happen once per bounty.
+    """
+    codes = {}
+    price = np.array([b.get("price", 0) or 0 for b in bounties], dtype=np.float64)
+    hours = np.array([b.get("estimatedHours", 1) or 1 for b in bounties], dtype=np.float64)
+    remote = np.array([bool((b.get("location") or {}).get("isRemoteAllowed")) for b in bounties], dtype=bool)
+    spots = np.array([b.get("spotsAvailable", 1) or 1 for b in bounties], dtype=np.float64)
+    filled = np.array([b.get("spotsFilled", 0) or 0 for b in bounties], dtype=np.float64)
+    desc_len = np.array([len(b.get("description", "") or "") for b in bounties], dtype=np.int64)
+    hits = [signal_hits(b) for b in bounties]
+    scam = np.array([h["scam"] for h in hits], dtype=np.int64)
+    # -1 none listed, 0 no match, 1 match
+    skills = np.array([-1 if not b.get("skillsNeeded") else int(h["skills"] > 0)
+                       for b, h in zip(bounties, hits)], dtype=np.int8)
+    category = np.array([codes.setdefault(b.get("category", ""), len(codes)) for b in bounties], dtype=np.int32)
+
+    easy = np.zeros(len(codes), dtype=bool)
+    for cat, code in codes.items():
+        easy[code] = cat in easy_categories
+
+    return {
+        "price": price, "hours": hours, "remote": remote, "spots": spots,
+        "filled": filled, "desc_len": desc_len, "scam": scam, "skills": skills,
+        "category": category, "easy": easy[category],
+    }
+
+
+def score_columns(cols):
+    """Score every row at once. Returns an int64 array clipped to 0-100."""
+    hourly = cols["price"] / cols["hours"]
+    score = np.full(len(hourly), 50, dtype=np.int64)
+
+    # Pay rate
+    score += np.where(hourly >= 50, 20, np.where(hourly >= 25, 10, np.where(hourly < 10, -15, 0)))
+    # Remote
+    score += np.where(cols["remote"], 10, 0)
+    # Scam detection
+    score += np.where(cols["scam"] >= 2, -40, np.where(cols["scam"] == 1, -15, 0))
+    # Skill match
+    score += np.where(cols["skills"] == 1, 15, np.where(cols["skills"] == 0, -10, 0))
+    # Description quality
+    score += np.where(cols["desc_len"] > 200, 5, np.where(cols["desc_len"] < 50, -10, 0))
+    # Competition
+    score += np.where((cols["spots"] > 1) & (cols["filled"] == 0), 5, 0)
+    score += np.where(cols["spots"] - cols["filled"] <= 0, -50, 0)
+    # Easy categories
+    score += np.where(cols["easy"], 5, 0)
+
+    return np.clip(score, 0, 100)
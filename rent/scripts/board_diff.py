@@ -0,0 +1,93 @@
+"""
+Board change tracking: what changed between two fetches of the board.
+
+diff() compares the previous snapshot with the new one bounty by bounty.
+It returns a changelog entry for each bounty that is:
+- new: not on the previous board;
+- updated: a tracked field changed;
+- filled: its last open spot was taken;
+- closed: gone from the board, or no longer open.
+Entries carry per-field deltas. A tracked field's class says what a
+change to it invalidates:
+- GROK_FIELDS are what Grok reads (the score store's hash covers the
+  same fields), so a change means Grok rescoring;
+- COMPETITION_FIELDS only feed the heuristic competition term;
+- INFO_FIELDS are recorded but rescore nothing.
+"""
+
+GROK_FIELDS = ("title", "description", "price", "estimatedHours", "category", "skillsNeeded", "location")
+COMPETITION_FIELDS = ("spotsAvailable", "spotsFilled", "spotsRemaining")
+INFO_FIELDS = ("status", "applicationCount")
+TRACKED = GROK_FIELDS + COMPETITION_FIELDS + INFO_FIELDS
+
+KINDS = ("new", "updated", "filled", "closed")
+
+
+def is_open(b):
+    return (b.get("status") or "open") == "open"
+
+
+def spots_left(b):
+    if b.get("spotsRemaining") is not None:
+        return b["spotsRemaining"]
+    return (b.get("spotsAvailable", 1) or 1) - (b.get("spotsFilled", 0) or 0)
+
+
+def deltas(old, new):
+    """{field: [old value, new value]} for the tracked fields that differ."""
+    return {f: [old.get(f), new.get(f)] for f in TRACKED if old.get(f) != new.get(f)}
+
+
+def diff(previous, current):
+    """Changelog from the previous board to the current one (lists of bounties).
+
+    Returns [{"id", "kind", "title", "changes": {field: [old, new]}}, ...]:
+    current board order first, then the bounties that left the board.
+    """
+    before = {b["id"]: b for b in previous if b.get("id")}
+    log, live = [], set()
+    for b in current:
+        bid = b.get("id")
+        if not bid:
+            continue
+        live.add(bid)
+        old = before.get(bid)
+        if old is None:
+            if is_open(b):
+                log.append({"id": bid, "kind": "new", "title": b.get("title"), "changes": {}})
+            continue
+        changes = deltas(old, b)
+        if not changes:
+            continue
+        if not is_open(b):
+            if not is_open(old):
+                continue
+            kind = "closed"
+        elif spots_left(b) <= 0 < spots_left(old):
+            kind = "filled"
+        else:
+            kind = "updated"
+        log.append({"id": bid, "kind": kind, "title": b.get("title"), "changes": changes})
+    for bid, old in before.items():
+        if bid not in live and is_open(old):
+            log.append({"id": bid, "kind": "closed", "title": old.get("title"), "changes": {}})
+    return log
+
+
+def action(entry):
+    """What an entry calls for: "grok", "heuristic" (competition term only), "evict" or None."""
+    if entry["kind"] == "closed":
+        return "evict"
+    if entry["kind"] == "new" or any(f in entry["changes"] for f in GROK_FIELDS):
+        return "grok"
+    if any(f in entry["changes"] for f in COMPETITION_FIELDS):
+        return "heuristic"
+    return None
+
+
+def summary(log):
+    """{kind: count} for the kinds present in log."""
+    counts = {}
+    for entry in log:
+        counts[entry["kind"]] = counts.get(entry["kind"], 0) + 1
+    return counts
@@ -9,7 +9,14 @@ sends top picks to Telegram. Run via cron or /rent scan.
 python bounty_hunter.py --jobs        # List all open job postings (raw, no scoring)
 python bounty_hunter.py --humans      # List available humans for hire
 python bounty_hunter.py --force       # Bypass cache, fresh Grok scoring
+python bounty_hunter.py --deadline 3s # Answer within 3s; late Grok scores are merged into the cache
+python bounty_hunter.py --wait        # Wait on another process's rescore instead of returning the cache
+python bounty_hunter.py --new         # Only bounties first seen in the last run
+python bounty_hunter.py --changelog   # What changed on the board lately (new, updated, filled, closed)
+python bounty_hunter.py --watch       # Long-running adaptive poller (SIGTERM to stop)
+python bounty_hunter.py --profiles    # One scan, a ranking + digest per profile in profiles.json
 python bounty_hunter.py --no-telegram # Skip sending to Telegram
+python bounty_hunter.py --changes-only # Telegram gets only bounties new to the top 20
 ===================================
 
 Project: Rent-A-Human-Agent
@@ -17,14 +24,26 @@ Repo: github.com/shane9coy/Rent-A-Human-Agent
 Built by: x.com/@shaneswrld_ | github.com/shane9coy
 """
 
+import io
 import os
 import sys
 import json
+import time
 import threading
-import requests
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from dotenv import load_dotenv
+import board_diff
+import bounty_store
+import dedupe
+import metrics
+import prompt_pack
+import relevance
+import telegram_delivery
+from signal_matcher import compile_matcher, compile_skill_matcher
+
+# Heavy modules (requests, dotenv, asyncio, concurrent.futures, numpy) are
+# imported inside the functions that use them, and nothing touches the disk
+# or .env at import — a cache-hit scan never pays for them.
 
 # Project root is 4 levels up from this script
 # .claude/skills/rent/scripts/bounty_hunter.py -> project root
@@ -35,19 +54,104 @@ SCRIPT_DIR = Path(__file__).parent
 # .claude/skills/rent/scripts/bounty_hunter.py -> .claude/skills/rent/
 PROJECT_DIR = Path(__file__).parent.parent
 
-# Load .env from project root
-load_dotenv(PROJECT_ROOT / ".env")
-
-RENTAHUMAN_API_KEY = os.getenv("RENTAHUMAN_API_KEY", "")
-XAI_API_KEY = os.getenv("XAI_API_KEY", "")
+# Defaults below; load_config() applies overrides from the environment / .env
+RENTAHUMAN_API_KEY = ""
+XAI_API_KEY = ""
 RENTAHUMAN_BASE = "https://rentahuman.ai/api"
 RENTAHUMAN_WEB = "https://rentahuman.ai"
-CACHE_DIR = PROJECT_DIR / "cache"
-CACHE_DIR.mkdir(exist_ok=True)
-CACHE_FILE = CACHE_DIR / "bounties_cache.json"
-CACHE_TXT_FILE = CACHE_DIR / "bounties_ranked.txt"
+XAI_CHAT_URL = "https://api.x.ai/v1/chat/completions"
+GROK_MODEL = "grok-4-1-fast-reasoning"
+GROK_BATCH_SIZE = 40  # Max bounties per Grok call
+GROK_PROMPT_TOKENS = 6000  # Estimated prompt tokens per Grok call; the rest overflow to more calls
+GROK_CONCURRENCY = 4  # Parallel Grok calls
+GROK_RETRIES = 2      # Extra attempts per failed chunk
+GROK_TIMEOUT = 120    # Seconds per Grok call
+GROK_STREAM = False   # SSE streaming for every Grok call
+GROK_TOP_K = 200      # Most relevant new/changed bounties sent to Grok per run (0 = all)
+GROK_MIN_RELEVANCE = 0.0  # Bounties less relevant than this keep their heuristic score
+GROK_BREAKER_FAILURES = 5         # Failed Grok calls in a row that open the circuit
+GROK_BREAKER_COOLDOWN_SECS = 300  # How long an open circuit skips Grok
+SCAN_DEADLINE_SECS = 0.0  # Default --deadline for scans (0 = wait for Grok)
+# Read from the process environment only (paths are fixed at import)
+CACHE_DIR = Path(os.getenv("RENT_CACHE_DIR", PROJECT_DIR / "cache"))
+PROFILES_FILE = Path(os.getenv("RENT_PROFILES_FILE", PROJECT_DIR / "profiles.json"))  # For --profiles
+STORE_FILE = CACHE_DIR / "bounties.db"              # SQLite store (source of truth)
+CACHE_FILE = CACHE_DIR / "bounties_cache.json"      # JSON export of the ranking
+CACHE_TXT_FILE = CACHE_DIR / "bounties_ranked.txt"  # Text export of the ranking
+BOARD_SNAPSHOT_FILE = CACHE_DIR / "board_snapshot.json"  # Last full board + per-page validators
+FETCH_PAGE_SIZE = 100
+PIPELINE_QUEUE_SIZE = 4  # Batches buffered between pipeline stages
 CACHE_TTL_HOURS = 12
 CACHE_VERSION = 2  # Bump to invalidate old caches (v1 had unfiltered for-hire ads)
+TELEGRAM_API_BASE = "https://api.telegram.org"
+TELEGRAM_CHANGES_ONLY = False  # Only send bounties new to the top N
+OUTBOX_MAX_ATTEMPTS = 8       # Queued Telegram messages dropped after this many tries
+OUTBOX_BASE_DELAY_SECS = 60   # First retry delay, doubled per attempt (max 1hr)
+WATCH_HEARTBEAT_FILE = CACHE_DIR / "watch.heartbeat"
+RESCORE_LOCK_FILE = CACHE_DIR / "rescore.lock"  # Held by the one process rescoring the board
+RESCORE_LEASE_SECS = 300      # A lock not heartbeated for this long is taken over
+RESCORE_HEARTBEAT_SECS = 30   # How often the holder refreshes the lock
+RESCORE_WAIT_SECS = 900       # Longest --wait on another process's rescore
+SERVE_HOST = "127.0.0.1"   # --serve listens here (loopback only by default)
+SERVE_PORT = 8765          # Default --serve port
+WATCH_MIN_SECS = 60.0      # Fastest poll in --watch
+WATCH_MAX_SECS = 1800.0    # Slowest poll in --watch
+WATCH_HEARTBEAT_SECS = 30  # Max gap between heartbeats while idle
+METRICS_DIR = os.getenv("RENT_METRICS_DIR", "")  # Export run metrics here (off when empty)
+METRICS_REPORT_FILE = "scan_report.json"
+METRICS_PROM_FILE = "rent_scanner.prom"  # For node_exporter's textfile collector
+RECORD_DIR = os.getenv("RENT_RECORD_DIR", "")  # Record board pages and Grok calls here (off when empty)
+DEDUPE_TTL_DAYS = 14    # Fingerprints of bounties off the board this long are dropped
+CHANGELOG_TTL_DAYS = 14  # Board changelog entries kept this long
+MIN_SCORE = 20          # Lowest score kept in a ranking
+RANKING_SIZE = 500      # Most bounties kept in a ranking (0 = every one at or above MIN_SCORE)
+SCORE_TTL_HOURS = 72    # Per-bounty Grok score lifetime
+SCORE_STORE_MAX = 5000  # Oldest entries evicted past this size
+
+# Settings that the environment or .env may override, with their types
+_ENV_SETTINGS = {
+    "RENTAHUMAN_API_KEY": str,
+    "XAI_API_KEY": str,
+    "RENTAHUMAN_BASE": str,
+    "XAI_CHAT_URL": str,
+    "GROK_BATCH_SIZE": int,
+    "GROK_PROMPT_TOKENS": int,
+    "GROK_CONCURRENCY": int,
+    "GROK_STREAM": lambda v: v == "1",
+    "GROK_TOP_K": int,
+    "GROK_MIN_RELEVANCE": float,
+    "GROK_BREAKER_FAILURES": int,
+    "GROK_BREAKER_COOLDOWN_SECS": float,
+    "SCAN_DEADLINE_SECS": float,
+    "RANKING_SIZE": int,
+    "TELEGRAM_API_BASE": str,
+    "TELEGRAM_CHANGES_ONLY": lambda v: v == "1",
+    "SERVE_HOST": str,
+    "SERVE_PORT": int,
+    "WATCH_MIN_SECS": float,
+    "WATCH_MAX_SECS": float,
+}
+_config_loaded = False
+
+
+def load_config():
+    """Load .env from project root and apply env overrides, once.
+
+    Called by every code path that needs keys or the network, so a cache
+    hit or --help never imports dotenv. Unset variables keep the defaults.
+    """
+    global _config_loaded
+    if _config_loaded:
+        return
+    _config_loaded = True
+    from dotenv import load_dotenv
+    load_dotenv(PROJECT_ROOT / ".env")
+    settings = globals()
+    for name, cast in _ENV_SETTINGS.items():
+        value = os.getenv(name)
+        if value is not None:
+            settings[name] = cast(value)
+
 
 # Skills you can actually do — bounties matching these score higher
 MY_SKILLS = [
@@ -56,6 +160,19 @@ MY_SKILLS = [
     "research", "writing", "data entry", "design",
 ]
 
+# Where you can work in person, and whether remote gigs suit you — both
+# make a bounty more relevant when choosing which ones Grok sees
+MY_LOCATIONS = []
+PREFER_REMOTE = True
+
+# What Grok is told about you
+MY_LOCATION = "northern Ohio, USA"
+MY_PROMPT_SKILLS = ("python, web dev, AI, automation, marketing, writing, research, vibe coach, "
+                    "photographer, telegram, psychologist, life coach, mcp, design")
+
+# Categories that are quick wins — small score bump
+EASY_CATEGORIES = ("research", "physical-tasks", "errands")
+
 SCAM_SIGNALS = [
     "send money", "send eth", "send btc", "send crypto",
     "wallet:", "0x", "deposit first", "return to your",
@@ -75,22 +192,332 @@ FOR_HIRE_SIGNALS = [
 
 # ── API ──────────────────────────────────────────────────
 
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def _session(name):
+    """Shared keep-alive session per service ("rentahuman", "xai", "telegram").
+
+    GETs retry on 429/5xx with backoff; POSTs only retry failed connects,
+    since a resent sendMessage or Grok call isn't free.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    with _sessions_lock:
+        if name not in _sessions:
+            s = requests.Session()
+            retry = Retry(
+                total=3,
+                connect=3,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset({"GET"}),
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(max_retries=retry, pool_maxsize=max(10, GROK_CONCURRENCY))
+            s.mount("https://", adapter)
+            s.mount("http://", adapter)
+            _sessions[name] = s
+        return _sessions[name]
+
+
 def _headers():
     return {"X-API-Key": RENTAHUMAN_API_KEY, "Content-Type": "application/json"}
 
 
+def _load_board_snapshot():
+    """The last full board (as records) and its validators, or {} if there isn't one."""
+    import records
+    snapshot = {}
+    try:
+        with open(BOARD_SNAPSHOT_FILE, "rb") as f:
+            snapshot["bounties"] = list(records.decode_page(iter(lambda: f.read(1 << 16), b""), snapshot))
+    except Exception:
+        return {}
+    return snapshot
+
+
+def fetch_bounty_pages(page_size=None):
+    """Yield pages of open bounties as they arrive.
+
+    Every page request is conditional (If-None-Match / If-Modified-Since)
+    on the validators that page had last time, as long as it's requested
+    with the same cursor or page number. A 304 yields that page's bounties
+    from BOARD_SNAPSHOT_FILE without downloading them, and pagination
+    continues from the page's saved cursor.
+    Follows `nextCursor` or `hasMore`/`page` pagination when the API returns it.
+    Pages are decoded as they stream in, into compact records (records.py).
+    """
+    import records
+    load_config()
+    snapshot = _load_board_snapshot()
+    previous = snapshot.get("bounties")
+    saved, offset = [], 0  # [(page meta, its bounties)] from the last fetch
+    if previous is not None:
+        for meta in snapshot.get("pages") or ():
+            saved.append((meta, previous[offset:offset + meta["count"]]))
+            offset += meta["count"]
+    params = {"limit": page_size or FETCH_PAGE_SIZE}
+
+    session = _session("rentahuman")
+    board, pages, cursors, reused = [], [], set(), 0
+    recorder, captured, started = _recorder(), [], time.time()
+    while True:
+        headers = _headers()
+        old = saved[len(pages)] if len(pages) < len(saved) else None
+        if old and old[0]["params"] == params:
+            if old[0].get("etag"):
+                headers["If-None-Match"] = old[0]["etag"]
+            if old[0].get("last_modified"):
+                headers["If-Modified-Since"] = old[0]["last_modified"]
+        with metrics.span("fetch_page"):
+            r = session.get(f"{RENTAHUMAN_BASE}/bounties", headers=headers, params=params, timeout=15,
+                            stream=True)
+            not_modified = r.status_code == 304 and old and old[0]["params"] == params
+            try:
+                if not_modified:
+                    metrics.incr("fetch_not_modified")
+                    reused += 1
+                    data, bounties = old[0]["next"], old[1]
+                    if recorder:
+                        body = io.StringIO()
+                        records.write_page(body, data, bounties)
+                        captured.append(recorder.put(body.getvalue().encode()))
+                else:
+                    if r.status_code >= 400:
+                        metrics.incr("http_errors", service="rentahuman", status=r.status_code)
+                    r.raise_for_status()
+                    data, body = {}, []
+                    chunks = r.iter_content(1 << 16)
+                    if recorder:
+                        chunks = _tee(chunks, body)
+                    bounties = list(records.decode_page(chunks, data))
+                    if recorder:
+                        captured.append(recorder.put(b"".join(body)))
+            finally:
+                r.close()
+        metrics.incr("fetch_pages")
+        metrics.incr("fetch_bounties", len(bounties))
+        # A 304 needn't repeat the validators; keep the page's old ones if it doesn't
+        kept = old[0] if not_modified else {}
+        pages.append({
+            "params": dict(params),
+            "etag": r.headers.get("ETag") or kept.get("etag", ""),
+            "last_modified": r.headers.get("Last-Modified") or kept.get("last_modified", ""),
+            "count": len(bounties),
+            "next": {k: data[k] for k in ("nextCursor", "next_cursor", "hasMore") if k in data},
+        })
+        board.extend(bounties)
+        yield bounties
+
+        cursor = data.get("nextCursor") or data.get("next_cursor")
+        if cursor and bounties:
+            if cursor in cursors:
+                _log(f"Board pagination returned cursor {cursor!r} twice — stopping at page {len(pages)}")
+                break
+            cursors.add(cursor)
+            params["cursor"] = cursor
+        elif data.get("hasMore") and bounties:
+            params["page"] = params.get("page", 1) + 1
+        else:
+            break
+
+    if recorder:
+        recorder.event("fetch", at=started, pages=captured, not_modified=reused)
+    if reused == len(pages) == len(saved):
+        _log(f"Board unchanged (304 on all {reused} pages) — reusing {len(board)} bounties")
+        _track_changes([])
+        return
+    if reused:
+        _log(f"{reused}/{len(pages)} board pages unchanged (304) — reused from the last fetch")
+
+    CACHE_DIR.mkdir(exist_ok=True)
+    with open(BOARD_SNAPSHOT_FILE, "w") as f:
+        # Written a bounty at a time, without the annotations (_hits, _grok_reason, ...) added downstream
+        records.write_page(f, {"fetched_at": datetime.now().isoformat(), "pages": pages}, board)
+    _track_changes(None if previous is None else board_diff.diff(previous, board), board)
+
+
 def fetch_bounties():
-    """Pull all open bounties."""
-    r = requests.get(f"{RENTAHUMAN_BASE}/bounties", headers=_headers(), timeout=15)
-    r.raise_for_status()
-    return r.json().get("bounties", [])
+    """Pull all open bounties and record them in the store's history."""
+    with metrics.span("fetch"):
+        bounties = [b for page in fetch_bounty_pages() for b in page]
+    bounty_store.record_seen(_store(), bounties, datetime.now().isoformat())
+    return bounties
+
+
+# ── Board changes ────────────────────────────────────────
+
+_board_changes = {"log": None}
+
+
+def _track_changes(log, board=()):
+    """Keep the latest fetch's changelog for this run, store it, shift stored scores
+    for spot changes, and evict closed or filled bounties.
+
+    log is None when there was no previous board to compare with; board is
+    the fetched board the log leads to.
+    """
+    _board_changes["log"] = log
+    if not log:
+        return
+    counts = board_diff.summary(log)
+    for kind, n in counts.items():
+        metrics.incr("board_changes", n, kind=kind)
+    _log("Board changes: " + ", ".join(f"{counts[k]} {k}" for k in board_diff.KINDS if k in counts))
+    now = datetime.now()
+    evict_before = (now - timedelta(days=CHANGELOG_TTL_DAYS)).isoformat()
+    bounty_store.record_changes(_store(), log, now.isoformat(), evict_before)
+    _shift_stored_scores(log, board)
+    gone = [e["id"] for e in log if e["kind"] in ("closed", "filled")]
+    if gone:
+        evict_closed(gone)
+
+
+def evict_closed(ids):
+    """Take closed or filled bounties out of every ranking (main and profiles) now and refresh the exports."""
+    targets = [None] + [
+        {"name": d.name} for d in sorted((CACHE_DIR / "profiles").glob("*"))
+        if (d / STORE_FILE.name).exists()
+    ]
+    evicted = 0
+    for profile in targets:
+        conn = _store(profile)
+        removed = bounty_store.unrank(conn, ids)
+        if removed:
+            export_cache(bounty_store.load_ranking(conn), profile)
+            evicted += removed
+    if evicted:
+        metrics.incr("closed_evicted", evicted)
+        _log(f"Evicted {evicted} closed or filled bounties from the ranking")
+    return evicted
+
+
+def _competition_shift(b, entry):
+    """How much b's competition term moved with changelog entry (0 if its spots didn't change)."""
+    if board_diff.action(entry) != "heuristic":
+        return 0
+    old = dict(b, **{f: v[0] for f, v in entry["changes"].items() if f in board_diff.COMPETITION_FIELDS})
+    return _competition(b) - _competition(old)
+
+
+def _shift_stored_scores(log, board):
+    """Move every stored Grok score (all personas) of a bounty whose spots changed by its competition shift.
+
+    Spot counts aren't part of the score store's hash, so a stored score is
+    shifted instead of being sent back to Grok. It's done once, here, when
+    the change is seen, so the shift sticks even if this fetch scores nothing.
+    """
+    by_id = {b.get("id"): b for b in board}
+    shifts = {}
+    for entry in log:
+        b = by_id.get(entry["id"])
+        shift = _competition_shift(b, entry) if b is not None else 0
+        if shift:
+            shifts[entry["id"]] = shift
+    shifted = bounty_store.shift_scores(_store(), shifts) if shifts else 0
+    if shifted:
+        metrics.incr("score_store_shifted", shifted)
+        _log(f"Score store: {shifted} stored scores shifted for spot changes")
+
+
+def _format_changes(rows):
+    """Format changelog rows for display."""
+    if not rows:
+        return None
+    lines = ["**Board changes** (newest first)", ""]
+    for row in rows:
+        at = datetime.fromisoformat(row["at"]).strftime("%b %d %I:%M %p")
+        fields = ", ".join(
+            f"{f} {v[0]}→{v[1]}" if f in board_diff.COMPETITION_FIELDS + ("price", "estimatedHours", "status")
+            else f for f, v in row["deltas"].items()
+        )
+        lines.append(f"{at}  {row['kind']:<7}  `{row['id'][:8]}`  {row.get('title') or 'Untitled'}"
+                     + (f" — {fields}" if fields else ""))
+    return "\n".join(lines)
+
+
+# ── Profiles ─────────────────────────────────────────────
+
+def default_profile():
+    """The profile built from this file's settings (used when there is no profiles.json)."""
+    return {
+        "name": "default",
+        "skills": list(MY_SKILLS),
+        "prompt_skills": MY_PROMPT_SKILLS,
+        "location": MY_LOCATION,
+        "locations": list(MY_LOCATIONS),
+        "prefer_remote": PREFER_REMOTE,
+        "min_score": MIN_SCORE,
+        "limit": 20,
+        "telegram_chat_id": None,
+    }
+
+
+def load_profiles():
+    """Profiles from PROFILES_FILE (see profiles.py), or just the default profile."""
+    import profiles
+    return profiles.load(PROFILES_FILE, default_profile())
 
 
 # ── Filtering ────────────────────────────────────────────
 
-def filter_recent(bounties, hours=48):
-    """Keep only bounties created in the last N hours."""
-    cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
+_matchers = {}
+
+
+def _compiled_matchers():
+    """Signal and skill matchers, rebuilt only if the signal lists change."""
+    key = (tuple(FOR_HIRE_SIGNALS), tuple(SCAM_SIGNALS), tuple(MY_SKILLS))
+    if _matchers.get("key") != key:
+        _matchers["signals"] = compile_matcher({"for_hire": FOR_HIRE_SIGNALS, "scam": SCAM_SIGNALS})
+        _matchers["skill"] = compile_skill_matcher(MY_SKILLS)
+        _matchers["key"] = key
+    return _matchers
+
+
+def _signal_hits(b):
+    """Per-list signal hit counts for a bounty, computed once and cached on it.
+
+    "skills" counts skillsNeeded entries that match MY_SKILLS.
+    """
+    hits = b.get("_hits")
+    if hits is None:
+        matchers = _compiled_matchers()
+        b["_text"] = f"{b.get('title', '')} {b.get('description', '')}".lower()
+        hits = matchers["signals"](b["_text"])
+        skill_match = matchers["skill"]
+        hits["skills"] = sum(1 for s in b.get("skillsNeeded", []) if skill_match(s.lower()))
+        b["_hits"] = hits
+    return hits
+
+
+_skill_matchers = {}
+
+
+def _skill_count(b, skills):
+    """skillsNeeded entries of b that match skills (a profile's list rather than MY_SKILLS)."""
+    key = tuple(skills)
+    match = _skill_matchers.get(key)
+    if match is None:
+        match = _skill_matchers[key] = compile_skill_matcher(list(skills))
+    return sum(1 for s in b.get("skillsNeeded", []) if match(s.lower()))
+
+
+def filter_recent(bounties, hours=48, now=None):
+    """Keep only bounties created in the N hours before now (a UTC datetime, default the current time)."""
+    with metrics.span("filter", filter="recent"):
+        recent = _filter_recent(bounties, hours, now)
+    metrics.incr("filter_in", len(bounties), filter="recent")
+    metrics.incr("filter_out", len(recent), filter="recent")
+    return recent
+
+
+def _filter_recent(bounties, hours, now=None):
+    cutoff = (now or datetime.now(timezone.utc)) - timedelta(hours=hours)
     recent = []
     for b in bounties:
         created = b.get("createdAt", "")
@@ -108,10 +535,17 @@ def filter_recent(bounties, hours=48):
 
 def filter_jobs_only(bounties):
     """Remove 'for hire' self-promotions — keep only actual job postings."""
+    with metrics.span("filter", filter="jobs_only"):
+        jobs = _filter_jobs_only(bounties)
+    metrics.incr("filter_in", len(bounties), filter="jobs_only")
+    metrics.incr("filter_out", len(jobs), filter="jobs_only")
+    return jobs
+
+
+def _filter_jobs_only(bounties):
     jobs = []
     for b in bounties:
-        text = f"{b.get('title', '')} {b.get('description', '')}".lower()
-        hits = sum(1 for s in FOR_HIRE_SIGNALS if s in text)
+        hits = _signal_hits(b)["for_hire"]
         if hits >= 2:
             continue  # Almost certainly a self-promo
         # Title pattern: "Job Title – Person Name" where desc starts with "I am"
@@ -121,10 +555,207 @@ def filter_jobs_only(bounties):
     return jobs
 
 
+# ── Near-duplicates ──────────────────────────────────────
+
+_dedupe = {"lock": threading.Lock()}
+
+
+def _dedupe_state():
+    """Near-duplicate index and {id: (text_hash, cluster)}, loaded from the store once."""
+    if "index" not in _dedupe:
+        index, known = dedupe.NearDupIndex(), {}
+        for bid, text_hash, blob, cluster in bounty_store.load_fingerprints(_store()):
+            known[bid] = (text_hash, cluster)
+            if cluster not in index.clusters:
+                index.add(dedupe.unpack(blob), cluster)
+        _dedupe.update(index=index, known=known)
+    return _dedupe["index"], _dedupe["known"]
+
+
+def _cluster(b, index, known, rows):
+    """Cluster id for a bounty; only new or edited postings get (re)signed."""
+    bid = b.get("id")
+    text = dedupe.normalize(b.get("title"), b.get("description"))
+    text_hash = dedupe.text_hash(text)
+    stored = known.get(bid)
+    if stored and stored[0] == text_hash:
+        return stored[1]
+    sig = dedupe.signature(text)
+    if sig is None:
+        return bid or f"text:{text_hash}"
+    cluster = index.find(sig)
+    if cluster is None:
+        cluster = bid or f"text:{text_hash}"
+        index.add(sig, cluster)
+    if bid:
+        known[bid] = (text_hash, cluster)
+        rows.append((bid, text_hash, dedupe.pack(sig), cluster))
+    return cluster
+
+
+def collapse_duplicates(bounties, reps):
+    """Fold near-duplicate reposts into one representative per cluster.
+
+    reps maps cluster → representative for the current run; pass the same
+    dict for every batch of a run. The first posting of a cluster seen in
+    the run represents it and the rest go in its "_dupes" list. Clusters
+    persist in the store, so a repost is recognized in later runs too.
+    Returns the representatives in input order.
+    """
+    out, rows = [], []
+    with metrics.span("dedupe"), _dedupe["lock"]:
+        index, known = _dedupe_state()
+        for b in bounties:
+            cluster = _cluster(b, index, known, rows)
+            rep = reps.get(cluster)
+            if rep is None:
+                reps[cluster] = b
+                b["_dupes"] = []
+                out.append(b)
+            else:
+                rep["_dupes"].append(b)
+        if rows:
+            evict_before = (datetime.now() - timedelta(days=DEDUPE_TTL_DAYS)).isoformat()
+            bounty_store.save_fingerprints(_store(), rows, evict_before)
+    metrics.incr("dedupe_in", len(bounties))
+    metrics.incr("dedupe_out", len(out))
+    return out
+
+
+def prune_duplicates(live_ids):
+    """Drop fingerprints and clusters of bounties that are no longer on the board from memory.
+
+    A cluster stays indexed while any of its postings is live. The store
+    keeps fingerprints for DEDUPE_TTL_DAYS, so a later run still spots a
+    repost of a gig that was only briefly off the board.
+    """
+    with _dedupe["lock"]:
+        if "index" not in _dedupe:
+            return
+        index, known = _dedupe["index"], _dedupe["known"]
+        for bid in [bid for bid in known if bid not in live_ids]:
+            del known[bid]
+        live = {cluster for _, cluster in known.values()} | live_ids
+        for cluster in [c for c in index.clusters if c not in live]:
+            index.remove(cluster)
+
+
+def propagate_scores(scored, store_suffix=""):
+    """Give each representative's score and reason to its reposts.
+
+    Grok scores are stored for the reposts too (under id + store_suffix),
+    so whichever copy is still on the board later is already scored.
+    Returns how many reposts were scored.
+    """
+    now = datetime.now()
+    expires = (now + timedelta(hours=SCORE_TTL_HOURS)).isoformat()
+    entries, count = [], 0
+    for b, s in scored:
+        for m in b.get("_dupes", ()):
+            m["_grok_reason"] = b.get("_grok_reason", "")
+            m["_score_source"] = b.get("_score_source", "heuristic")
+            m["_dup_of"] = b.get("id")
+            count += 1
+            if m["_score_source"] == "grok" and m.get("id"):
+                entries.append({
+                    "id": m["id"] + store_suffix,
+                    "hash": _bounty_hash(m),
+                    "score": s,
+                    "reason": m["_grok_reason"],
+                    "scored_at": now.isoformat(),
+                    "expires": expires,
+                })
+    if entries:
+        bounty_store.put_scores(_store(), entries, SCORE_STORE_MAX, now.isoformat())
+    if count:
+        _log(f"Folded {count} reposts into {sum(1 for b, _ in scored if b.get('_dupes'))} bounties")
+    metrics.incr("dedupe_propagated", count)
+    return count
+
+
+# ── Relevance ────────────────────────────────────────────
+
+_relevance = {"lock": threading.Lock(), "index": None}
+
+
+def _relevance_fields(b):
+    """Weighted text a bounty is indexed under: title and skills count most."""
+    location = b.get("location") or {}
+    fields = [
+        (b.get("title") or "", 3),
+        (" ".join(b.get("skillsNeeded") or ()), 3),
+        (b.get("category") or "", 2),
+        (" ".join(v for v in location.values() if isinstance(v, str)), 2),
+        ((b.get("description") or "")[:dedupe.TEXT_CHARS], 1),
+    ]
+    if location.get("isRemoteAllowed"):
+        fields.append(("remote", 1))
+    return fields
+
+
+def rank_relevance(bounties, profile=None):
+    """Index bounties (new or edited ones only) and set each one's "_relevance".
+
+    The score is BM25 against the profile's skills, locations and "remote"
+    when it prefers remote work (default: MY_SKILLS, MY_LOCATIONS,
+    PREFER_REMOTE); 0.0 means no query term matched. Returns bounties.
+    """
+    profile = profile or default_profile()
+    query = relevance.query_terms(
+        list(profile["skills"]) + list(profile["locations"]) + (["remote"] if profile["prefer_remote"] else [])
+    )
+    with metrics.span("relevance"), _relevance["lock"]:
+        index = _relevance["index"]
+        if index is None:
+            index = _relevance["index"] = relevance.RelevanceIndex()
+        ids = []
+        for b in bounties:
+            if b.get("id"):
+                index.update(b["id"], _relevance_fields(b))
+                ids.append(b["id"])
+        scores = index.scores(ids, query)
+    for b in bounties:
+        b["_relevance"] = round(scores.get(b.get("id"), 0.0), 3)
+    return bounties
+
+
+def prune_relevance(live_ids):
+    """Drop indexed bounties that are no longer on the board."""
+    with _relevance["lock"]:
+        index = _relevance["index"]
+        if index is not None:
+            for bid in [d for d in index.docs if d not in live_ids]:
+                index.remove(bid)
+
+
+def _relevance_key(b):
+    return (b["_relevance"], b["_heuristic"])
+
+
+def select_for_grok(bounties):
+    """Split bounties into (sent to Grok, kept on heuristic scores) by relevance.
+
+    The GROK_TOP_K most relevant at or above GROK_MIN_RELEVANCE are sent;
+    ties go to the higher heuristic score.
+    """
+    unranked = [b for b in bounties if "_relevance" not in b]
+    if unranked:
+        rank_relevance(unranked)
+    unscored = [b for b in bounties if "_heuristic" not in b]
+    for b, s in zip(unscored, score_bounties(unscored)):
+        b["_heuristic"] = s
+    eligible = [b for b in bounties if b["_relevance"] >= GROK_MIN_RELEVANCE]
+    if GROK_TOP_K and len(eligible) > GROK_TOP_K:
+        import heapq
+        eligible = heapq.nlargest(GROK_TOP_K, eligible, key=_relevance_key)
+    picked = {id(b) for b in eligible}
+    return eligible, [b for b in bounties if id(b) not in picked]
+
+
 # ── Scoring ──────────────────────────────────────────────
 
-def score_bounty(bounty):
-    """Score a bounty 0-100 for feasibility and value."""
+def score_bounty(bounty, skills=None):
+    """Score a bounty 0-100 for feasibility and value (skill match against skills, default MY_SKILLS)."""
     score = 50
     price = bounty.get("price", 0) or 0
     hours = bounty.get("estimatedHours", 1) or 1
@@ -143,17 +774,15 @@ def score_bounty(bounty):
         score += 10
 
     # Scam detection
-    text = f"{bounty.get('title', '')} {bounty.get('description', '')}".lower()
-    scam_hits = sum(1 for s in SCAM_SIGNALS if s in text)
+    scam_hits = _signal_hits(bounty)["scam"]
     if scam_hits >= 2:
         score -= 40
     elif scam_hits == 1:
         score -= 15
 
     # Skill match
-    needed = [s.lower() for s in bounty.get("skillsNeeded", [])]
-    if needed:
-        matches = sum(1 for s in needed if any(ms in s or s in ms for ms in MY_SKILLS))
+    if bounty.get("skillsNeeded", []):
+        matches = _signal_hits(bounty)["skills"] if skills is None else _skill_count(bounty, skills)
         score += 15 if matches > 0 else -10
 
     # Description quality
@@ -164,26 +793,124 @@ def score_bounty(bounty):
         score -= 10
 
     # Competition
+    score += _competition(bounty)
+
+    # Easy categories
+    if bounty.get("category", "") in EASY_CATEGORIES:
+        score += 5
+
+    return max(0, min(100, score))
+
+
+def _competition(bounty):
+    """score_bounty()'s competition term: open multi-spot gigs up, full ones way down."""
     spots = bounty.get("spotsAvailable", 1) or 1
     filled = bounty.get("spotsFilled", 0) or 0
+    term = 0
     if spots > 1 and filled == 0:
-        score += 5
+        term += 5
     if spots - filled <= 0:
-        score -= 50
+        term -= 50
+    return term
 
-    # Easy categories
-    if bounty.get("category", "") in ("research", "physical-tasks", "errands"):
-        score += 5
 
-    return max(0, min(100, score))
+def score_bounties(bounties, skills=None):
+    """Heuristic scores for a list of bounties, same as score_bounty() per item.
+
+    Vectorized with NumPy when available (batch_score.py), scalar otherwise.
+    """
+    if not bounties:
+        return []
+    metrics.incr("heuristic_scored", len(bounties))
+    with metrics.span("heuristic"):
+        try:
+            from batch_score import to_columns, score_columns
+        except ImportError:
+            return [score_bounty(b, skills) for b in bounties]
+        hits = _signal_hits if skills is None else (lambda b: dict(_signal_hits(b), skills=_skill_count(b, skills)))
+        cols = to_columns(bounties, hits, EASY_CATEGORIES)
+        return score_columns(cols).tolist()
+
+
+# ── Ranking ──────────────────────────────────────────────
+
+def _rank_tie(b):
+    """Equal scores rank by bounty id, so the order Grok answers in never reorders them."""
+    return b.get("id") or ""
+
+
+def _rankable(b):
+    """Closed and filled bounties leave the ranking."""
+    return board_diff.is_open(b) and board_diff.spots_left(b) > 0
+
+
+def new_ranking(min_score=None):
+    """An incremental ranking (ranking.TopK) of bounties keyed by id(bounty); feed it with rank_push()."""
+    import ranking
+    return ranking.TopK(RANKING_SIZE or None, MIN_SCORE if min_score is None else min_score, _rank_tie)
+
+
+def rank_push(top, b, score):
+    """Add b to the ranking, or move it to a new score; a closed or filled b is removed."""
+    if _rankable(b):
+        top.push(id(b), b, score)
+    else:
+        top.remove(id(b))
+
+
+def rank(scored, min_score=None):
+    """The best RANKING_SIZE of [(bounty, score), ...] at or above min_score (default MIN_SCORE), best first."""
+    import ranking
+    return ranking.top([p for p in scored if _rankable(p[0])], RANKING_SIZE or None,
+                       MIN_SCORE if min_score is None else min_score, _rank_tie)
 
 
 # ── Cache ───────────────────────────────────────────
 
-def load_cache():
-    """Load cached scan results. Returns (data, is_fresh) tuple."""
+_store_local = threading.local()
+
+
+def _profile_dir(profile):
+    """A profile's own cache directory, or None for the default profile (CACHE_DIR's files)."""
+    if not profile or profile["name"] == "default":
+        return None
+    return CACHE_DIR / "profiles" / profile["name"]
+
+
+def _store(profile=None):
+    """This thread's connection to the SQLite store (opened on first use).
+
+    A profile's store holds only its ranking; scores, fingerprints and the
+    outbox live in the main store.
+    """
+    directory = _profile_dir(profile)
+    if directory is not None:
+        conns = _store_local.__dict__.setdefault("profiles", {})
+        if profile["name"] not in conns:
+            directory.mkdir(parents=True, exist_ok=True)
+            conns[profile["name"]] = bounty_store.connect(directory / STORE_FILE.name)
+        return conns[profile["name"]]
+    conn = getattr(_store_local, "conn", None)
+    if conn is None:
+        CACHE_DIR.mkdir(exist_ok=True)
+        conn = _store_local.conn = bounty_store.connect(STORE_FILE)
+    return conn
+
+
+def _write_atomic(path, text):
+    """Write via temp file + rename so readers never see a half-written file."""
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_text(text)
+    os.replace(tmp, path)
+
+
+def load_cache(profile=None):
+    """Load cached scan results (the profile's, if given). Returns (data, is_fresh) tuple."""
     try:
-        cache = json.loads(CACHE_FILE.read_text())
+        with metrics.span("cache_load"):
+            cache = bounty_store.load_ranking(_store(profile))
+        if cache is None:
+            return None, False
         # Invalidate if wrong version (old caches had unfiltered for-hire ads)
         if cache.get("version") != CACHE_VERSION:
             _log(f"Cache version mismatch (found {cache.get('version')}, need {CACHE_VERSION}) — invalidating")
@@ -196,32 +923,61 @@ def load_cache():
         return None, False
 
 
-def save_cache(scored_bounties):
-    """Save scored bounties to cache with timestamp."""
-    CACHE_DIR.mkdir(exist_ok=True)
-    cache = {
-        "version": CACHE_VERSION,
-        "last_call": datetime.now().isoformat(),
-        "model": "grok-4-1-fast-reasoning",
-        "bounties": [
-            {"id": b.get("id"), "title": b.get("title"), "score": s, "reason": b.get("_grok_reason", "")}
-            for b, s in scored_bounties
-        ],
-    }
-    CACHE_FILE.write_text(json.dumps(cache, indent=2))
-    generate_cache_txt(cache)
+def save_cache(scored_bounties, profile=None):
+    """Save scored bounties to the (profile's) store with timestamp, then refresh the exports."""
+    entries = [
+        {
+            "id": b.get("id"),
+            "title": b.get("title"),
+            "score": s,
+            "reason": b.get("_grok_reason", ""),
+            "source": b.get("_score_source", "heuristic"),
+            "dupes": len(b.get("_dupes") or ()),
+            "category": b.get("category"),
+            "remote": (b.get("location") or {}).get("isRemoteAllowed", False),
+            "price": b.get("price"),
+        }
+        for b, s in scored_bounties
+    ]
+    conn = _store(profile)
+    with metrics.span("cache_save"):
+        bounty_store.save_ranking(conn, entries, CACHE_VERSION, GROK_MODEL, datetime.now().isoformat())
+        export_cache(bounty_store.load_ranking(conn), profile)
+
+
+def export_cache(cache, profile=None):
+    """Write the JSON and TXT views of the current ranking."""
+    cache = {k: cache[k] for k in ("version", "last_call", "model", "bounties")}
+    directory = _profile_dir(profile)
+    _write_atomic(directory / CACHE_FILE.name if directory else CACHE_FILE, json.dumps(cache, indent=2))
+    generate_cache_txt(cache, profile)
+
+
+def top_unseen(limit=20, profile=None):
+    """Top ranked bounties first seen since the previous run."""
+    conn = _store(profile)
+    return bounty_store.top_unseen(conn, limit, bounty_store.get_meta(conn, "prev_call", ""))
 
 
-def generate_cache_txt(cache):
+def generate_cache_txt(cache, profile=None):
     """Generate human-readable TXT file from cache."""
-    cached = cache.get("bounties", [])
-    if not cached:
+    text = _cache_txt(cache)
+    if text is None:
         return
+    directory = _profile_dir(profile)
+    _write_atomic(directory / CACHE_TXT_FILE.name if directory else CACHE_TXT_FILE, text)
+
+
+def _cache_txt(cache, limit=None):
+    """The TXT view of a cache (its top `limit` entries), or None if it's empty."""
+    cached = cache.get("bounties", [])[:limit]
+    if not cached:
+        return None
     last_call = datetime.fromisoformat(cache.get("last_call", datetime.now().isoformat()))
     model = cache.get("model", "heuristic")
     
     lines = [
-        f"BOUNTY SCAN RESULTS — {datetime.now().strftime('%b %d %Y %I:%M %p')}",
+        f"BOUNTY SCAN RESULTS — {last_call.strftime('%b %d %Y %I:%M %p')}",
         f"Scored via: {model}",
         f"Total: {len(cached)} bounties",
         "=" * 60,
@@ -240,9 +996,110 @@ def generate_cache_txt(cache):
             lines.append(f"    Link: {link}")
         if bid:
             lines.append(f"    ID: {bid[:8]}")
+        if entry.get("dupes"):
+            lines.append(f"    Reposts: {entry['dupes']}")
         lines.append("")
-    
-    CACHE_TXT_FILE.write_text("\n".join(lines))
+    return "\n".join(lines)
+
+
+# ── Score Store ─────────────────────────────────────
+
+def _bounty_hash(b):
+    """Hash the fields Grok judges, so edited bounties get rescored.
+
+    Spot counts are left out: a change there only shifts the stored score
+    by the competition term (see _shift_stored_scores()).
+    """
+    fields = [
+        b.get("title", ""),
+        b.get("price", 0),
+        b.get("estimatedHours", 0),
+        b.get("category", ""),
+        b.get("skillsNeeded", []),
+        b.get("location", {}).get("isRemoteAllowed", False),
+        b.get("description", "") or "",
+    ]
+    import hashlib
+    return hashlib.sha1(json.dumps(fields, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def score_with_store(bounties, stream=None, concurrency=None, on_score=None, stats=None):
+    """Grok-score only new or changed bounties, reuse stored scores for the rest.
+
+    Of the new or changed ones, only those select_for_grok() picks go to
+    Grok; the rest keep their heuristic scores. on_score(bounty, score) is
+    called for each stored score and each Grok score as it arrives.
+    Returns [(bounty, score), ...] unranked (see rank()), or None if nothing
+    could be Grok-scored. stats is passed to grok_score_bounties().
+    """
+    now = datetime.now()
+    cached, misses = _stored_scores(bounties, "", now)
+    if on_score:
+        for b, s in cached:
+            on_score(b, s)
+    picked, skipped = select_for_grok(misses) if misses else ([], [])
+    _log(f"Score store: {len(cached)} cached, {len(misses)} new/changed"
+         + (f", {len(skipped)} less relevant kept heuristic" if skipped else ""))
+    metrics.incr("score_store_hits", len(cached))
+    metrics.incr("score_store_misses", len(misses))
+    metrics.incr("relevance_skipped", len(skipped))
+    for b in skipped:
+        b["_grok_reason"] = ""
+        b["_score_source"] = "heuristic"
+    kept = [(b, b["_heuristic"]) for b in skipped]
+
+    fresh = grok_score_bounties(picked, stream=stream, concurrency=concurrency, on_score=on_score,
+                                stats=stats) if picked else []
+    if fresh is None:
+        if not cached:
+            return None
+        _log("Grok unavailable — heuristic scoring for new/changed only")
+        metrics.incr("fallback_bounties", len(picked), reason="grok_unavailable")
+        fresh = [(b, b["_heuristic"]) for b in picked]
+        for b, _ in fresh:
+            b["_grok_reason"] = ""
+            b["_score_source"] = "heuristic"
+    else:
+        _put_scores(fresh, "", now)
+
+    return cached + fresh + kept
+
+
+def _stored_scores(bounties, suffix, now):
+    """Split bounties into ([(bounty, stored score), ...], new or changed ones).
+
+    Scores are stored under id + suffix; each profile persona other than
+    the default has its own suffix.
+    """
+    stored = bounty_store.get_scores(_store(), [(b.get("id") or "") + suffix for b in bounties], now.isoformat())
+    cached, misses = [], []
+    for b in bounties:
+        entry = stored.get((b.get("id") or "") + suffix)
+        if entry and entry["hash"] == _bounty_hash(b):
+            b["_grok_reason"] = entry.get("reason") or ""
+            b["_score_source"] = "grok"
+            cached.append((b, entry["score"]))
+        else:
+            misses.append(b)
+    return cached, misses
+
+
+def _put_scores(scored, suffix, now):
+    """Store the Grok scores among scored under id + suffix."""
+    expires = (now + timedelta(hours=SCORE_TTL_HOURS)).isoformat()
+    entries = [
+        {
+            "id": b["id"] + suffix,
+            "hash": _bounty_hash(b),
+            "score": s,
+            "reason": b.get("_grok_reason", ""),
+            "scored_at": now.isoformat(),
+            "expires": expires,
+        }
+        for b, s in scored if b.get("id") and b.get("_score_source") == "grok"
+    ]
+    if entries:
+        bounty_store.put_scores(_store(), entries, SCORE_STORE_MAX, now.isoformat())
 
 
 # ── Grok Scoring ────────────────────────────────────
@@ -250,22 +1107,47 @@ def generate_cache_txt(cache):
 def _log(msg):
     """Print timestamped status to terminal."""
     ts = datetime.now().strftime("%H:%M:%S")
-    print(f"[scanner {ts}] {msg}")
+    # One write per line so messages from pipeline/Grok threads don't interleave
+    sys.stdout.write(f"[scanner {ts}] {msg}\n")
 
 
-def grok_score_bounties(bounties):
-    """Send bounties to Grok for AI scoring. Returns [(bounty, score), ...] sorted."""
-    if not XAI_API_KEY or not bounties:
-        if not XAI_API_KEY:
-            _log("XAI_API_KEY not set — skipping Grok")
-        return None
+_breaker = {}
+
+
+def _grok_breaker():
+    """The circuit breaker in front of every Grok call (state kept in the store's meta table)."""
+    if "grok" not in _breaker:
+        from circuit import CircuitBreaker
+        _breaker["grok"] = CircuitBreaker(
+            GROK_BREAKER_FAILURES, GROK_BREAKER_COOLDOWN_SECS,
+            load=lambda: json.loads(bounty_store.get_meta(_store(), "grok_breaker", "{}")),
+            save=lambda state: bounty_store.set_meta(_store(), "grok_breaker", json.dumps(state)),
+        )
+    return _breaker["grok"]
+
 
-    _log(f"Sending {len(bounties)} bounties to Grok (grok-4-1-fast-reasoning)...")
+GROK_COLUMNS = ("idx", "title", "price", "hours", "category", "skills", "remote", "spots", "desc")
 
-    # Build compact bounty summaries for the prompt
-    summaries = []
-    for i, b in enumerate(bounties):
-        summaries.append({
+
+def _grok_row(b, corpus, keep):
+    """One bounty as a prompt table row, in GROK_COLUMNS order (idx is set per chunk)."""
+    return [
+        0,
+        b.get("title", ""),
+        b.get("price", 0),
+        b.get("estimatedHours", 0),
+        b.get("category", ""),
+        ",".join(b.get("skillsNeeded") or ()),
+        int(bool((b.get("location") or {}).get("isRemoteAllowed"))),
+        b.get("spotsAvailable", 1),
+        prompt_pack.trim_description(b.get("description"), b.get("title"), corpus, keep=keep),
+    ]
+
+
+def _legacy_summaries(bounties):
+    """The encoding before packing (keys on every row, 300-char descriptions), for the savings report."""
+    return [
+        {
             "idx": i,
             "title": b.get("title", ""),
             "price": b.get("price", 0),
@@ -275,57 +1157,533 @@ def grok_score_bounties(bounties):
             "remote": b.get("location", {}).get("isRemoteAllowed", False),
             "spots": b.get("spotsAvailable", 1),
             "desc": (b.get("description", "") or "")[:300],
-        })
+        }
+        for i, b in enumerate(bounties)
+    ]
 
-    prompt = (
-        "You are a bounty evaluator for a freelance platform. Score each bounty 0-100 "
-        "based on: pay rate, feasibility, location requirements (I'm in northern Ohio, USA) skill match (python, web dev, "
-        "AI, automation, marketing, writing, research, vibe coach, photographer, telegram, psychologist, life coach, mcp, design), remote availability, and description quality.\n\n"
+
+def _grok_prompt(table, personas=None):
+    """Scoring prompt for one chunk's bounty table.
+
+    personas is [(label, profile), ...] (default: the default profile).
+    With more than one, the table's "for" column lists whose scores each
+    bounty needs and the reply has one entry per bounty and person.
+    """
+    personas = personas or [("p0", default_profile())]
+    if len(personas) == 1:
+        profile = personas[0][1]
+        task = (
+            "Score each bounty 0-100 based on: pay rate, feasibility, location requirements "
+            f"(I'm in {profile['location']}) skill match ({profile['prompt_skills']}), "
+            "remote availability, and description quality.\n\n"
+        )
+        cols, example = "", '[{"idx": 0, "score": 90, "reason": "Good pay, skill match"}, ...]'
+    else:
+        task = (
+            "Score each bounty 0-100 for each person in its \"for\" column, based on: pay rate, "
+            "feasibility, location requirements and skill match for that person, remote availability, "
+            "and description quality.\n\nPeople:\n"
+            + "".join(f"- {label}: in {p['location']}; skills: {p['prompt_skills']}\n" for label, p in personas)
+            + "\n"
+        )
+        cols = ", for = who to score it for"
+        example = '[{"idx": 0, "for": "p0", "score": 90, "reason": "Good pay, skill match"}, ...]'
+    return (
+        "You are a bounty evaluator for a freelance platform. " + task +
         "IMPORTANT: These should be REAL JOB POSTINGS where someone pays for work to be done. "
         "Score < 10 for 'for hire' self-promotions (people advertising their own skills/services, "
         "résumés, 'hire me' posts). Only score high for actual tasks/gigs with clear deliverables.\n\n"
         "Flag scams (crypto deposits, upfront payments, suspicious links) with score < 20.\n\n"
-        f"Bounties:\n{json.dumps(summaries)}\n\n"
-        "Respond with ONLY a JSON array, no markdown, no explanation:\n"
-        '[{"idx": 0, "score": 90, "reason": "Good pay, skill match"}, ...]'
+        "Each row is one bounty with the fields in \"cols\" (price in $, remote 1 = remote OK, "
+        f"desc trimmed to its key sentences{cols}).\n"
+        f"Bounties:\n{table}\n\n"
+        "Respond with ONLY a JSON array, no markdown, no explanation:\n" + example
     )
 
-    try:
-        r = requests.post(
-            "https://api.x.ai/v1/chat/completions",
-            headers={"Authorization": f"Bearer {XAI_API_KEY}", "Content-Type": "application/json"},
-            json={
-                "model": "grok-4-1-fast-reasoning",
-                "messages": [{"role": "user", "content": prompt}],
-                "temperature": 0.3,
-            },
-        )
-        r.raise_for_status()
-        content = r.json()["choices"][0]["message"]["content"].strip()
-        # Strip markdown fences if present
-        if content.startswith("```"):
-            content = content.split("\n", 1)[1].rsplit("```", 1)[0].strip()
-        scores = json.loads(content)
 
-        scored = []
-        for item in scores:
-            idx = item.get("idx", -1)
-            if 0 <= idx < len(bounties):
-                bounties[idx]["_grok_reason"] = item.get("reason", "")
-                scored.append((bounties[idx], item.get("score", 50)))
-        scored.sort(key=lambda x: x[1], reverse=True)
-        _log(f"Grok scored {len(scored)} bounties")
+def _pack_prompts(bounties, batch_size, personas=None):
+    """Pack bounties into [(chunk, prompt), ...], each prompt within GROK_PROMPT_TOKENS.
+
+    Logs and records the estimated prompt tokens per bounty before packing
+    (keyed rows in batch_size chunks) and after.
+    """
+    corpus = prompt_pack.Corpus(b.get("description") for b in bounties)
+    keep = [s.lower() for s in SCAM_SIGNALS + FOR_HIRE_SIGNALS]
+    rows = [_grok_row(b, corpus, keep) for b in bounties]
+    columns = GROK_COLUMNS
+    if personas and len(personas) > 1:
+        columns += ("for",)
+        for row, b in zip(rows, bounties):
+            row.append(",".join(b["_views"]))
+    overhead = prompt_pack.estimate_tokens(_grok_prompt(prompt_pack.encode_table(columns, []), personas))
+    packed = []
+    for batch in prompt_pack.pack(rows, GROK_PROMPT_TOKENS, overhead, batch_size):
+        table = prompt_pack.encode_table(columns, [[n] + rows[i][1:] for n, i in enumerate(batch)])
+        packed.append(([bounties[i] for i in batch], _grok_prompt(table, personas)))
+
+    before = sum(
+        prompt_pack.estimate_tokens(
+            _grok_prompt(json.dumps(_legacy_summaries(bounties[i:i + batch_size])), personas))
+        for i in range(0, len(bounties), batch_size)
+    ) / len(bounties)
+    after = sum(prompt_pack.estimate_tokens(prompt) for _, prompt in packed) / len(bounties)
+    metrics.gauge("prompt_tokens_per_bounty", round(before, 1), encoding="keyed")
+    metrics.gauge("prompt_tokens_per_bounty", round(after, 1), encoding="packed")
+    _log(f"Prompt packing: ~{before:.0f} → ~{after:.0f} tokens per bounty (estimated), "
+         f"{len(packed)} calls of at most {GROK_PROMPT_TOKENS} tokens")
+    return packed
+
+
+def _sse_deltas(lines):
+    """Yield content fragments from the lines of an OpenAI-style chat SSE stream."""
+    for line in lines:
+        if not line or not line.startswith("data:"):
+            continue
+        data = line[5:].strip()
+        if data == "[DONE]":
+            return
+        try:
+            event = json.loads(data)
+            if event.get("usage"):
+                _record_usage(event["usage"])
+            delta = event["choices"][0].get("delta", {})
+        except (json.JSONDecodeError, KeyError, IndexError, AttributeError):
+            continue
+        if delta.get("content"):
+            yield delta["content"]
+
+
+def _iter_json_objects(fragments):
+    """Yield each top-level {...} object of a JSON array as soon as it closes.
+
+    Works on arbitrary text fragments, skips markdown fences and anything
+    outside objects, and drops objects that don't parse.
+    """
+    buf, depth, in_str, escape = [], 0, False, False
+    for frag in fragments:
+        for ch in frag:
+            if depth:
+                buf.append(ch)
+            if in_str:
+                if escape:
+                    escape = False
+                elif ch == "\\":
+                    escape = True
+                elif ch == '"':
+                    in_str = False
+            elif ch == '"' and depth:
+                in_str = True
+            elif ch == "{":
+                if not depth:
+                    buf = ["{"]
+                depth += 1
+            elif ch == "}" and depth:
+                depth -= 1
+                if not depth:
+                    try:
+                        yield json.loads("".join(buf))
+                    except json.JSONDecodeError:
+                        pass
+
+
+def _grok_score_chunk(chunk, prompt, stream=False, on_score=None):
+    """One Grok call for one chunk and its prompt. Returns [(bounty, score), ...]; raises on failure.
+
+    With stream=True, scores are applied as the SSE stream delivers them and
+    whatever parsed cleanly is kept if the stream stops early.
+    """
+    payload = {
+        "model": GROK_MODEL,
+        "messages": [{"role": "user", "content": prompt}],
+        "temperature": 0.3,
+    }
+    if stream:
+        payload["stream"] = True
+        payload["stream_options"] = {"include_usage": True}
+    metrics.incr("grok_calls")
+    with metrics.span("grok_call", mode="stream" if stream else "json"):
+        return _grok_call(chunk, payload, stream, on_score)
+
+
+def _record_usage(usage):
+    """Add a reply's token usage to the run metrics."""
+    for kind in ("prompt", "completion"):
+        if usage.get(f"{kind}_tokens"):
+            metrics.incr("grok_tokens", usage[f"{kind}_tokens"], kind=kind)
+
+
+def _json_reply_items(reply):
+    """The scored items in a non-streamed chat reply (markdown fences stripped)."""
+    _record_usage(reply.get("usage") or {})
+    content = reply["choices"][0]["message"]["content"].strip()
+    if content.startswith("```"):
+        content = content.split("\n", 1)[1].rsplit("```", 1)[0].strip()
+    return json.loads(content)
+
+
+def _grok_call(chunk, payload, stream, on_score):
+    """POST one chunk's payload and apply the scores in the reply."""
+    recorder, started = _recorder(), time.time()
+    r = _session("xai").post(
+        XAI_CHAT_URL,
+        headers={"Authorization": f"Bearer {XAI_API_KEY}", "Content-Type": "application/json"},
+        json=payload,
+        timeout=GROK_TIMEOUT,
+        stream=stream,
+    )
+    if r.status_code >= 400:
+        metrics.incr("http_errors", service="xai", status=r.status_code)
+    r.raise_for_status()
+
+    scored = []
+
+    def apply(item):
+        idx = item.get("idx", -1)
+        if isinstance(idx, int) and 0 <= idx < len(chunk):
+            b = _grok_target(chunk[idx], item)
+            if b is None:
+                return
+            b["_grok_reason"] = item.get("reason", "")
+            b["_score_source"] = "grok"
+            scored.append((b, item.get("score", 50)))
+            if on_score:
+                on_score(b, item.get("score", 50))
+
+    def record(body):
+        recorder.event("grok", at=started, request=recorder.put(json.dumps(payload).encode()),
+                       response=recorder.put(body), stream=stream, status=r.status_code,
+                       ms=round((time.time() - started) * 1000, 1), ids=[b.get("id") for b in chunk])
+
+    if not stream:
+        body = r.content
+        if recorder:
+            record(body)
+        for item in _json_reply_items(json.loads(body)):
+            apply(item)
         return scored
 
-    except requests.exceptions.HTTPError as e:
-        _log(f"Grok API HTTP error: {e.response.status_code} — falling back to heuristic")
+    import requests
+    lines = r.iter_lines(decode_unicode=True)
+    received = []
+    if recorder:
+        lines = _tee(lines, received)
+    try:
+        for item in _iter_json_objects(_sse_deltas(lines)):
+            apply(item)
+    except requests.exceptions.RequestException as e:
+        if not scored:
+            raise
+        _log(f"Grok stream cut off ({type(e).__name__}) — keeping {len(scored)} parsed scores")
+    finally:
+        r.close()
+        if recorder:
+            record("\n".join(received).encode())
+    if not scored:
+        raise ValueError("Grok stream contained no scores")
+    return scored
+
+
+def _grok_target(b, item):
+    """The bounty a reply item scores: b, or for a shared bounty the view of the person in "for"."""
+    views = b.get("_views")
+    if views is None:
+        return b
+    if len(views) == 1:
+        return next(iter(views.values()))
+    return views.get(str(item.get("for", "")))
+
+
+def _grok_chunk_with_retry(n, total, chunk, prompt, stream=False, on_score=None, calls=None):
+    """Score one chunk, retrying with backoff. Returns scored list or None.
+
+    Every attempt's outcome goes to the circuit breaker; once it opens,
+    the chunk gives up without calling Grok again. Each attempt's duration
+    in seconds is appended to the list calls, if given.
+    """
+    import requests
+    breaker = _grok_breaker()
+    for attempt in range(1, GROK_RETRIES + 2):
+        if not breaker.allow():
+            _log(f"Chunk {n}/{total} skipped — Grok circuit open")
+            return None
+        start = time.monotonic()
+        try:
+            try:
+                scored = _grok_score_chunk(chunk, prompt, stream=stream, on_score=on_score)
+            finally:
+                if calls is not None:
+                    calls.append(time.monotonic() - start)
+            breaker.record(True)
+            wanted = sum(len(b.get("_views") or (b,)) for b in chunk)
+            _log(f"Chunk {n}/{total}: {len(scored)}/{wanted} scored in "
+                 f"{time.monotonic() - start:.1f}s (attempt {attempt})")
+            return scored
+        except requests.exceptions.HTTPError as e:
+            err = f"HTTP {e.response.status_code}"
+        except json.JSONDecodeError as e:
+            err = f"invalid JSON: {e}"
+        except Exception as e:
+            err = f"{type(e).__name__}: {e}"
+        metrics.incr("grok_failed_calls")
+        _log(f"Chunk {n}/{total} failed after {time.monotonic() - start:.1f}s "
+             f"(attempt {attempt}): {err}")
+        if breaker.record(False):
+            metrics.incr("grok_breaker_opened")
+            _log(f"Grok circuit open — {GROK_BREAKER_FAILURES}+ failed calls in a row, "
+                 f"skipping Grok for {GROK_BREAKER_COOLDOWN_SECS:.0f}s")
+        if attempt <= GROK_RETRIES:
+            time.sleep(2 ** (attempt - 1))
+    return None
+
+
+def grok_score_bounties(bounties, batch_size=None, concurrency=None, stream=None, on_score=None,
+                        personas=None, stats=None):
+    """Send bounties to Grok for AI scoring. Returns [(bounty, score), ...] unranked.
+
+    Bounties go out in chunks of up to batch_size whose prompts fit in
+    GROK_PROMPT_TOKENS, at most `concurrency` at a time.
+    Chunks that still fail after retries get heuristic scores, as do bounties
+    a chunk's reply left out; returns None only if every chunk failed.
+    stream=True (default: GROK_STREAM) reads replies as SSE and calls
+    on_score(bounty, score) as each score arrives.
+    To score for several people at once, pass personas [(label, profile), ...]
+    and give each bounty "_views" {label: copy}; the scores land on the copies.
+    stats (a pipeline stage stats dict) gets the bounties sent, the scores
+    Grok returned, the Grok calls made (retries included) and their summed
+    duration.
+    """
+    load_config()
+    if not XAI_API_KEY or not bounties:
+        if not XAI_API_KEY:
+            _log("XAI_API_KEY not set — skipping Grok")
         return None
-    except json.JSONDecodeError as e:
-        _log(f"Grok returned invalid JSON: {e} — falling back to heuristic")
+    retry_at = _grok_breaker().retry_at()
+    if retry_at:
+        metrics.incr("grok_breaker_skips")
+        _log(f"Grok circuit open after repeated failures — skipping Grok until "
+             f"{datetime.fromtimestamp(retry_at).strftime('%H:%M:%S')}")
         return None
-    except Exception as e:
-        _log(f"Grok scoring failed: {type(e).__name__}: {e} — falling back to heuristic")
+    from concurrent.futures import ThreadPoolExecutor
+
+    packed = _pack_prompts(bounties, batch_size or GROK_BATCH_SIZE, personas)
+    chunks = [chunk for chunk, _ in packed]
+    workers = max(1, min(concurrency or GROK_CONCURRENCY, len(chunks)))
+    _log(f"Sending {len(bounties)} bounties to Grok ({GROK_MODEL}) "
+         f"in {len(chunks)} chunks, {workers} at a time...")
+
+    stream = GROK_STREAM if stream is None else stream
+    start, calls = time.monotonic(), []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_grok_chunk_with_retry, n, len(chunks), chunk, prompt, stream, on_score, calls)
+            for n, (chunk, prompt) in enumerate(packed, 1)
+        ]
+        results = [f.result() for f in futures]
+    if stats is not None:
+        stats["items_in"] += len(bounties)
+        stats["items_out"] += sum(len(result) for result in results if result)
+        stats["batches"] += len(calls)
+        stats["busy_s"] += sum(calls)
+
+    scored, missing, failed = [], [], 0
+    for chunk, result in zip(chunks, results):
+        if result is None:
+            failed += 1
+            result = []
+        scored.extend(result)
+        done = {id(b) for b, _ in result}
+        targets = [v for b in chunk for v in (b["_views"].values() if "_views" in b else (b,))]
+        missing.extend(b for b in targets if id(b) not in done)
+    for b in missing:
+        b["_grok_reason"] = ""
+        b["_score_source"] = "heuristic"
+    unscored = [b for b in missing if "_heuristic" not in b]
+    for b, s in zip(unscored, score_bounties(unscored)):
+        b["_heuristic"] = s
+    scored.extend((b, b["_heuristic"]) for b in missing)
+
+    if failed == len(chunks):
+        _log("All Grok chunks failed — falling back to heuristic")
         return None
+    metrics.incr("fallback_bounties", len(missing), reason="grok_chunk")
+    graded = sum(1 for b, _ in scored if b["_score_source"] == "grok")
+    _log(f"Grok scored {graded}/{len(scored)} bounties in {time.monotonic() - start:.1f}s"
+         + (f" ({failed} chunks failed)" if failed else ""))
+    return scored
+
+
+# ── Pipeline ─────────────────────────────────────────────
+
+def _pipeline_batches(batch_size):
+    """Re-cut fetched pages into scoring-sized batches, recording each page as seen."""
+    pending = []
+    for page in fetch_bounty_pages():
+        bounty_store.record_seen(_store(), page, datetime.now().isoformat())
+        pending.extend(page)
+        while len(pending) >= batch_size:
+            yield pending[:batch_size]
+            pending = pending[batch_size:]
+    if pending:
+        yield pending
+
+
+def score_pipeline(hours=None, stream=None, progress=None):
+    """Fetch → filter → dedupe → heuristic → relevance as overlapping stages, then Grok.
+
+    Pages are filtered and ranked while later pages are still downloading.
+    Only one posting per near-duplicate cluster is scored; its reposts get
+    the same score. Once the whole board is in, the GROK_TOP_K most relevant
+    new or changed bounties go to Grok (GROK_CONCURRENCY calls at a time), so
+    Grok's share of the run doesn't grow with the board. Everything else, and
+    anything Grok can't score, keeps its heuristic score. Notifying isn't
+    a stage: a digest needs the final ranking, so it's sent after the run.
+    stats["grok"] counts the bounties sent to Grok, the scores it returned
+    this run (stored scores aren't counted), the calls made (as "batches",
+    retries included) and their summed time.
+    progress (a dict) is filled in as the run goes, for a caller that
+    can't wait: "candidates" (grows as pages come in), "fetched" once the
+    board is in, "scores" {id(bounty): score} for stored and Grok scores,
+    and "ranking", a new_ranking() of heuristic scores as pages come in,
+    updated in place as the stored and Grok scores arrive.
+    Returns ([(bounty, score), ...] unranked, stage stats).
+    """
+    candidates, reps = [], {}
+    on_batch, on_score = candidates.extend, None
+    if progress is not None:
+        progress["candidates"] = candidates
+        top = progress["ranking"] = new_ranking()
+
+        def on_batch(batch):
+            candidates.extend(batch)
+            for b in batch:
+                rank_push(top, b, b["_heuristic"])
+
+        def on_score(b, s):
+            progress["scores"][id(b)] = s
+            rank_push(top, b, s)
+
+    def filter_stage(batch):
+        jobs = filter_jobs_only(batch)
+        return filter_recent(jobs, hours=hours) if hours else jobs
+
+    def dedupe_stage(batch):
+        return collapse_duplicates(batch, reps)
+
+    def heuristic_stage(batch):
+        for b, s in zip(batch, score_bounties(batch)):
+            b["_heuristic"] = s
+        return batch
+
+    import pipeline
+    stats = pipeline.run(
+        _pipeline_batches(GROK_BATCH_SIZE),
+        [("filter", filter_stage, 1), ("dedupe", dedupe_stage, 1),
+         ("heuristic", heuristic_stage, 1), ("relevance", rank_relevance, 1)],
+        on_batch,
+        queue_size=PIPELINE_QUEUE_SIZE,
+    )
+    if progress is not None:
+        progress["fetched"] = True
+
+    # Grok's counters: bounties sent, calls made (retries included) and time spent in them
+    grok_stats = stats["grok"] = {"batches": 0, "items_in": 0, "items_out": 0, "busy_s": 0.0}
+    scored = score_with_store(candidates, stream=stream, on_score=on_score, stats=grok_stats) if candidates else []
+    if scored is None:
+        metrics.incr("fallback_bounties", len(candidates), reason="grok_unavailable")
+        for b in candidates:
+            b["_grok_reason"] = ""
+            b["_score_source"] = "heuristic"
+        scored = [(b, b["_heuristic"]) for b in candidates]
+    grok_stats["busy_s"] = round(grok_stats["busy_s"], 3)
+    grok_stats["per_s"] = round(grok_stats["items_in"] / grok_stats["busy_s"], 1) if grok_stats["busy_s"] else None
+
+    for name, s in stats.items():
+        if isinstance(s, dict):
+            metrics.gauge("pipeline_busy_seconds", s["busy_s"], stage=name)
+            metrics.gauge("pipeline_items", s["items_in"] or s["items_out"], stage=name)
+    _log("Pipeline: " + " | ".join(
+        f"{name} {s['items_in']}→{s['items_out']} in {s['busy_s']}s"
+        for name, s in stats.items() if isinstance(s, dict)
+    ) + f" | total {stats['total_s']}s")
+    propagate_scores(scored)
+    return scored, stats
+
+
+def _fetch_candidates(hours):
+    """Fetch the board once. Returns (all bounties, recent job postings with reposts folded)."""
+    bounties = fetch_bounties()
+    recent = filter_recent(filter_jobs_only(bounties), hours=hours)
+    return bounties, collapse_duplicates(recent, {})
+
+
+def score_profiles(profile_list, candidates, stream=None):
+    """Score candidates for every profile, sharing Grok calls between them.
+
+    Profiles with the same scoring fields (profiles.persona()) are scored
+    once, together. Each persona gets its own batched heuristic and
+    relevance pass over copies of the candidates, its own stored scores
+    and its own GROK_TOP_K pick. A bounty picked by several personas goes
+    to Grok once, tagged with all of them, so Grok's input grows with the
+    unique bounties plus the personas rather than bounties × profiles.
+    Returns {profile name: [(bounty, score), ...] unranked}.
+    """
+    import profiles
+    now = datetime.now()
+    default = profiles.persona(default_profile())
+    personas = {}
+    for profile in profile_list:
+        personas.setdefault(profiles.persona(profile), profile)
+
+    runs, shared = {}, {}
+    for n, (pid, profile) in enumerate(personas.items()):
+        label = f"p{n}"
+        views = [dict(b, _dupes=[dict(m) for m in b.get("_dupes", ())]) for b in candidates]
+        for b, s in zip(views, score_bounties(views, skills=profile["skills"])):
+            b["_heuristic"] = s
+        rank_relevance(views, profile)
+        suffix = "" if pid == default else "#" + pid
+        cached, misses = _stored_scores(views, suffix, now)
+        picked, skipped = select_for_grok(misses) if misses else ([], [])
+        metrics.incr("score_store_hits", len(cached))
+        metrics.incr("score_store_misses", len(misses))
+        metrics.incr("relevance_skipped", len(skipped))
+        for b in skipped:
+            b["_grok_reason"] = ""
+            b["_score_source"] = "heuristic"
+        position = {id(v): i for i, v in enumerate(views)}
+        for b in picked:
+            i = position[id(b)]
+            if i not in shared:
+                shared[i] = {k: v for k, v in candidates[i].items() if not k.startswith("_")}
+                shared[i]["_views"] = {}
+            shared[i]["_views"][label] = b
+        runs[pid] = (label, suffix, cached, picked, skipped)
+
+    wanted = sum(len(run[3]) for run in runs.values())
+    _log(f"Profiles: {len(profile_list)} profiles, {len(personas)} distinct — "
+         f"{len(shared)} unique bounties to Grok for {wanted} profile scores")
+    fresh = grok_score_bounties(
+        list(shared.values()), stream=stream, personas=[(run[0], personas[pid]) for pid, run in runs.items()]
+    ) if shared else []
+    if fresh is None:
+        _log("Grok unavailable — heuristic scoring for new/changed only")
+        metrics.incr("fallback_bounties", wanted, reason="grok_unavailable")
+        fresh = []
+    got = {id(b): s for b, s in fresh}
+
+    results = {}
+    for pid, (label, suffix, cached, picked, skipped) in runs.items():
+        graded = []
+        for b in picked:
+            if id(b) not in got:
+                b["_grok_reason"] = ""
+                b["_score_source"] = "heuristic"
+            graded.append((b, got.get(id(b), b["_heuristic"])))
+        _put_scores(graded, suffix, now)
+        scored = cached + graded + [(b, b["_heuristic"]) for b in skipped]
+        propagate_scores(scored, suffix)
+        results[pid] = scored
+    return {profile["name"]: results[profiles.persona(profile)] for profile in profile_list}
 
 
 # ── Formatting ───────────────────────────────────────────
@@ -355,9 +1713,11 @@ def format_bounty(b, score=None):
     lines.append(f"  ${price} / {hours}hrs{hourly_str} | {flag_str}")
     if agent:
         lines.append(f"  Posted by: {agent}")
-    lines.append(f"  Spots: {spots} | ID: `{bid[:8]}`")
+    dupes = len(b.get("_dupes") or ())
+    lines.append(f"  Spots: {spots} | ID: `{bid[:8]}`" + (f" | +{dupes} reposts" if dupes else ""))
     if score is not None:
-        lines.append(f"  Score: {score}/100{' — ' + reason if reason else ''}")
+        source = " (heuristic)" if b.get("_score_source") == "heuristic" else ""
+        lines.append(f"  Score: {score}/100{source}{' — ' + reason if reason else ''}")
     return "\n".join(lines)
 
 
@@ -376,8 +1736,12 @@ def format_digest(scored_bounties, limit=20):
 
 # ── Scanner (cron entry point) ───────────────────────────
 
-def _format_cache(cache, limit=20):
-    """Format cached bounties for display."""
+def _format_cache(cache, limit=20, age=True):
+    """Format cached bounties for display.
+
+    age=False stamps the scoring time instead of "N min ago", so the text
+    stays valid while it's memoized (the query server's digests).
+    """
     cached = cache.get("bounties", [])
     if not cached:
         return None
@@ -385,7 +1749,9 @@ def _format_cache(cache, limit=20):
     age_mins = int((datetime.now() - last_call).total_seconds() / 60)
     model = cache.get("model", "heuristic")
 
-    if age_mins < 60:
+    if not age:
+        age_str = last_call.strftime("%b %d %I:%M %p")
+    elif age_mins < 60:
         age_str = f"{age_mins}min ago"
     else:
         age_str = f"{age_mins // 60}hr {age_mins % 60}min ago"
@@ -397,138 +1763,380 @@ def _format_cache(cache, limit=20):
         title = entry.get("title", "Untitled")
         link = f"{RENTAHUMAN_WEB}/bounties/{bid}" if bid else ""
         lines.append(f"[{title}]({link})" if link else f"**{title}**")
-        lines.append(f"  Score: {entry.get('score', '?')}/100{' — ' + reason if reason else ''}")
+        source = " (heuristic)" if entry.get("source") == "heuristic" else ""
+        lines.append(f"  Score: {entry.get('score', '?')}/100{source}{' — ' + reason if reason else ''}")
         if bid:
-            lines.append(f"  ID: `{bid[:8]}`")
+            dupes = entry.get("dupes") or 0
+            lines.append(f"  ID: `{bid[:8]}`" + (f" | +{dupes} reposts" if dupes else ""))
         lines.append("")
     return "\n".join(lines)
 
 
-def _background_rescore(hours, limit):
-    """Background thread: fetch + Grok score + save to cache."""
+_rescore = {"thread": None}
+
+
+def _rescore_lock():
+    """Cross-process lock that lets one process at a time rescore the board."""
+    from singleflight import LeaseLock
+    return LeaseLock(RESCORE_LOCK_FILE, RESCORE_LEASE_SECS, RESCORE_HEARTBEAT_SECS)
+
+
+def _background_rescore(hours, limit, lock, stream=None, progress=None):
+    """Background thread: fetch + Grok score + save to cache, then release the lock.
+
+    progress is passed to score_pipeline(); the saved ranking ends up in its "scored".
+    """
     try:
         _log("Background rescore started...")
-        bounties = fetch_bounties()
-        bounties = filter_jobs_only(bounties)
-        recent = filter_recent(bounties, hours=hours)
+        scored, stats = score_pipeline(hours=hours, stream=stream, progress=progress)
 
-        if not recent:
-            _log(f"No candidates to score ({len(bounties)} total)")
+        if not scored:
+            _log(f"No candidates to score ({stats['source']['items_out']} total)")
             return
 
-        scored = grok_score_bounties(recent)
-        if scored is None:
-            _log("Grok failed in background — using heuristic")
-            scored = [(b, score_bounty(b)) for b in recent]
-            scored.sort(key=lambda x: x[1], reverse=True)
-            # Mark as heuristic in cache
-            for b, _ in scored:
-                b["_grok_reason"] = ""
-
-        scored = [(b, s) for b, s in scored if s >= 20]
+        scored = rank(scored)
+        if progress is not None:
+            progress["scored"] = scored
         save_cache(scored)
 
         _log(f"Background rescore done — {len(scored)} bounties cached")
     except Exception as e:
         _log(f"Background rescore error: {e}")
+    finally:
+        if lock.lost:
+            _log("Rescore lock lease expired and was taken over by another process")
+        lock.release()
+
+
+def _start_rescore(hours, limit, lock, stream=None, progress=None):
+    thread = threading.Thread(
+        target=_background_rescore, args=(hours, limit, lock, stream, progress), name="rescore", daemon=True
+    )
+    _rescore["thread"] = thread
+    thread.start()
 
 
-def scan(hours=1000, limit=20, force=False):
+def _await_rescore(lock, wait, timeout=None):
+    """Report another process's rescore and, with wait, block until it lands.
+
+    Waits up to timeout seconds (default RESCORE_WAIT_SECS). Returns the
+    note to append to cached results ("" if the rescore landed).
+    """
+    holder = lock.holder() or {}
+    _log(f"Rescore already running (pid {holder.get('pid', '?')} on {holder.get('host', '?')})")
+    metrics.incr("rescore_lock_busy")
+    if wait:
+        timeout = timeout or RESCORE_WAIT_SECS
+        _log("Waiting for its result...")
+        if lock.wait(timeout):
+            return ""
+        _log(f"Still running after {timeout:g}s — returning the cache")
+    return "\nRescore already running in another process. Refresh in a few minutes."
+
+
+def _rescore_in_progress(lock, cache, limit, wait, timeout=None):
+    """Result for a scan that found another process already rescoring."""
+    note = _await_rescore(lock, wait, timeout)
+    return _busy_result(load_cache()[0] if not note else cache, limit, note)
+
+
+def _busy_result(cache, limit, note):
+    if not cache:
+        return "No scan results yet — another process is scoring the board. Try again shortly or use --wait."
+    return (_format_cache(cache, limit=limit) or "") + note
+
+
+def scan(hours=1000, limit=20, force=False, wait=False, deadline=None):
     """Run a scan. Always returns cache first, refreshes in background when stale.
 
     Set force=True to block and re-score with Grok now (waits for result).
+    A fresh cache hit returns before .env or any HTTP module is loaded.
+    Only one process rescores at a time; the others return the cache, or
+    with wait=True block until that rescore lands and return its result.
+    With a deadline in seconds (default SCAN_DEADLINE_SECS), a stale or
+    forced scan rescores but answers within it (see _scan_by_deadline()),
+    and waits at most that long on another process's rescore.
     """
+    cache, is_fresh = load_cache()
+    if cache and is_fresh and not force:
+        _log("Loaded from cache (fresh)")
+        return _format_cache(cache, limit=limit)
+
+    load_config()
     if not RENTAHUMAN_API_KEY:
         return "RENTAHUMAN_API_KEY not set."
+    deadline = SCAN_DEADLINE_SECS if deadline is None else deadline
 
-    cache, is_fresh = load_cache()
+    lock = _rescore_lock()
+    if not lock.acquire():
+        return _rescore_in_progress(lock, cache, limit, wait or bool(deadline), deadline or None)
+
+    if deadline:
+        # A forced scan ranks the whole board, as below; a stale one only the last `hours`
+        return _scan_by_deadline(None if force else hours, limit, lock, cache, deadline)
 
     # Force mode: block, rescore ALL bounties now
     if force:
         _log("Force mode — blocking while Grok scores...")
-        bounties = fetch_bounties()
-        _log(f"Fetched {len(bounties)} total, filtering for-hire ads...")
-        bounties = filter_jobs_only(bounties)
-        _log(f"{len(bounties)} real job postings — scoring all")
+        try:
+            scored, stats = score_pipeline(stream=True)
+            _log(f"Fetched {stats['source']['items_out']} total, "
+                 f"{stats['filter']['items_out']} real job postings, "
+                 f"{stats['dedupe']['items_out']} after folding reposts, "
+                 f"{stats['grok']['items_out']} scored by Grok this run")
 
-        if not bounties:
-            return "No bounties found."
+            if not scored:
+                return "No bounties found."
 
-        scored = grok_score_bounties(bounties)
-        if scored is None:
-            _log("Grok unavailable — heuristic scoring")
-            scored = [(b, score_bounty(b)) for b in bounties]
-            scored.sort(key=lambda x: x[1], reverse=True)
-        scored = [(b, s) for b, s in scored if s >= 20]
+            scored = rank(scored)
 
-        save_cache(scored)
+            save_cache(scored)
+        finally:
+            lock.release()
 
         digest = format_digest(scored, limit=limit)
         return digest or "No opportunities scored above threshold."
 
-    # Normal mode: always show cache, background refresh if stale
+    # Normal mode: show the stale cache, refresh in background
     if cache:
         result = _format_cache(cache, limit=limit)
-        if is_fresh:
-            _log("Loaded from cache (fresh)")
-            return result
-        else:
-            _log("Cache is stale — returning cached + refreshing in background")
-            thread = threading.Thread(
-                target=_background_rescore, args=(hours, limit), daemon=True
-            )
-            thread.start()
-            return (result or "") + "\nPulling new data in background. Refresh in a few minutes."
+        _log("Cache is stale — returning cached + refreshing in background")
+        _start_rescore(hours, limit, lock)
+        return (result or "") + "\nPulling new data in background. Refresh in a few minutes."
 
     # No cache at all: heuristic score immediately, Grok in background
     _log("No cache found — heuristic scoring now, Grok in background")
-    bounties = fetch_bounties()
-    bounties = filter_jobs_only(bounties)
-    recent = filter_recent(bounties, hours=hours)
+    try:
+        bounties = fetch_bounties()
+        bounties = filter_jobs_only(bounties)
+        recent = filter_recent(bounties, hours=hours)
 
-    if not recent:
-        return f"No bounties in the last {hours}hrs ({len(bounties)} total checked)."
+        if not recent:
+            lock.release()
+            return f"No bounties in the last {hours}hrs ({len(bounties)} total checked)."
+        recent = collapse_duplicates(recent, {})
 
-    # Quick heuristic scores for immediate display
-    scored = [(b, score_bounty(b)) for b in recent]
-    scored.sort(key=lambda x: x[1], reverse=True)
-    scored = [(b, s) for b, s in scored if s >= 20]
-    save_cache(scored)
+        # Quick heuristic scores for immediate display
+        scored = rank(list(zip(recent, score_bounties(recent))))
+        save_cache(scored)
+    except BaseException:
+        lock.release()
+        raise
 
     # Kick off Grok in background for next time
-    thread = threading.Thread(
-        target=_background_rescore, args=(hours, limit), daemon=True
-    )
-    thread.start()
+    _start_rescore(hours, limit, lock)
 
     digest = format_digest(scored, limit=limit)
     suffix = "\nGrok scoring in background. Refresh in a few minutes for AI-ranked results."
     return (digest or "No opportunities scored above threshold.") + suffix
 
 
-def send_telegram(text):
-    """Send via Telegram bot API (for cron use)."""
+def _scan_by_deadline(hours, limit, lock, cache, deadline):
+    """Rescore the board (bounties from the last `hours`, or all if None) in the background,
+    but answer within deadline seconds.
+
+    Returns the rescore's digest if it finishes in time. Otherwise returns
+    the best ranking so far: stored scores and Grok scores that have
+    arrived, heuristic scores (marked as such) for the rest. If the board
+    isn't fetched yet, returns the cache instead, even a stale one. The
+    rescore keeps running and saves the full ranking when it completes.
+    """
+    progress = {"candidates": None, "fetched": False, "scores": {}, "ranking": None, "scored": None}
+    _log(f"Deadline {deadline:g}s — Grok scores that miss it are merged into the cache later")
+    _start_rescore(hours, limit, lock, stream=True, progress=progress)
+    thread = _rescore["thread"]
+    thread.join(deadline)
+    if not thread.is_alive():
+        if progress["scored"] is None:
+            return _format_cache(cache, limit=limit) if cache else "No bounties found."
+        return format_digest(progress["scored"], limit=limit) or "No opportunities scored above threshold."
+
+    metrics.incr("scan_deadline_missed")
+    later = "\nGrok is still scoring; the full ranking lands in the cache when it finishes."
+    if not progress["fetched"] and cache:
+        _log("Deadline hit before the board was in — returning the cache")
+        return (_format_cache(cache, limit=limit) or "") + later
+    scored = _ranking_so_far(progress)
+    graded, total = len(progress["scores"]), len(progress["candidates"] or ())
+    _log(f"Deadline hit — {graded}/{total} scored by Grok so far, heuristic for the rest")
+    metrics.gauge("scan_deadline_grok_share", round(graded / total, 3) if total else 0)
+    return (format_digest(scored, limit=limit) or "No opportunities scored above threshold.") + later
+
+
+def _ranking_so_far(progress):
+    """The live ranking of the candidates fetched so far: scores that have arrived, else heuristic."""
+    scores = dict(progress["scores"])
+    return [
+        (b, s) if id(b) in scores else (dict(b, _score_source="heuristic", _grok_reason=""), s)
+        for b, s in (progress["ranking"].ranked() if progress["ranking"] else ())
+    ]
+
+
+def scan_profiles(profile_list, hours=1000, force=False, wait=False):
+    """Scan once on behalf of several profiles. Returns [(profile, text), ...].
+
+    While every profile's cache is fresh (and not force) the caches are
+    returned. Otherwise the board is fetched and deduplicated once, scored
+    for all profiles by score_profiles(), and each profile's ranking (at
+    or above its min_score) saved to its own cache. The rescore lock works
+    as in scan().
+    """
+    caches = [load_cache(p) for p in profile_list]
+    if not force and all(cache and is_fresh for cache, is_fresh in caches):
+        _log(f"Loaded {len(profile_list)} profiles from cache (fresh)")
+        return [(p, _format_cache(cache, limit=p["limit"])) for p, (cache, _) in zip(profile_list, caches)]
+
+    load_config()
+    if not RENTAHUMAN_API_KEY:
+        return [(p, "RENTAHUMAN_API_KEY not set.") for p in profile_list]
+
+    lock = _rescore_lock()
+    if not lock.acquire():
+        note = _await_rescore(lock, wait)
+        if not note:
+            caches = [load_cache(p) for p in profile_list]
+        return [(p, _busy_result(cache, p["limit"], note)) for p, (cache, _) in zip(profile_list, caches)]
+
+    _log(f"Scanning for {len(profile_list)} profiles...")
+    try:
+        bounties, candidates = _fetch_candidates(hours)
+        live_ids = {b.get("id") for b in bounties}
+        prune_relevance(live_ids)
+        prune_duplicates(live_ids)
+        if not candidates:
+            return [(p, "No bounties found.") for p in profile_list]
+        digests = _save_profiles(profile_list, score_profiles(profile_list, candidates, stream=True))
+    finally:
+        lock.release()
+    return [(p, digest or "No opportunities scored above threshold.") for p, digest in zip(profile_list, digests)]
+
+
+def _save_profiles(profile_list, results):
+    """Save each profile's ranking (at or above its min_score) to its cache. Returns their digests."""
+    digests = []
+    for p in profile_list:
+        scored = rank(results[p["name"]], p["min_score"])
+        save_cache(scored, p)
+        digests.append(format_digest(scored, limit=p["limit"]))
+    return digests
+
+
+def _telegram_target():
+    """(chat_id, bot_token) from the Telegram profile and env, either may be empty."""
+    load_config()
     from telegram_helpers import _load_profile
     profile = _load_profile()
     chat_id = profile.get("telegram", {}).get("chat_id")
     bot_token = os.getenv("KATANA_HTTP_TELEGRAM_BOT_TOKEN", "")
+    return chat_id, bot_token
+
+
+def _count_telegram_error(error):
+    """Count a failed send; send_part() errors read "HTTP <status>: ..." or "<Exception>: ..."."""
+    metrics.incr("telegram_failed")
+    if error.startswith("HTTP "):
+        metrics.incr("http_errors", service="telegram", status=error[5:].split(":", 1)[0])
+
+
+def _queue_failed(chat_id, failed):
+    """Put parts that failed to send in the persistent outbox."""
+    now = datetime.now()
+    for part, error, retry_after in failed:
+        _count_telegram_error(error)
+        next_try = now + timedelta(seconds=retry_after or OUTBOX_BASE_DELAY_SECS)
+        bounty_store.outbox_add(_store(), chat_id, part, error, next_try.isoformat(), now.isoformat())
+        _log(f"Telegram send failed ({error}) — queued for retry")
+
+
+def flush_outbox(bot_token):
+    """Retry queued Telegram messages that are due. Returns how many were sent."""
+    conn = _store()
+    now = datetime.now()
+    sent = 0
+    for msg in bounty_store.outbox_due(conn, now.isoformat()):
+        with metrics.span("telegram_send", kind="retry"):
+            ok, error, retry_after = telegram_delivery.send_part(
+                _session("telegram"), bot_token, msg["chat_id"], msg["text"], api_base=TELEGRAM_API_BASE
+            )
+        if ok:
+            bounty_store.outbox_remove(conn, msg["id"])
+            metrics.incr("telegram_sent", kind="retry")
+            sent += 1
+            continue
+        _count_telegram_error(error)
+        if msg["attempts"] + 1 >= OUTBOX_MAX_ATTEMPTS:
+            bounty_store.outbox_remove(conn, msg["id"])
+            _log(f"Giving up on queued Telegram message after {msg['attempts'] + 1} attempts: {error}")
+        else:
+            delay = retry_after or min(3600, OUTBOX_BASE_DELAY_SECS * 2 ** msg["attempts"])
+            bounty_store.outbox_retry(conn, msg["id"], error, (now + timedelta(seconds=delay)).isoformat())
+    if sent:
+        _log(f"Delivered {sent} queued Telegram messages")
+    return sent
+
+
+def flush_pending():
+    """Retry due queued Telegram messages, whether or not this run sends anything.
+
+    Called at the start of every run and --watch cycle. Costs one store
+    query when nothing is due (.env isn't loaded unless something is).
+    """
+    if not bounty_store.outbox_due(_store(), datetime.now().isoformat()):
+        return 0
+    load_config()
+    bot_token = os.getenv("KATANA_HTTP_TELEGRAM_BOT_TOKEN", "")
+    return flush_outbox(bot_token) if bot_token else 0
+
+
+def send_telegram(text, chat_id=None):
+    """Send via Telegram bot API (for cron use).
+
+    Flushes the retry queue first, splits text under Telegram's 4096-char
+    limit, and queues any part that fails instead of dropping it.
+    chat_id overrides the configured chat (e.g. a profile's telegram_chat_id).
+    """
+    default_chat, bot_token = _telegram_target()
+    chat_id = chat_id or default_chat
     if not chat_id or not bot_token:
         print(text)
         return
-    requests.post(
-        f"https://api.telegram.org/bot{bot_token}/sendMessage",
-        json={
-            "chat_id": chat_id,
-            "text": text,
-            "parse_mode": "Markdown",
-            "disable_web_page_preview": True,
-        },
-        timeout=10,
-    )
+    flush_outbox(bot_token)
+    with metrics.span("telegram_send", kind="digest"):
+        failed = telegram_delivery.deliver(
+            _session("telegram"), bot_token, chat_id, text, api_base=TELEGRAM_API_BASE
+        )
+    if metrics.enabled():
+        metrics.incr("telegram_sent", len(telegram_delivery.split_message(text)) - len(failed), kind="digest")
+    _queue_failed(chat_id, failed)
+
+
+def notify_changes(limit=20, profile=None):
+    """Send only bounties that entered the top `limit` since the last delivered digest.
+
+    With a profile, its cache is compared and the result goes to its chat.
+    Returns True if anything was sent.
+    """
+    cache, _ = load_cache(profile)
+    if not cache:
+        return False
+    chat_id = (profile or {}).get("telegram_chat_id") or _telegram_target()[0]
+    conn = _store(profile)
+    key = f"last_digest:{chat_id}"
+    previous = set(json.loads(bounty_store.get_meta(conn, key, "[]")))
+    top = cache["bounties"][:limit]
+    new = [e for e in top if e["id"] not in previous]
+    if not new:
+        _log(f"Top {limit} unchanged since last digest — nothing to send")
+        return False
+    text = f"**{len(new)} new in the top {limit}**\n\n" + _format_cache(dict(cache, bounties=new), limit=limit)
+    send_telegram(text, chat_id)
+    bounty_store.set_meta(conn, key, json.dumps([e["id"] for e in top]))
+    return True
 
 
 def list_jobs():
     """List all open job postings (filtered, no scoring)."""
+    load_config()
     _log("Fetching job postings...")
     bounties = fetch_bounties()
     total = len(bounties)
@@ -559,52 +2167,525 @@ def list_humans():
     return rent_list_humans()
 
 
-def main():
-    """CLI entry point.
+# ── Metrics ──────────────────────────────────────────────
+
+def write_metrics(metrics_dir=None, **extra):
+    """Export recorded metrics as a JSON run report and a Prometheus textfile."""
+    directory = Path(metrics_dir or METRICS_DIR)
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        report = dict(metrics.report(), pid=os.getpid(), **extra)
+        _write_atomic(directory / METRICS_REPORT_FILE, json.dumps(report, indent=2))
+        _write_atomic(directory / METRICS_PROM_FILE, metrics.prometheus_text())
+    except OSError as e:
+        _log(f"Metrics write failed: {e}")
+
+
+# ── Watch mode ───────────────────────────────────────────
+
+_stop = threading.Event()
+
+
+def _write_heartbeat(state):
+    """Heartbeat for the supervisor: a stale mtime means the loop is stuck."""
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        _write_atomic(WATCH_HEARTBEAT_FILE, json.dumps(dict(state, pid=os.getpid(), ts=datetime.now().isoformat())))
+    except OSError as e:
+        _log(f"Heartbeat write failed: {e}")
+
+
+def _next_interval(interval, new_count, min_secs, max_secs):
+    """Halve the interval while postings arrive, stretch it 1.5x when quiet, ±10% jitter."""
+    interval = interval / 2 if new_count else interval * 1.5
+    interval = max(min_secs, min(max_secs, interval))
+    import random
+    return interval, interval * random.uniform(0.9, 1.1)
+
+
+def _watch_cycle(hours, limit, seen, profile_list=None):
+    """One fetch → filter → score → save pass. Returns ([digest per profile], new_ids).
+
+    Without profile_list there is one digest, for the default cache.
+    Skipped (all None, empty set) while another process holds the rescore lock.
+    """
+    lock = _rescore_lock()
+    if not lock.acquire():
+        _log("Another process is rescoring — skipping this cycle")
+        metrics.incr("rescore_lock_busy")
+        return [None] * len(profile_list or [None]), set()
+    try:
+        return _watch_rescore(hours, limit, seen, profile_list)
+    finally:
+        lock.release()
+
+
+def _watch_rescore(hours, limit, seen, profile_list=None):
+    bounties, candidates = _fetch_candidates(hours)
+    # A repost of a gig still on the board isn't new
+    new_ids = {b.get("id") for b in candidates} - seen if seen else set()
+    seen.update(m.get("id") for b in candidates for m in [b] + b["_dupes"])
+    live_ids = {b.get("id") for b in bounties}
+    prune_relevance(live_ids)
+    prune_duplicates(live_ids)
+    if not candidates:
+        return [None] * len(profile_list or [None]), new_ids
+
+    if profile_list:
+        digests = _save_profiles(profile_list, score_profiles(profile_list, candidates))
+        _log(f"Cycle: {len(bounties)} fetched, {len(candidates)} candidates, "
+             f"{len(new_ids)} new, {len(profile_list)} profiles ranked")
+        return digests, new_ids
+
+    scored = score_with_store(candidates)
+    if scored is None:
+        metrics.incr("fallback_bounties", len(candidates), reason="grok_unavailable")
+        scored = list(zip(candidates, score_bounties(candidates)))
+        for b, _ in scored:
+            b["_grok_reason"] = ""
+            b["_score_source"] = "heuristic"
+    propagate_scores(scored)
+    scored = rank(scored)
+    save_cache(scored)
+    _log(f"Cycle: {len(bounties)} fetched, {len(candidates)} candidates, "
+         f"{len(new_ids)} new, {len(scored)} ranked")
+    return [format_digest(scored, limit=limit)], new_ids
+
+
+def watch(hours=140, limit=20, min_secs=None, max_secs=None, notify=True, changes_only=False,
+          metrics_dir=None, profile_list=None):
+    """Keep one warm process polling the board until SIGTERM/SIGINT.
+
+    The poll interval halves while new postings keep arriving and stretches
+    when the board is quiet, within [min_secs, max_secs]. The heartbeat file
+    is refreshed every cycle and at least every WATCH_HEARTBEAT_SECS while idle.
+    With metrics enabled, each cycle's metrics are exported to metrics_dir.
+    With profile_list, every cycle scores the board once for all of them and
+    each profile's digest goes to its own chat.
+    """
+    import signal
+
+    load_config()
+    if not RENTAHUMAN_API_KEY:
+        _log("RENTAHUMAN_API_KEY not set.")
+        return
+    min_secs = min_secs or WATCH_MIN_SECS
+    max_secs = max(max_secs or WATCH_MAX_SECS, min_secs)
+
+    def stop(signum, frame):
+        _log(f"Received signal {signum} — stopping after this cycle")
+        _stop.set()
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    interval, seen, cycle = min_secs, set(), 0
+    _log(f"Watch mode — polling every {min_secs:.0f}-{max_secs:.0f}s")
+    while not _stop.is_set():
+        cycle += 1
+        state = {"cycle": cycle, "status": "running", "interval": interval}
+        _write_heartbeat(state)
+        metrics.reset()
+        new_count = 0
+        try:
+            flush_pending()
+            digests, new_ids = _watch_cycle(hours, limit, seen, profile_list)
+            new_count = len(new_ids)
+            for profile, digest in zip(profile_list or [None], digests):
+                if notify and changes_only:
+                    notify_changes(limit=profile["limit"] if profile else limit, profile=profile)
+                elif notify and digest and new_count:
+                    send_telegram(digest, (profile or {}).get("telegram_chat_id"))
+                    _log(f"Sent digest to Telegram ({new_count} new)"
+                         + (f" for {profile['name']}" if profile else ""))
+            state["last_error"] = ""
+        except Exception as e:
+            _log(f"Watch cycle error: {type(e).__name__}: {e}")
+            state["last_error"] = f"{type(e).__name__}: {e}"
+            metrics.incr("watch_cycle_errors")
+        if metrics.enabled():
+            write_metrics(metrics_dir, command="watch", cycle=cycle)
+
+        interval, wait = _next_interval(interval, new_count, min_secs, max_secs)
+        state.update(status="sleeping", interval=interval, new=new_count)
+        _log(f"Next poll in {wait:.0f}s")
+        deadline = time.monotonic() + wait
+        while not _stop.is_set():
+            _write_heartbeat(state)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            _stop.wait(min(remaining, WATCH_HEARTBEAT_SECS))
+
+    _write_heartbeat({"cycle": cycle, "status": "stopped"})
+    _log("Watch mode stopped")
+
+
+# ── Query server ─────────────────────────────────────────
+
+def _ranking_view(profile=None):
+    """A query_server.RankingView over the (profile's) ranking in the store."""
+    import query_server
+    directory = _profile_dir(profile)
+    export = directory / CACHE_FILE.name if directory else CACHE_FILE
+
+    def version():
+        # data_version moves whenever another connection commits to the store
+        data_version = _store(profile).execute("PRAGMA data_version").fetchone()[0]
+        try:
+            return data_version, export.stat().st_mtime_ns
+        except FileNotFoundError:
+            return data_version, 0
+
+    renderers = {
+        "markdown": lambda cache, limit: _format_cache(cache, limit, age=False),
+        "text": lambda cache, limit: _cache_txt(cache, limit),
+    }
+    return query_server.RankingView(lambda: load_cache(profile)[0], version, renderers)
+
+
+def serve(host=None, port=None, profile_list=None):
+    """Answer ranking queries over HTTP until SIGTERM/SIGINT (see query_server.py).
+
+    Serves the default ranking, and each profile's with profile=NAME.
+    Scans, --watch cycles and cron runs in other processes keep the
+    rankings current; this process only reads the store.
+    """
+    import signal
+    import query_server
+
+    load_config()
+    host, port = host or SERVE_HOST, port or SERVE_PORT
+    views = {None: _ranking_view()}
+    views.update((p["name"], _ranking_view(p)) for p in profile_list or [])
+
+    def stop(signum, frame):
+        _log(f"Received signal {signum} — stopping the query server")
+        _stop.set()
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    _log(f"Query server on http://{host}:{port}/bounties ({len(views)} rankings)")
+    try:
+        query_server.serve(views.get, host, port, _stop)
+    except OSError as e:
+        _log(f"Query server can't listen on {host}:{port}: {e}")
+        return
+    _log("Query server stopped")
+
+
+# ── Record and replay ────────────────────────────────────
+
+_capture = {"log": None}
+
+
+def start_recording(directory=None):
+    """Record every board fetch and Grok call from now on to directory (default RECORD_DIR)."""
+    import capture
+    directory = directory or RECORD_DIR
+    if _capture["log"] is None and directory:
+        _capture["log"] = capture.CaptureLog(Path(directory))
+        _log(f"Recording board pages and Grok calls to {_capture['log'].path}")
+    return _capture["log"]
+
+
+def stop_recording():
+    """Close the capture log, if recording."""
+    if _capture["log"] is not None:
+        _capture["log"].close()
+        _capture["log"] = None
+
 
-    Usage:
-        python bounty_hunter.py              Scan + Grok score (cached)
-        python bounty_hunter.py --jobs       List all open job postings
-        python bounty_hunter.py --humans     List available humans for hire
-        python bounty_hunter.py --force      Bypass cache, fresh Grok scoring
-        python bounty_hunter.py --no-telegram  Skip sending to Telegram
+def _recorder():
+    """The open capture log, or None when not recording."""
+    if _capture["log"] is None and RECORD_DIR:
+        return start_recording()
+    return _capture["log"]
+
+
+def _tee(items, into):
+    """Yield items, appending each to the list into on the way."""
+    for item in items:
+        into.append(item)
+        yield item
+
+
+def _replay_board(log, event):
+    """Decode a fetch event's pages into one board."""
+    import records
+    return [b for page in event["pages"] for b in records.decode_page([log.blob(page)])]
+
+
+def _replay_grok(log, event):
+    """[(bounty id, item), ...] for the scores in a recorded Grok reply."""
+    body = log.blob(event["response"])
+    if event.get("stream"):
+        items = _iter_json_objects(_sse_deltas(body.decode().split("\n")))
+    else:
+        items = _json_reply_items(json.loads(body))
+    ids = event["ids"]
+    return [(ids[item["idx"]], item) for item in items
+            if isinstance(item, dict) and isinstance(item.get("idx"), int) and 0 <= item["idx"] < len(ids)]
+
+
+def replay(capture_dir, pace="fast", hours=140, limit=20):
+    """Feed a capture back through filtering, scoring, ranking and formatting, with no network.
+
+    Each recorded board is filtered as of its fetch time and scored
+    heuristically; Grok scores come from the recorded replies (the latest
+    one per bounty), not from the score store. A board's digest includes
+    the replies recorded up to the next fetch. pace="original" waits out
+    the recorded gaps between events; "fast" runs them back to back.
+    Nothing is written to the store or cache. Returns the last digest and
+    a throughput report.
     """
-    if "--help" in sys.argv or "-h" in sys.argv:
-        print(main.__doc__)
+    import capture
+    log = capture.CaptureLog(Path(capture_dir))
+    events = log.events()
+    if not any(e["event"] == "fetch" for e in events):
+        return f"No recorded boards in {log.path}"
+
+    stages = dict.fromkeys(("decode", "filter", "score", "grok", "rank", "format"), 0.0)
+    counts = dict.fromkeys(("boards", "bounties", "candidates", "grok_replies", "grok_scores"), 0)
+    known = {}  # Bounty id -> Grok's latest reply item
+    board, digest = None, None
+
+    def timed(stage, fn, *args):
+        start = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            stages[stage] += time.perf_counter() - start
+
+    def finish(board):
+        candidates, heuristic = board
+        scored = []
+        for b, s in zip(candidates, heuristic):
+            item = known.get(b.get("id"))
+            if item is None:
+                b["_score_source"], b["_grok_reason"] = "heuristic", ""
+                scored.append((b, s))
+            else:
+                b["_score_source"], b["_grok_reason"] = "grok", item.get("reason", "")
+                scored.append((b, item.get("score", 50)))
+        ranked = timed("rank", rank, scored)
+        return timed("format", format_digest, ranked, limit)
+
+    started, first = time.monotonic(), events[0]["at"]
+    for event in events:
+        if pace == "original":
+            delay = started + (event["at"] - first) - time.monotonic()
+            if delay > 0 and _stop.wait(delay):
+                break
+        if event["event"] == "fetch":
+            if board is not None:
+                digest = finish(board)
+            bounties = timed("decode", _replay_board, log, event)
+            now = datetime.fromtimestamp(event["at"], timezone.utc)
+            candidates = timed("filter", lambda: filter_recent(filter_jobs_only(bounties), hours=hours, now=now))
+            board = (candidates, timed("score", score_bounties, candidates))
+            counts["boards"] += 1
+            counts["bounties"] += len(bounties)
+            counts["candidates"] += len(candidates)
+        elif event["event"] == "grok":
+            try:
+                items = timed("grok", _replay_grok, log, event)
+            except (ValueError, KeyError, IndexError, TypeError) as e:
+                _log(f"Skipping an unreadable Grok reply ({type(e).__name__})")
+                continue
+            known.update(items)
+            counts["grok_replies"] += 1
+            counts["grok_scores"] += len(items)
+    if board is not None:
+        digest = finish(board)
+    log.close()
+
+    elapsed = time.monotonic() - started
+    busy = sum(stages.values())
+    report = (
+        f"Replayed {counts['boards']} boards ({counts['bounties']} bounties, {counts['candidates']} after filters) "
+        f"and {counts['grok_replies']} Grok replies ({counts['grok_scores']} scores) in {elapsed:.2f}s, "
+        f"{pace} pace — {counts['bounties'] / busy if busy else 0:,.0f} bounties/s of processing\n"
+        + " | ".join(f"{stage} {secs * 1000:.1f}ms" for stage, secs in stages.items())
+    )
+    return f"{digest or 'No bounties in the last board.'}\n\n{report}"
+
+
+def _duration(text):
+    """Seconds from "3", "3s", "500ms" or "2m" (an argparse type)."""
+    import argparse
+    units = {"ms": 0.001, "s": 1, "m": 60}
+    number = text.rstrip("ms")
+    try:
+        seconds = float(number) * units[text[len(number):] or "s"]
+    except (KeyError, ValueError):
+        raise argparse.ArgumentTypeError(f"invalid duration {text!r} (try 3s or 500ms)")
+    if seconds <= 0:
+        raise argparse.ArgumentTypeError("duration must be positive")
+    return seconds
+
+
+def _parse_args(argv=None):
+    """Command-line flags (argparse keeps --help free of any network setup)."""
+    import argparse
+    parser = argparse.ArgumentParser(
+        prog="bounty_hunter.py",
+        description="Scan RentAHuman bounties, score them, send top picks to Telegram.",
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--jobs", action="store_true", help="list all open job postings (raw, no scoring)")
+    mode.add_argument("--humans", "--rent", action="store_true", help="list available humans for hire")
+    mode.add_argument("--new", action="store_true", help="top ranked bounties first seen in the last run")
+    mode.add_argument("--changelog", action="store_true",
+                      help="recent board changes: new, updated, filled and closed bounties")
+    mode.add_argument("--watch", action="store_true", help="stay running, poll adaptively (SIGTERM to stop)")
+    mode.add_argument("--serve", nargs="?", const=0, type=int, metavar="PORT",
+                      help="serve rankings over HTTP on localhost (default port 8765, SIGTERM to stop)")
+    mode.add_argument("--replay", metavar="DIR",
+                      help="replay a --record capture offline: filter, score, rank and report throughput")
+    parser.add_argument("--force", action="store_true", help="bypass cache, fresh Grok scoring")
+    parser.add_argument("--profiles", action="store_true",
+                        help="scan for every profile in profiles.json (RENT_PROFILES_FILE)")
+    parser.add_argument("--deadline", type=_duration, metavar="TIME",
+                        help="answer within TIME (e.g. 3s, 500ms); Grok scores that miss it go to the cache")
+    parser.add_argument("--wait", action="store_true",
+                        help="if another process is rescoring, wait for its result instead of the cache")
+    parser.add_argument("--min-interval", type=float, metavar="SECS", help="fastest poll in --watch")
+    parser.add_argument("--max-interval", type=float, metavar="SECS", help="slowest poll in --watch")
+    parser.add_argument("--no-telegram", action="store_true", help="skip sending to Telegram")
+    parser.add_argument("--changes-only", action="store_true",
+                        help="only send bounties new to the top 20")
+    parser.add_argument("--metrics-dir", metavar="DIR",
+                        help="export a JSON run report and Prometheus textfile here")
+    parser.add_argument("--record", metavar="DIR",
+                        help="record board pages and Grok calls to DIR (RENT_RECORD_DIR) for --replay")
+    parser.add_argument("--pace", choices=("fast", "original"), default="fast",
+                        help="--replay as fast as possible (default) or at the recorded pace")
+    return parser.parse_args(argv)
+
+
+def main():
+    """CLI entry point. See --help."""
+    args = _parse_args()
+    metrics_dir = args.metrics_dir or METRICS_DIR
+    if metrics_dir:
+        metrics.enable()
+    try:
+        _run(args, metrics_dir)
+    finally:
+        if metrics_dir and not args.watch and args.serve is None:
+            write_metrics(metrics_dir, command=" ".join(sys.argv[1:]) or "scan")
+
+
+_TELEGRAM_SKIP = ("No bounties", "not set", "No scan results")  # Results not worth sending
+
+
+def _deliver_profiles(args, results):
+    """Print each profile's scan result and send it to the profile's chat."""
+    changes_only = args.changes_only or TELEGRAM_CHANGES_ONLY
+    for profile, result in results:
+        print(f"\n── {profile['name']} ──\n")
+        print(result)
+        if args.no_telegram or any(marker in result for marker in _TELEGRAM_SKIP):
+            continue
+        load_config()
+        if changes_only:
+            if notify_changes(limit=profile["limit"], profile=profile):
+                _log(f"Sent changes to Telegram for {profile['name']}")
+        else:
+            send_telegram(result, profile["telegram_chat_id"])
+            _log(f"Sent digest to Telegram for {profile['name']}")
+    print()
+
+
+def _run(args, metrics_dir):
+    """Run the command selected by args."""
+    if args.replay:
+        print(replay(args.replay, pace=args.pace))
         return
 
-    if "--jobs" in sys.argv:
+    if args.serve is None and not args.watch:
+        flush_pending()  # --watch flushes every cycle
+
+    if args.record:
+        start_recording(args.record)
+
+    if args.jobs:
         result = list_jobs()
         print(result)
         return
 
-    if "--humans" in sys.argv or "--rent" in sys.argv:
+    if args.humans:
         result = list_humans()
         print(result)
         return
 
-    force = "--force" in sys.argv
-    skip_tg = "--no-telegram" in sys.argv
+    if args.changelog:
+        print(_format_changes(bounty_store.recent_changes(_store(), 50)) or "No board changes recorded yet.")
+        return
+
+    if args.new:
+        cache, _ = load_cache()
+        if not cache:
+            print("No scan results yet — run a scan first.")
+            return
+        print(_format_cache(dict(cache, bounties=top_unseen(limit=20))) or "No new bounties since the last run.")
+        return
+
+    profile_list = None
+    if args.profiles:
+        try:
+            profile_list = load_profiles()
+        except ValueError as e:
+            print(f"Bad profiles file: {e}")
+            return
+
+    if args.serve is not None:
+        serve(port=args.serve, profile_list=profile_list)
+        return
+
+    if args.watch:
+        load_config()
+        watch(
+            hours=140, limit=20,
+            min_secs=args.min_interval,
+            max_secs=args.max_interval,
+            notify=not args.no_telegram,
+            changes_only=args.changes_only or TELEGRAM_CHANGES_ONLY,
+            metrics_dir=metrics_dir,
+            profile_list=profile_list,
+        )
+        return
+
+    if profile_list:
+        _log(f"Bounty scanner starting for {len(profile_list)} profiles...")
+        _deliver_profiles(args, scan_profiles(profile_list, hours=140, force=args.force, wait=args.wait))
+        return
 
     _log("Bounty scanner starting...")
-    result = scan(hours=140, limit=20, force=force)
+    result = scan(hours=140, limit=20, force=args.force, wait=args.wait, deadline=args.deadline)
 
     print()
     print(result)
-    print()
+    print(flush=True)
 
-    if not skip_tg and "No bounties" not in result and "not set" not in result:
-        send_telegram(result)
-        _log("Sent digest to Telegram")
+    if not args.no_telegram and not any(marker in result for marker in _TELEGRAM_SKIP):
+        load_config()
+        if args.changes_only or TELEGRAM_CHANGES_ONLY:
+            if notify_changes(limit=20):
+                _log("Sent changes to Telegram")
+        else:
+            send_telegram(result)
+            _log("Sent digest to Telegram")
     else:
         _log("Done (not sent to Telegram)")
 
-    # If background thread is running, wait for it
-    for t in threading.enumerate():
-        if t.name != "MainThread" and t.daemon:
-            _log("Waiting for background Grok scoring to finish...")
-            t.join()
-            _log("Background scoring complete")
+    # If this run started a background rescore, wait for it
+    thread = _rescore["thread"]
+    if thread is not None and thread.is_alive():
+        _log("Waiting for background Grok scoring to finish...")
+        thread.join()
+        _log("Background scoring complete")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,320 @@
+"""
+SQLite storage for the bounty scanner.
+
+One database holds every bounty ever seen (first/last seen, latest score
+and rank), the current ranking's metadata, the per-bounty Grok score
+cache, near-duplicate fingerprints and the board changelog. WAL mode lets readers (agents,
+the query server) run alongside a rescore. bounties_cache.json and
+bounties_ranked.txt are exports of it.
+"""
+
+import json
+import sqlite3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS bounties (
+    id         TEXT PRIMARY KEY,
+    title      TEXT,
+    created_at TEXT,
+    score      INTEGER,   -- latest score, kept after the bounty drops out of the ranking
+    reason     TEXT,
+    source     TEXT,      -- "grok" or "heuristic"
+    rank       INTEGER,   -- position in the current ranking, NULL if not ranked
+    dupes      INTEGER DEFAULT 0,  -- near-duplicate reposts folded into this one
+    category   TEXT,
+    remote     INTEGER DEFAULT 0,  -- 1 if remote work is allowed
+    price      REAL,
+    first_seen TEXT NOT NULL,
+    last_seen  TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_bounties_created_at ON bounties(created_at);
+CREATE INDEX IF NOT EXISTS idx_bounties_score ON bounties(score);
+CREATE INDEX IF NOT EXISTS idx_bounties_last_seen ON bounties(last_seen);
+CREATE INDEX IF NOT EXISTS idx_bounties_first_seen ON bounties(first_seen);
+CREATE INDEX IF NOT EXISTS idx_bounties_rank ON bounties(rank) WHERE rank IS NOT NULL;
+CREATE TABLE IF NOT EXISTS grok_scores (
+    id        TEXT PRIMARY KEY,
+    hash      TEXT NOT NULL,
+    score     INTEGER,
+    reason    TEXT,
+    scored_at TEXT NOT NULL,
+    expires   TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_grok_scores_expires ON grok_scores(expires);
+CREATE INDEX IF NOT EXISTS idx_grok_scores_scored_at ON grok_scores(scored_at);
+CREATE TABLE IF NOT EXISTS outbox (
+    id         INTEGER PRIMARY KEY AUTOINCREMENT,
+    chat_id    TEXT NOT NULL,
+    text       TEXT NOT NULL,
+    attempts   INTEGER NOT NULL DEFAULT 0,
+    next_try   TEXT NOT NULL,
+    last_error TEXT,
+    created    TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_outbox_next_try ON outbox(next_try);
+CREATE TABLE IF NOT EXISTS fingerprints (
+    id        TEXT PRIMARY KEY,
+    text_hash TEXT NOT NULL,
+    signature BLOB NOT NULL,
+    cluster   TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS changes (
+    seq    INTEGER PRIMARY KEY AUTOINCREMENT,
+    id     TEXT NOT NULL,
+    kind   TEXT NOT NULL,  -- "new", "updated", "filled" or "closed"
+    title  TEXT,
+    deltas TEXT,           -- JSON {field: [old, new]}
+    at     TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_changes_at ON changes(at);
+"""
+
+# Columns added after the first release: (table, column, definition)
+MIGRATIONS = [
+    ("bounties", "dupes", "INTEGER DEFAULT 0"),
+    ("bounties", "category", "TEXT"),
+    ("bounties", "remote", "INTEGER DEFAULT 0"),
+    ("bounties", "price", "REAL"),
+]
+
+RANKING_COLUMNS = "id, title, score, reason, source, dupes, category, remote, price, first_seen"
+
+
+def connect(path):
+    """Open (and create if needed) the store. One connection per thread."""
+    conn = sqlite3.connect(str(path), timeout=10)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    for table, column, definition in MIGRATIONS:
+        if column not in {r["name"] for r in conn.execute(f"PRAGMA table_info({table})")}:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+    return conn
+
+
+# ── Bounties ─────────────────────────────────────────────
+
+def record_seen(conn, bounties, now):
+    """Upsert fetched bounties, bumping last_seen and keeping first_seen."""
+    rows = [(b["id"], b.get("title"), b.get("createdAt"), now, now) for b in bounties if b.get("id")]
+    with conn:
+        conn.executemany(
+            """INSERT INTO bounties (id, title, created_at, first_seen, last_seen)
+               VALUES (?, ?, ?, ?, ?)
+               ON CONFLICT(id) DO UPDATE SET
+                   title = excluded.title,
+                   created_at = excluded.created_at,
+                   last_seen = excluded.last_seen""",
+            rows,
+        )
+
+
+def save_ranking(conn, entries, version, model, now):
+    """Replace the current ranking with entries
+    [{id, title, score, reason, source, dupes, category, remote, price}]."""
+    with conn:
+        prev = get_meta(conn, "last_call")
+        conn.execute("UPDATE bounties SET rank = NULL WHERE rank IS NOT NULL")
+        conn.executemany(
+            """INSERT INTO bounties (id, title, score, reason, source, rank, dupes, category, remote, price,
+                                    first_seen, last_seen)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT(id) DO UPDATE SET
+                   title = excluded.title,
+                   score = excluded.score,
+                   reason = excluded.reason,
+                   source = excluded.source,
+                   rank = excluded.rank,
+                   dupes = excluded.dupes,
+                   category = excluded.category,
+                   remote = excluded.remote,
+                   price = excluded.price,
+                   last_seen = excluded.last_seen""",
+            [
+                (e["id"], e.get("title"), e.get("score"), e.get("reason", ""), e.get("source"), i,
+                 e.get("dupes", 0), e.get("category"), int(bool(e.get("remote"))), e.get("price"), now, now)
+                for i, e in enumerate(entries) if e.get("id")
+            ],
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            [("version", str(version)), ("model", model), ("last_call", now), ("prev_call", prev or "")],
+        )
+
+
+def unrank(conn, ids):
+    """Take ids out of the current ranking. Returns how many were ranked."""
+    removed = 0
+    with conn:
+        for start in range(0, len(ids), 500):
+            batch = ids[start:start + 500]
+            marks = ",".join("?" * len(batch))
+            removed += conn.execute(
+                f"UPDATE bounties SET rank = NULL WHERE rank IS NOT NULL AND id IN ({marks})", batch
+            ).rowcount
+    return removed
+
+
+def load_ranking(conn):
+    """Current ranking as the classic cache dict, or None if nothing saved yet."""
+    meta = dict(conn.execute("SELECT key, value FROM meta").fetchall())
+    if "last_call" not in meta:
+        return None
+    rows = conn.execute(
+        f"SELECT {RANKING_COLUMNS} FROM bounties WHERE rank IS NOT NULL ORDER BY rank"
+    ).fetchall()
+    return {
+        "version": int(meta.get("version", 0)),
+        "last_call": meta["last_call"],
+        "prev_call": meta.get("prev_call", ""),
+        "model": meta.get("model", "heuristic"),
+        "bounties": [dict(r) for r in rows],
+    }
+
+
+def top_unseen(conn, limit, since):
+    """Top ranked bounties first seen after `since` (ISO timestamp)."""
+    rows = conn.execute(
+        f"""SELECT {RANKING_COLUMNS} FROM bounties
+           WHERE rank IS NOT NULL AND first_seen > ?
+           ORDER BY score DESC, rank LIMIT ?""",
+        (since or "", limit),
+    ).fetchall()
+    return [dict(r) for r in rows]
+
+
+def get_meta(conn, key, default=None):
+    """One value from the meta table."""
+    row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else default
+
+
+# ── Grok score cache ─────────────────────────────────────
+
+def get_scores(conn, ids, now):
+    """Unexpired Grok scores for ids. Returns {id: row dict}."""
+    found = {}
+    ids = [i for i in ids if i]
+    for start in range(0, len(ids), 500):  # Stay under SQLite's bound-parameter limit
+        batch = ids[start:start + 500]
+        marks = ",".join("?" * len(batch))
+        for r in conn.execute(
+            f"SELECT * FROM grok_scores WHERE expires > ? AND id IN ({marks})", (now, *batch)
+        ):
+            found[r["id"]] = dict(r)
+    return found
+
+
+def put_scores(conn, entries, max_entries, now):
+    """Upsert Grok scores [{id, hash, score, reason, scored_at, expires}], then evict.
+
+    Expired rows go first; past max_entries the oldest scores are dropped.
+    """
+    with conn:
+        conn.executemany(
+            """INSERT OR REPLACE INTO grok_scores (id, hash, score, reason, scored_at, expires)
+               VALUES (:id, :hash, :score, :reason, :scored_at, :expires)""",
+            entries,
+        )
+        conn.execute("DELETE FROM grok_scores WHERE expires <= ?", (now,))
+        conn.execute(
+            """DELETE FROM grok_scores WHERE id IN (
+                   SELECT id FROM grok_scores ORDER BY scored_at DESC LIMIT -1 OFFSET ?)""",
+            (max_entries,),
+        )
+
+
+def shift_scores(conn, shifts):
+    """Add {bounty id: points} to the stored scores of those bounties, for every persona
+    (ids "<id>" and "<id>#<persona>"), clamped to 0-100. Returns rows changed."""
+    changed = 0
+    with conn:
+        for bid, points in shifts.items():
+            changed += conn.execute(
+                """UPDATE grok_scores SET score = MAX(0, MIN(100, score + ?))
+                   WHERE id = ? OR substr(id, 1, ?) = ?""",
+                (points, bid, len(bid) + 1, bid + "#"),
+            ).rowcount
+    return changed
+
+
+# ── Near-duplicate fingerprints ──────────────────────────
+
+def load_fingerprints(conn):
+    """Every stored fingerprint as [(id, text_hash, signature blob, cluster)]."""
+    return [tuple(r) for r in conn.execute("SELECT id, text_hash, signature, cluster FROM fingerprints")]
+
+
+def save_fingerprints(conn, rows, evict_before):
+    """Upsert [(id, text_hash, signature blob, cluster)], then drop fingerprints
+    of bounties not seen on the board since evict_before."""
+    with conn:
+        conn.executemany("INSERT OR REPLACE INTO fingerprints VALUES (?, ?, ?, ?)", rows)
+        conn.execute(
+            """DELETE FROM fingerprints WHERE id IN (
+                   SELECT id FROM bounties WHERE last_seen < ?)""",
+            (evict_before,),
+        )
+
+
+# ── Board changelog ──────────────────────────────────────
+
+def record_changes(conn, entries, now, evict_before):
+    """Append changelog entries [{id, kind, title, changes}], then drop those older than evict_before."""
+    with conn:
+        conn.executemany(
+            "INSERT INTO changes (id, kind, title, deltas, at) VALUES (?, ?, ?, ?, ?)",
+            [(e["id"], e["kind"], e.get("title"), json.dumps(e.get("changes") or {}), now) for e in entries],
+        )
+        conn.execute("DELETE FROM changes WHERE at < ?", (evict_before,))
+
+
+def recent_changes(conn, limit):
+    """The latest changelog entries, newest first, with deltas decoded."""
+    rows = conn.execute("SELECT * FROM changes ORDER BY seq DESC LIMIT ?", (limit,)).fetchall()
+    return [dict(r, deltas=json.loads(r["deltas"] or "{}")) for r in rows]
+
+
+# ── Telegram outbox ──────────────────────────────────────
+
+def outbox_add(conn, chat_id, text, error, next_try, now):
+    """Queue a message that failed to send."""
+    with conn:
+        conn.execute(
+            """INSERT INTO outbox (chat_id, text, attempts, next_try, last_error, created)
+               VALUES (?, ?, 1, ?, ?, ?)""",
+            (str(chat_id), text, next_try, error, now),
+        )
+
+
+def outbox_due(conn, now):
+    """Queued messages whose retry time has come, oldest first."""
+    return [dict(r) for r in conn.execute(
+        "SELECT * FROM outbox WHERE next_try <= ? ORDER BY id", (now,)
+    )]
+
+
+def outbox_retry(conn, msg_id, error, next_try):
+    """Record another failed attempt."""
+    with conn:
+        conn.execute(
+            "UPDATE outbox SET attempts = attempts + 1, last_error = ?, next_try = ? WHERE id = ?",
+            (error, next_try, msg_id),
+        )
+
+
+def outbox_remove(conn, msg_id):
+    """Drop a sent (or abandoned) message."""
+    with conn:
+        conn.execute("DELETE FROM outbox WHERE id = ?", (msg_id,))
+
+
+def set_meta(conn, key, value):
+    """Set one value in the meta table."""
+    with conn:
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
@@ -0,0 +1,110 @@
+"""
+Record-and-replay log of the scanner's network traffic.
+
+A capture directory holds one append-only file, capture.log. Each record
+is a JSON header line; a blob record is followed by its zlib-compressed
+payload and a newline:
+
+    {"blob": "<sha256>", "size": 812}\\n<812 bytes>\\n
+    {"event": "fetch", "at": 1760000000.0, "pages": ["<sha256>", ...]}\\n
+    {"event": "grok", "at": 1760000003.2, "request": "<sha256>", "response": "<sha256>", ...}\\n
+
+Blobs are addressed by the SHA-256 of their uncompressed content. A
+payload that is already in the log (an unchanged board page, a repeated
+prompt) is referenced again instead of being stored twice. A record cut
+short by a crash is dropped when the log is next opened.
+"""
+
+import json
+import time
+import zlib
+import hashlib
+import threading
+
+LOG_NAME = "capture.log"
+
+
+class CaptureLog:
+    """One capture directory's log, for appending (put/event) and reading (events/blob)."""
+
+    def __init__(self, directory):
+        self.path = directory / LOG_NAME
+        self._blobs = {}  # sha256 -> (offset of compressed payload, size)
+        self._events = []
+        self._lock = threading.Lock()
+        self._out = None
+        self._scan()
+
+    def _scan(self):
+        """Index the log's blobs and events, and drop a torn record at the end."""
+        try:
+            f = open(self.path, "rb")
+        except FileNotFoundError:
+            return
+        with f:
+            end = 0
+            while True:
+                line = f.readline()
+                try:
+                    header = json.loads(line) if line.endswith(b"\n") else None
+                except ValueError:
+                    header = None
+                if header is None:
+                    break
+                if "blob" in header:
+                    offset = f.tell()
+                    f.seek(header["size"], 1)
+                    if f.read(1) != b"\n":
+                        break
+                    self._blobs[header["blob"]] = (offset, header["size"])
+                else:
+                    self._events.append(header)
+                end = f.tell()
+        if end < self.path.stat().st_size:
+            with open(self.path, "r+b") as f:
+                f.truncate(end)
+
+    def _write(self, data):
+        if self._out is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._out = open(self.path, "ab")
+        self._out.write(data)
+
+    def put(self, data):
+        """Store bytes (once per distinct content). Returns their address."""
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            if digest not in self._blobs:
+                packed = zlib.compress(data, 6)
+                self._write(json.dumps({"blob": digest, "size": len(packed)}).encode() + b"\n")
+                self._blobs[digest] = (self._out.tell(), len(packed))
+                self._write(packed + b"\n")
+        return digest
+
+    def event(self, kind, **fields):
+        """Append an event; "at" (epoch seconds) is added unless given."""
+        entry = {"event": kind, "at": fields.pop("at", None) or time.time(), **fields}
+        with self._lock:
+            self._write(json.dumps(entry).encode() + b"\n")
+            self._out.flush()
+            self._events.append(entry)
+
+    def events(self):
+        """Every event in the log, oldest first."""
+        return list(self._events)
+
+    def blob(self, digest):
+        """The bytes stored under digest. Raises KeyError if the log doesn't have them."""
+        offset, size = self._blobs[digest]
+        with self._lock:
+            if self._out is not None:
+                self._out.flush()
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            return zlib.decompress(f.read(size))
+
+    def close(self):
+        with self._lock:
+            if self._out is not None:
+                self._out.close()
+                self._out = None
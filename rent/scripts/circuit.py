@@ -0,0 +1,57 @@
+"""
+Circuit breaker for a flaky upstream (Grok).
+
+After `threshold` failed calls in a row the circuit opens, and callers
+skip the upstream for `cooldown_secs`. Then it half-opens: calls go
+through again, and the next result either closes it (a success) or opens
+it for another cooldown (a failure). State is read and written through
+load() / save() on every check, so separate processes (cron runs, agent
+calls, --watch) share one breaker.
+"""
+
+import time
+import threading
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker over a small persisted state {failures, opened_at}."""
+
+    def __init__(self, threshold, cooldown_secs, load, save):
+        self.threshold = threshold
+        self.cooldown_secs = cooldown_secs
+        self.load = load
+        self.save = save
+        self._lock = threading.Lock()
+
+    def _state(self):
+        try:
+            state = self.load() or {}
+        except Exception:
+            state = {}
+        return {"failures": int(state.get("failures", 0)), "opened_at": float(state.get("opened_at", 0))}
+
+    def retry_at(self):
+        """When the open circuit half-opens (epoch seconds), or None if calls may go through now."""
+        state = self._state()
+        if state["failures"] < self.threshold:
+            return None
+        at = state["opened_at"] + self.cooldown_secs
+        return at if at > time.time() else None
+
+    def allow(self):
+        return self.retry_at() is None
+
+    def record(self, ok):
+        """Record one call's outcome. Returns True if a failure (re)opened the circuit."""
+        with self._lock:
+            state = self._state()
+            if ok:
+                if state["failures"]:
+                    self.save({"failures": 0, "opened_at": 0})
+                return False
+            state["failures"] += 1
+            opened = state["failures"] >= self.threshold
+            if opened:
+                state["opened_at"] = time.time()
+            self.save(state)
+            return opened
@@ -0,0 +1,138 @@
+"""
+Near-duplicate detection for bounty postings.
+
+Each posting's normalized title + description is cut into character
+5-gram shingles and summarized by a one-permutation MinHash signature:
+every shingle is hashed once into one of BINS bins and each bin keeps its
+minimum. Matching bins estimate Jaccard similarity, so reposts with small
+edits score high while different gigs from the same template (another
+city, another quantity) don't. LSH banding keeps lookups to bucket-mates;
+bands that common boilerplate puts in every posting stop growing at
+MAX_BUCKET, since the other bands still find true reposts.
+"""
+
+import re
+import array
+import hashlib
+from operator import eq
+
+BINS = 32          # Signature length
+BAND_ROWS = 4      # Bins per LSH band (8 bands): ~99.8% recall at 0.8 similarity
+THRESHOLD = 0.8    # Estimated Jaccard similarity to count as the same posting
+SHINGLE = 5        # Characters per shingle
+TEXT_CHARS = 600   # Only the start of long descriptions is compared
+MIN_CHARS = 20     # Shorter texts are never treated as duplicates
+MAX_BUCKET = 20    # Bands shared by this many postings are boilerplate; stop indexing them
+MEMO_MAX = 200_000  # Shingle hashes remembered between calls
+
+EMPTY = 0xFFFFFFFF  # Bin no shingle fell into
+_SPACE = re.compile(r"[^a-z0-9]+")
+_memo = {}
+
+
+def normalize(title, description):
+    """Lowercase, punctuation and whitespace runs collapsed to one space, truncated."""
+    text = _SPACE.sub(" ", f"{title or ''} {description or ''}".lower()).strip()
+    return text[:TEXT_CHARS]
+
+
+def text_hash(text):
+    """Short stable hash of normalized text, to skip re-signing unchanged postings."""
+    return hashlib.blake2b(text.encode(), digest_size=8).hexdigest()
+
+
+def _bin_value(shingle):
+    entry = _memo.get(shingle)
+    if entry is None:
+        h = int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), "little")
+        entry = (h % BINS, min(h >> 32, EMPTY - 1))
+        if len(_memo) >= MEMO_MAX:
+            _memo.clear()
+        _memo[shingle] = entry
+    return entry
+
+
+def signature(text):
+    """MinHash signature (tuple of BINS ints) of normalized text, or None if too short."""
+    if len(text) < MIN_CHARS:
+        return None
+    sig, memo = [EMPTY] * BINS, _memo
+    for shingle in {text[i:i + SHINGLE] for i in range(len(text) - SHINGLE + 1)}:
+        b, value = memo.get(shingle) or _bin_value(shingle)
+        if value < sig[b]:
+            sig[b] = value
+    return tuple(sig)
+
+
+def similarity(a, b):
+    """Estimated Jaccard similarity of two signatures (bins empty in both don't count)."""
+    equal, used = sum(map(eq, a, b)), BINS
+    if EMPTY in a:
+        both = sum(1 for x, y in zip(a, b) if x == y == EMPTY)
+        equal, used = equal - both, used - both
+    return equal / used if used else 0.0
+
+
+def pack(sig):
+    """Signature as bytes, for storage."""
+    return array.array("I", sig).tobytes()
+
+
+def unpack(blob):
+    return tuple(array.array("I", blob))
+
+
+class NearDupIndex:
+    """Signature → cluster lookup for postings at or above THRESHOLD similarity."""
+
+    def __init__(self, threshold=THRESHOLD):
+        self.threshold = threshold
+        self.buckets = {}
+        self.clusters = {}  # cluster -> its indexed (sig, cluster) entries
+
+    def _keys(self, sig):
+        for start in range(0, BINS, BAND_ROWS):
+            band = sig[start:start + BAND_ROWS]
+            if any(v != EMPTY for v in band):
+                yield (start, *band)
+
+    def add(self, sig, cluster):
+        entry = (sig, cluster)
+        for key in self._keys(sig):
+            bucket = self.buckets.setdefault(key, [])
+            if len(bucket) < MAX_BUCKET:
+                bucket.append(entry)
+        self.clusters.setdefault(cluster, []).append(entry)
+
+    def remove(self, cluster):
+        """Forget every signature indexed under cluster. Returns True if there were any."""
+        entries = self.clusters.pop(cluster, None)
+        if entries is None:
+            return False
+        for entry in entries:
+            for key in self._keys(entry[0]):
+                bucket = self.buckets.get(key)
+                if bucket is None:
+                    continue
+                bucket[:] = [e for e in bucket if e is not entry]
+                if not bucket:
+                    del self.buckets[key]
+        return True
+
+    def find(self, sig):
+        """Cluster of the most similar indexed signature above threshold, or None."""
+        candidates = {}
+        for key in self._keys(sig):
+            for entry in self.buckets.get(key, ()):
+                candidates[id(entry)] = entry
+        best, best_sim = None, self.threshold
+        for other, cluster in candidates.values():
+            sim = similarity(sig, other)
+            if sim >= best_sim:
+                best, best_sim = cluster, sim
+                if sim == 1.0:
+                    break
+        return best
+
+    def __len__(self):
+        return len(self.clusters)
@@ -0,0 +1,158 @@
+"""
+Run metrics for the bounty scanner: timing spans, counters and gauges.
+
+Disabled by default; every call then returns straight away (span() hands
+back a shared no-op context manager), so instrumented code pays about one
+function call. Enabled runs export a JSON report and a Prometheus textfile
+for node_exporter's textfile collector. Values describe the last run (or
+the last --watch cycle), so every series is exported as a gauge.
+"""
+
+import time
+import threading
+
+PREFIX = "rent_scanner"
+
+_enabled = False
+_lock = threading.Lock()
+_spans = {}     # (name, labels) -> [count, total_s, max_s]
+_counters = {}  # (name, labels) -> value
+_gauges = {}    # (name, labels) -> value
+_started = [time.time(), time.perf_counter()]
+
+
+def enable():
+    """Start recording (clears anything recorded so far)."""
+    global _enabled
+    reset()
+    _enabled = True
+
+
+def enabled():
+    return _enabled
+
+
+def reset():
+    """Forget recorded values and restart the run clock."""
+    with _lock:
+        _spans.clear()
+        _counters.clear()
+        _gauges.clear()
+        _started[:] = [time.time(), time.perf_counter()]
+
+
+def _key(name, labels):
+    return (name, tuple(sorted(labels.items()))) if labels else (name, ())
+
+
+class _Span:
+    __slots__ = ("key", "start")
+
+    def __init__(self, key):
+        self.key = key
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        with _lock:
+            s = _spans.get(self.key)
+            if s is None:
+                _spans[self.key] = [1, elapsed, elapsed]
+            else:
+                s[0] += 1
+                s[1] += elapsed
+                s[2] = max(s[2], elapsed)
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+_NO_SPAN = _NoSpan()
+
+
+def span(name, **labels):
+    """Context manager timing a block; repeated spans add up (count, total, max)."""
+    if not _enabled:
+        return _NO_SPAN
+    return _Span(_key(name, labels))
+
+
+def incr(name, value=1, **labels):
+    """Add value to a counter."""
+    if not _enabled:
+        return
+    key = _key(name, labels)
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + value
+
+
+def gauge(name, value, **labels):
+    """Set a gauge to value."""
+    if not _enabled:
+        return
+    with _lock:
+        _gauges[_key(name, labels)] = value
+
+
+# ── Export ───────────────────────────────────────────────
+
+def _series(name, labels):
+    if not labels:
+        return name
+    return name + "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels) + "}"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def report():
+    """Everything recorded so far as a JSON-ready dict."""
+    with _lock:
+        spans = {_series(n, l): {"count": s[0], "total_s": round(s[1], 6), "max_s": round(s[2], 6)}
+                 for (n, l), s in sorted(_spans.items())}
+        counters = {_series(n, l): v for (n, l), v in sorted(_counters.items())}
+        gauges = {_series(n, l): v for (n, l), v in sorted(_gauges.items())}
+        started, start_clock = _started
+    return {
+        "started": started,
+        "duration_s": round(time.perf_counter() - start_clock, 6),
+        "spans": spans,
+        "counters": counters,
+        "gauges": gauges,
+    }
+
+
+def prometheus_text():
+    """Prometheus text exposition format of the current values."""
+    with _lock:
+        spans = sorted(_spans.items())
+        values = sorted(list(_counters.items()) + list(_gauges.items()))
+        started, start_clock = _started
+    families = {
+        f"{PREFIX}_run_timestamp_seconds": [((), started)],
+        f"{PREFIX}_run_duration_seconds": [((), round(time.perf_counter() - start_clock, 6))],
+    }
+    for (name, labels), (count, total, longest) in spans:
+        labels = (("span", name),) + labels
+        families.setdefault(f"{PREFIX}_span_count", []).append((labels, count))
+        families.setdefault(f"{PREFIX}_span_seconds", []).append((labels, round(total, 6)))
+        families.setdefault(f"{PREFIX}_span_max_seconds", []).append((labels, round(longest, 6)))
+    for (name, labels), value in values:
+        families.setdefault(f"{PREFIX}_{name}", []).append((labels, value))
+
+    lines = []
+    for family, samples in families.items():
+        lines.append(f"# TYPE {family} gauge")
+        lines.extend(f"{_series(family, labels)} {value}" for labels, value in samples)
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,99 @@
+"""
+Staged asyncio pipeline for the bounty scanner.
+
+A source iterator of batches feeds a chain of stages connected by bounded
+queues. Each stage is a plain sync function batch -> batch run on worker
+threads, so blocking HTTP calls overlap across stages while the queue
+bounds cap memory and how many batches a stage has in flight. Per-stage
+counters show where the time goes.
+"""
+
+import time
+import asyncio
+
+_DONE = object()
+
+
+def _new_stats():
+    return {"batches": 0, "items_in": 0, "items_out": 0, "busy_s": 0.0}
+
+
+async def _produce(source, out, workers, stats):
+    it = iter(source)
+    while True:
+        start = time.monotonic()
+        batch = await asyncio.to_thread(next, it, _DONE)
+        stats["busy_s"] += time.monotonic() - start
+        if batch is _DONE:
+            break
+        stats["batches"] += 1
+        stats["items_out"] += len(batch)
+        await out.put(batch)
+    for _ in range(workers):
+        await out.put(_DONE)
+
+
+async def _work(fn, inq, outq, stats):
+    while True:
+        batch = await inq.get()
+        if batch is _DONE:
+            return
+        start = time.monotonic()
+        result = await asyncio.to_thread(fn, batch)
+        stats["busy_s"] += time.monotonic() - start
+        stats["batches"] += 1
+        stats["items_in"] += len(batch)
+        stats["items_out"] += len(result or ())
+        if result:
+            await outq.put(result)
+
+
+async def _stage(fn, workers, inq, outq, next_workers, stats):
+    await asyncio.gather(*(_work(fn, inq, outq, stats) for _ in range(workers)))
+    for _ in range(next_workers):
+        await outq.put(_DONE)
+
+
+async def _sink(inq, on_batch, stats):
+    while True:
+        batch = await inq.get()
+        if batch is _DONE:
+            return
+        stats["batches"] += 1
+        stats["items_in"] += len(batch)
+        start = time.monotonic()
+        on_batch(batch)
+        stats["busy_s"] += time.monotonic() - start
+
+
+async def run_async(source, stages, on_batch, queue_size=4):
+    """Run source → stages → on_batch. Returns {stage name: counters}.
+
+    stages is [(name, fn, workers), ...]; fn(batch) returns the batch to pass
+    on (empty or None drops it). on_batch runs on the event loop, in order of
+    arrival, as each batch clears the last stage.
+    """
+    stats = {"source": _new_stats()}
+    queues = [asyncio.Queue(maxsize=queue_size) for _ in range(len(stages) + 1)]
+    workers = [w for _, _, w in stages] + [1]
+    tasks = [_produce(source, queues[0], workers[0], stats["source"])]
+    for i, (name, fn, n) in enumerate(stages):
+        stats[name] = _new_stats()
+        tasks.append(_stage(fn, n, queues[i], queues[i + 1], workers[i + 1], stats[name]))
+    stats["sink"] = _new_stats()
+    tasks.append(_sink(queues[-1], on_batch, stats["sink"]))
+
+    start = time.monotonic()
+    await asyncio.gather(*tasks)
+    elapsed = time.monotonic() - start
+    for s in stats.values():
+        s["busy_s"] = round(s["busy_s"], 3)
+        items = s["items_in"] or s["items_out"]
+        s["per_s"] = round(items / s["busy_s"], 1) if s["busy_s"] else None
+    stats["total_s"] = round(elapsed, 3)
+    return stats
+
+
+def run(source, stages, on_batch, queue_size=4):
+    """Sync wrapper around run_async() for callers without an event loop."""
+    return asyncio.run(run_async(source, stages, on_batch, queue_size=queue_size))
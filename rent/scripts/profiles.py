@@ -0,0 +1,67 @@
+"""
+Profile registry for scanning one board on behalf of several people.
+
+profiles.json holds a list of profiles (or {"profiles": [...]}). Each one
+overrides some of the defaults built from the scanner's settings:
+
+    {"name": "alex", "skills": ["python", "react"], "location": "Austin, TX",
+     "locations": ["austin"], "min_score": 40, "telegram_chat_id": "12345"}
+
+name          cache directory and label; letters, digits, "-" and "_"
+skills        matched against skillsNeeded and used for relevance
+prompt_skills skill text in the Grok prompt (default: skills joined)
+location      where the person is, in the Grok prompt
+locations     in-person places that make a bounty more relevant
+prefer_remote remote gigs rank as more relevant
+min_score     lowest score kept in the profile's ranking
+limit         bounties in the profile's digest
+telegram_chat_id  where the digest goes (default: the scanner's chat)
+
+Profiles whose scoring fields (persona()) match are scored together, once.
+"""
+
+import re
+import json
+import hashlib
+
+FIELDS = ("name", "skills", "prompt_skills", "location", "locations", "prefer_remote",
+          "min_score", "limit", "telegram_chat_id")
+SCORING_FIELDS = ("skills", "prompt_skills", "location", "locations", "prefer_remote")
+_NAME = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+
+def load(path, default):
+    """Profiles from path with default's values filled in, or [default] if there is no file.
+
+    Raises ValueError on a malformed file, a bad or duplicate name, or an unknown field.
+    """
+    try:
+        data = json.loads(path.read_text())
+    except FileNotFoundError:
+        return [dict(default)]
+    if isinstance(data, dict):
+        data = data.get("profiles")
+    if not isinstance(data, list) or not data:
+        raise ValueError(f"{path}: expected a non-empty list of profiles")
+    profiles, names = [], set()
+    for entry in data:
+        if not isinstance(entry, dict):
+            raise ValueError(f"{path}: each profile must be an object")
+        unknown = set(entry) - set(FIELDS)
+        if unknown:
+            raise ValueError(f"{path}: unknown profile field(s) {', '.join(sorted(unknown))}")
+        profile = dict(default, **entry)
+        if "skills" in entry and "prompt_skills" not in entry:
+            profile["prompt_skills"] = ", ".join(entry["skills"])
+        name = str(profile.get("name", ""))
+        if not _NAME.match(name) or name in names:
+            raise ValueError(f"{path}: profile name {name!r} is invalid or used twice")
+        names.add(name)
+        profiles.append(profile)
+    return profiles
+
+
+def persona(profile):
+    """Short stable id of the fields that change scores (not delivery settings)."""
+    fields = [profile.get(f) for f in SCORING_FIELDS]
+    return hashlib.blake2b(json.dumps(fields, sort_keys=True).encode(), digest_size=4).hexdigest()
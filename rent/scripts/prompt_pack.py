@@ -0,0 +1,124 @@
+"""
+Token-budgeted prompt packing for Grok scoring.
+
+Bounties go into the prompt as one columnar table: field names once, then
+one compact JSON array per bounty. Descriptions are cut down to their most
+informative sentences. Sentences that many postings share (boilerplate),
+that restate the title, or that carry little rare vocabulary go first.
+Sentences with a must-keep phrase (the scam signals) are never dropped.
+Rows are packed into requests until the next one would pass the token
+budget.
+
+Tokens are estimated at CHARS_PER_TOKEN characters each. That is close
+enough for English JSON to plan batches, but it is not the model's
+tokenizer.
+"""
+
+import re
+import json
+import math
+
+CHARS_PER_TOKEN = 4
+DESC_TOKENS = 50          # Description budget per bounty
+BOILERPLATE_SHARE = 0.05  # A sentence in this share of postings (and at least 3) is boilerplate
+
+_SENTENCE = re.compile(r"(?<=[.!?])\s+|\s*\n+\s*")
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def estimate_tokens(text):
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def _dumps(value):
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+def _key(sentence):
+    return " ".join(_WORD.findall(sentence.lower()))
+
+
+def _sentences(text):
+    return [" ".join(s.split()) for s in _SENTENCE.split(text or "") if s.strip()]
+
+
+class Corpus:
+    """Sentence and word document frequencies over the descriptions being packed."""
+
+    def __init__(self, descriptions):
+        self.n = 0
+        self.sentence_df = {}
+        self.word_df = {}
+        for text in descriptions:
+            self.n += 1
+            keys = {_key(s) for s in _sentences(text)}
+            for k in keys:
+                self.sentence_df[k] = self.sentence_df.get(k, 0) + 1
+            for w in {w for k in keys for w in k.split()}:
+                self.word_df[w] = self.word_df.get(w, 0) + 1
+        self.boilerplate_min = max(3, math.ceil(self.n * BOILERPLATE_SHARE))
+
+    def is_boilerplate(self, key):
+        return self.sentence_df.get(key, 0) >= self.boilerplate_min
+
+    def information(self, key):
+        """Summed rarity (IDF) of a sentence's distinct words."""
+        n = self.n + 1
+        return sum(math.log(n / (self.word_df.get(w, 0) + 1)) for w in set(key.split()))
+
+
+def trim_description(text, title, corpus, max_tokens=DESC_TOKENS, keep=()):
+    """The most informative sentences of text within max_tokens, in their original order.
+
+    keep: lowercase phrases whose sentences always stay (e.g. scam signals).
+    """
+    title_key = _key(title or "")
+    chosen, candidates = [], []
+    for pos, sentence in enumerate(_sentences(text)):
+        key = _key(sentence)
+        if not key:
+            continue
+        lower = sentence.lower()
+        if any(phrase in lower for phrase in keep):
+            chosen.append((pos, sentence))
+        elif key in title_key or corpus.is_boilerplate(key):
+            continue
+        else:
+            density = corpus.information(key) / estimate_tokens(sentence)
+            candidates.append((density, pos, sentence))
+
+    budget = max_tokens * CHARS_PER_TOKEN - sum(len(s) + 1 for _, s in chosen)
+    for _, pos, sentence in sorted(candidates, key=lambda c: c[0], reverse=True):
+        if budget <= 0:
+            break
+        if len(sentence) + 1 > budget:
+            if chosen:
+                continue
+            sentence = sentence[:budget].rsplit(" ", 1)[0] + "…"
+        chosen.append((pos, sentence))
+        budget -= len(sentence) + 1
+    return " ".join(s for _, s in sorted(chosen))
+
+
+def encode_table(columns, rows):
+    """Columnar JSON: {"cols": [...], "rows": [[...], ...]}."""
+    return _dumps({"cols": list(columns), "rows": rows})
+
+
+def pack(rows, budget_tokens, overhead_tokens, max_rows):
+    """Group rows into batches of at most max_rows whose encoding fits the budget.
+
+    overhead_tokens is the prompt around the table. A row too big for any
+    batch still goes out, alone. Returns [[row index, ...], ...].
+    """
+    batches, current, used = [], [], overhead_tokens
+    for i, row in enumerate(rows):
+        cost = estimate_tokens(_dumps(row)) + 1
+        if current and (used + cost > budget_tokens or len(current) >= max_rows):
+            batches.append(current)
+            current, used = [], overhead_tokens
+        current.append(i)
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
@@ -0,0 +1,202 @@
+"""
+Local read-only query server for the ranked cache.
+
+Agents read rankings from one long-running process over HTTP on
+localhost instead of launching the scanner for every read. Each
+RankingView holds a ranking in memory. Before answering, it checks a
+cheap version token, and reloads only when the token changes (the
+scanner passes SQLite's data_version plus the export's mtime, so any
+scan, rescore or eviction in another process shows up on the next read).
+Filtered result lists and rendered digests are memoized per ranking
+version; a repeat read costs a dict lookup.
+
+GET /bounties?limit=20&offset=0&min_score=40&category=research&remote=1&since=CURSOR
+    JSON page of the ranking, best first. `cursor` in the reply is the
+    newest first_seen; pass it back as since= to get only newer bounties.
+GET /digest?limit=20&format=markdown|text
+GET /health
+Every endpoint takes profile=NAME for a profile's ranking.
+"""
+
+import json
+import time
+from urllib.parse import urlsplit, parse_qs
+from http.server import HTTPServer, BaseHTTPRequestHandler
+
+MAX_LIMIT = 500
+_MEMO_MAX = 256  # Memoized queries/digests kept per version
+
+
+class RankingView:
+    """One ranking held in memory, reloaded when version() changes.
+
+    load() returns the cache dict ({last_call, model, bounties: [...]}) or
+    None; renderers maps a digest format to render(cache, limit) -> str.
+    """
+
+    def __init__(self, load, version, renderers):
+        self._load = load
+        self._version = version
+        self.renderers = renderers
+        self._token = object()
+        self.version = 0
+        self.cache = None
+        self.loaded_at = None
+        self._memo = {}
+
+    def refresh(self):
+        """Reload if the ranking changed since the last read. Returns True if it did."""
+        token = self._version()
+        if token == self._token:
+            return False
+        self.cache = self._load()
+        self._token = token
+        self.version += 1
+        self.loaded_at = time.time()
+        self._memo.clear()
+        return True
+
+    def _memoized(self, key, compute):
+        if key not in self._memo:
+            if len(self._memo) >= _MEMO_MAX:
+                self._memo.clear()
+            self._memo[key] = compute()
+        return self._memo[key]
+
+    def _matches(self, min_score, category, remote, since):
+        def keep(entry):
+            return ((min_score is None or (entry.get("score") or 0) >= min_score)
+                    and (category is None or (entry.get("category") or "").lower() == category)
+                    and (remote is None or bool(entry.get("remote")) == remote)
+                    and (since is None or (entry.get("first_seen") or "") > since))
+        return [e for e in self.cache["bounties"] if keep(e)]
+
+    def query(self, limit=20, offset=0, min_score=None, category=None, remote=None, since=None):
+        """A page of the ranking that passes every given filter (None = no filter)."""
+        self.refresh()
+        if self.cache is None:
+            return None
+        category = category.lower() if category else None
+        key = ("query", min_score, category, remote, since)
+        found = self._memoized(key, lambda: self._matches(min_score, category, remote, since))
+        entries = self.cache["bounties"]
+        end = offset + limit
+        return {
+            "version": self.version,
+            "last_call": self.cache.get("last_call"),
+            "model": self.cache.get("model"),
+            "total": len(found),
+            "offset": offset,
+            "limit": limit,
+            "next_offset": end if end < len(found) else None,
+            "cursor": self._memoized(("cursor",), lambda: max(
+                (e.get("first_seen") or "" for e in entries), default=since or "")),
+            "bounties": found[offset:end],
+        }
+
+    def digest(self, limit=20, fmt="markdown"):
+        """The ranking's top `limit` rendered as fmt, or None if there's no ranking."""
+        self.refresh()
+        if self.cache is None:
+            return None
+        render = self.renderers[fmt]
+        return self._memoized(("digest", fmt, limit), lambda: render(self.cache, limit))
+
+
+def _int(params, name, default, low, high):
+    value = params.get(name, [None])[0]
+    if value is None or value == "":
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer")
+    if not low <= number <= high:
+        raise ValueError(f"{name} must be between {low} and {high}")
+    return number
+
+
+def _bool(params, name):
+    value = params.get(name, [None])[0]
+    if value is None or value == "":
+        return None
+    if value.lower() in ("1", "true", "yes"):
+        return True
+    if value.lower() in ("0", "false", "no"):
+        return False
+    raise ValueError(f"{name} must be 1 or 0")
+
+
+def make_handler(get_view, log=None):
+    """Request handler class serving the views get_view(profile name or None) returns."""
+
+    class Handler(BaseHTTPRequestHandler):
+        server_version = "BountyQuery/1"
+
+        def log_message(self, fmt, *args):
+            if log:
+                log(f"{self.address_string()} {fmt % args}")
+
+        def _send(self, status, body, content_type="application/json"):
+            if not isinstance(body, str):
+                body = json.dumps(body)
+            data = body.encode()
+            self.send_response(status)
+            self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            url = urlsplit(self.path)
+            params = parse_qs(url.query)
+            view = get_view(params.get("profile", [None])[0])
+            if view is None:
+                return self._send(404, {"error": "unknown profile"})
+            try:
+                if url.path == "/bounties":
+                    result = view.query(
+                        limit=_int(params, "limit", 20, 1, MAX_LIMIT),
+                        offset=_int(params, "offset", 0, 0, 10 ** 9),
+                        min_score=_int(params, "min_score", None, 0, 100),
+                        category=params.get("category", [None])[0],
+                        remote=_bool(params, "remote"),
+                        since=params.get("since", [None])[0],
+                    )
+                elif url.path == "/digest":
+                    fmt = params.get("format", ["markdown"])[0]
+                    if fmt not in view.renderers:
+                        raise ValueError(f"format must be one of {', '.join(view.renderers)}")
+                    result = view.digest(_int(params, "limit", 20, 1, MAX_LIMIT), fmt)
+                    if result is not None:
+                        return self._send(200, result, "text/markdown" if fmt == "markdown" else "text/plain")
+                elif url.path == "/health":
+                    view.refresh()
+                    cache = view.cache or {}
+                    return self._send(200, {"version": view.version, "loaded_at": view.loaded_at,
+                                            "last_call": cache.get("last_call"),
+                                            "bounties": len(cache.get("bounties") or ())})
+                else:
+                    return self._send(404, {"error": "unknown path (try /bounties, /digest or /health)"})
+            except ValueError as e:
+                return self._send(400, {"error": str(e)})
+            if result is None:
+                return self._send(503, {"error": "no scan results yet"})
+            return self._send(200, result)
+
+    return Handler
+
+
+def serve(get_view, host, port, stop, log=None, poll_secs=0.5):
+    """Answer requests one at a time until the stop event is set.
+
+    Requests are served on the calling thread (each takes well under a
+    millisecond), so views and their store connections need no locking.
+    """
+    server = HTTPServer((host, port), make_handler(get_view, log))
+    server.timeout = poll_secs
+    try:
+        while not stop.is_set():
+            server.handle_request()
+    finally:
+        server.server_close()
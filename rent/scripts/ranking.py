@@ -0,0 +1,149 @@
+"""
+Bounded top-K ranking that is updated as scores arrive.
+
+TopK keeps the k best-scored items in one heap and the rest in another.
+Each push (a new item, or a new score for a known one) and each remove
+is O(log n), so a scan can rank heuristic scores as pages come in, then
+rescore in place as stored and Grok scores arrive, without sorting the
+whole board each time. Reading the ranking sorts only the top k. Equal
+scores are ordered by tie(item), smallest first, so arrival order never
+changes the result.
+
+Replaced and removed entries are left in the heaps and skipped when they
+surface (each entry carries a sequence number, so a stale one never
+matches). The heaps are rebuilt once most of their entries are stale.
+"""
+
+import heapq
+import threading
+
+
+class _Reversed:
+    """Sort key that inverts the order of its value (for the top heap's tie-break)."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return self.value > other.value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+
+class TopK:
+    """The k best (item, score) pairs among everything pushed, at or above min_score.
+
+    Items are identified by a hashable key. k=None keeps every item.
+    Thread-safe: scores may be pushed from several threads while another reads.
+    """
+
+    def __init__(self, k=None, min_score=None, tie=None):
+        self.k = k
+        self.min_score = min_score
+        self.tie = tie or (lambda item: 0)
+        self._entries = {}  # key -> (score, tie, item, seq, in_top)
+        self._top = []      # Worst of the top first: (score, _Reversed(tie), seq, key)
+        self._rest = []     # Best of the rest first: (-score, tie, seq, key)
+        self._in_top = 0
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        entry = self._entries.get(key)
+        return entry is not None and entry[4]
+
+    def push(self, key, item, score):
+        """Insert item, or move it to its new score. Below min_score it's dropped."""
+        with self._lock:
+            if self._discard(key):
+                self._rebalance()  # Refill first, so the new score competes with the whole rest
+            if self.min_score is None or score >= self.min_score:
+                self._seq += 1
+                tie = self.tie(item)
+                self._entries[key] = (score, tie, item, self._seq, True)
+                heapq.heappush(self._top, (score, _Reversed(tie), self._seq, key))
+                self._in_top += 1
+            self._rebalance()
+
+    def remove(self, key):
+        """Forget key (a closed or filled bounty). Returns True if it was ranked or waiting."""
+        with self._lock:
+            found = self._discard(key)
+            self._rebalance()
+            return found
+
+    def threshold(self):
+        """The score a newcomer has to beat to enter the top k, or None while there's room."""
+        with self._lock:
+            if self.k is None or self._in_top < self.k:
+                return None
+            self._prune(self._top, True)
+            return self._top[0][0]
+
+    def ranked(self):
+        """The top k as [(item, score), ...], best first."""
+        with self._lock:
+            top = [e for e in self._entries.values() if e[4]]
+        top.sort(key=lambda e: (-e[0], e[1]))
+        return [(e[2], e[0]) for e in top]
+
+    def _discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None and entry[4]:
+            self._in_top -= 1
+        return entry is not None
+
+    def _valid(self, seq, key, in_top):
+        entry = self._entries.get(key)
+        return entry is not None and entry[3] == seq and entry[4] == in_top
+
+    def _prune(self, heap, in_top):
+        """Pop stale entries off the front of heap."""
+        while heap and not self._valid(heap[0][2], heap[0][3], in_top):
+            heapq.heappop(heap)
+
+    def _move(self, key, in_top):
+        score, tie, item, _, _ = self._entries[key]
+        self._seq += 1
+        self._entries[key] = (score, tie, item, self._seq, in_top)
+        if in_top:
+            heapq.heappush(self._top, (score, _Reversed(tie), self._seq, key))
+            self._in_top += 1
+        else:
+            heapq.heappush(self._rest, (-score, tie, self._seq, key))
+            self._in_top -= 1
+
+    def _rebalance(self):
+        while self.k is not None and self._in_top > self.k:
+            self._prune(self._top, True)
+            self._move(heapq.heappop(self._top)[3], False)
+        while self.k is None or self._in_top < self.k:
+            self._prune(self._rest, False)
+            if not self._rest:
+                break
+            self._move(heapq.heappop(self._rest)[3], True)
+        if len(self._top) + len(self._rest) > 2 * len(self._entries) + 64:
+            self._compact()
+
+    def _compact(self):
+        self._top = [e for e in self._top if self._valid(e[2], e[3], True)]
+        self._rest = [e for e in self._rest if self._valid(e[2], e[3], False)]
+        heapq.heapify(self._top)
+        heapq.heapify(self._rest)
+
+
+def top(pairs, k=None, min_score=None, tie=None):
+    """Rank [(item, score), ...] in one go: the k best at or above min_score, best first.
+
+    Orders the same way as TopK, with a single bounded heap pass.
+    """
+    tie = tie or (lambda item: 0)
+    kept = [p for p in pairs if min_score is None or p[1] >= min_score]
+    order = lambda p: (-p[1], tie(p[0]))  # noqa: E731
+    return sorted(kept, key=order) if k is None else heapq.nsmallest(k, kept, key=order)
@@ -0,0 +1,186 @@
+"""
+Compact bounty records and a streaming, selective decoder for board pages.
+
+The API sends every field of every bounty, but the scanner reads only the
+FIELDS below. A Bounty keeps just those in __slots__, along with the
+scanner's own annotations (_hits, _grok_reason, ...). Categories, statuses,
+skills and location strings are interned, so a repeated value is stored
+once per board instead of once per bounty. Records act as read/write
+mappings (get, [], in, keys, items), so the pipeline's dict code works on
+records and plain dicts alike, dict(b, ...) copies included.
+
+decode_page() parses a {"bounties": [...], ...} payload from a stream of
+chunks. It turns one bounty at a time into a record as the chunks arrive,
+so neither the whole body nor its full dicts are held at once.
+"""
+
+import sys
+import json
+import codecs
+
+FIELDS = ("id", "title", "description", "price", "estimatedHours", "category", "skillsNeeded", "location",
+          "spotsAvailable", "spotsFilled", "spotsRemaining", "status", "applicationCount", "createdAt",
+          "agentName")
+ANNOTATIONS = ("_text", "_hits", "_heuristic", "_relevance", "_score_source", "_grok_reason",
+               "_dupes", "_dup_of", "_views")
+_KEYS = frozenset(FIELDS + ANNOTATIONS)
+_WHITESPACE = " \t\r\n"
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class Bounty:
+    """One bounty: the fields the scanner reads, in slots. Unset fields read as missing."""
+
+    __slots__ = FIELDS + ANNOTATIONS
+
+    def __init__(self, fields=()):
+        for key, value in dict(fields).items():
+            self[key] = value
+
+    @classmethod
+    def from_payload(cls, data):
+        """Record from one decoded API bounty; unread fields are dropped, repeated strings interned."""
+        b = cls()
+        for key in FIELDS:
+            if key in data:
+                setattr(b, key, data[key])
+        for key in ("category", "status"):
+            if key in data:
+                setattr(b, key, _intern(data[key]))
+        if isinstance(data.get("skillsNeeded"), list):
+            b.skillsNeeded = [_intern(s) for s in data["skillsNeeded"]]
+        if isinstance(data.get("location"), dict):
+            b.location = {sys.intern(k): _intern(v) for k, v in data["location"].items()
+                          if isinstance(v, (str, bool, int, float)) or v is None}
+        return b
+
+    def get(self, key, default=None):
+        return getattr(self, key, default) if key in _KEYS else default
+
+    def __getitem__(self, key):
+        if key in _KEYS:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                pass
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key not in _KEYS:
+            raise KeyError(f"Bounty has no field {key!r}")
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in _KEYS and hasattr(self, key)
+
+    def keys(self):
+        return [k for k in self.__slots__ if hasattr(self, k)]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def items(self):
+        return [(k, getattr(self, k)) for k in self.keys()]
+
+    def __repr__(self):
+        return f"Bounty(id={self.get('id')!r}, title={self.get('title')!r})"
+
+
+class _Reader:
+    """Text buffer over a stream of str or bytes chunks, for JSONDecoder.raw_decode."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self.buf, self.pos = "", 0
+
+    def _more(self):
+        for chunk in self._chunks:
+            if isinstance(chunk, bytes):
+                chunk = self._utf8.decode(chunk)
+            if chunk:
+                self.buf, self.pos = self.buf[self.pos:] + chunk, 0
+                return
+        raise ValueError("truncated JSON payload")
+
+    def peek(self):
+        """The next non-whitespace character (not consumed)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            self._more()
+
+    def expect(self, chars):
+        ch = self.peek()
+        if ch not in chars:
+            raise ValueError(f"expected one of {chars!r} in JSON payload, found {ch!r}")
+        self.pos += 1
+        return ch
+
+    def value(self):
+        """Decode the next JSON value, reading more chunks until it's complete."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                self._more()  # Cut off mid-value; raises once the stream is exhausted
+                continue
+            # A number or literal ending the buffer may continue in the next chunk
+            if end == len(self.buf) and not isinstance(value, (dict, list, str)):
+                try:
+                    self._more()
+                except ValueError:
+                    pass
+                else:
+                    continue
+            self.pos = end
+            return value
+
+
+def decode_page(chunks, meta=None, key="bounties"):
+    """Yield a Bounty per element of payload[key], decoding chunks as they arrive.
+
+    Top-level fields other than key (nextCursor, hasMore, etag, ...) are
+    stored in meta. Raises ValueError on a payload that isn't a JSON object.
+    """
+    reader = _Reader(chunks)
+    meta = {} if meta is None else meta
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+    while True:
+        name = reader.value()
+        reader.expect(":")
+        if name == key and reader.peek() == "[":
+            reader.expect("[")
+            if reader.peek() == "]":
+                reader.pos += 1
+            else:
+                while True:
+                    item = reader.value()
+                    if isinstance(item, dict):
+                        yield Bounty.from_payload(item)
+                    if reader.expect(",]") == "]":
+                        break
+        else:
+            meta[name] = reader.value()
+        if reader.expect(",}") == "}":
+            return
+
+
+def write_page(f, meta, bounties, key="bounties"):
+    """Write {**meta, key: [...]} to text file f one bounty at a time, without annotations."""
+    f.write(json.dumps(meta)[:-1] + (", " if meta else "") + json.dumps(key) + ": [")
+    for i, b in enumerate(bounties):
+        f.write((", " if i else "") + json.dumps({k: v for k, v in b.items() if not k.startswith("_")}))
+    f.write("]}")
@@ -0,0 +1,95 @@
+"""
+Local relevance ranking for bounties: an incremental BM25 index.
+
+Bounties are indexed as weighted fields (a title word counts more than a
+description word). The query is a bag of terms built from the skills and
+location preferences, and BM25 ranks how well each posting matches it.
+update() (re)indexes only postings whose text changed, so polling the
+same board keeps the index warm for the cost of the new arrivals.
+"""
+
+import re
+import math
+
+K1 = 1.2   # Term frequency saturation
+B = 0.75   # Length normalization
+STOPWORDS = frozenset("a an and are as at be by for from in is it of on or our the this to we with you your".split())
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text):
+    """Lowercase alphanumeric words, stopwords dropped."""
+    return [t for t in _TOKEN.findall((text or "").lower()) if t not in STOPWORDS]
+
+
+def query_terms(phrases):
+    """Unique terms of a list of phrases ("full stack" → "full", "stack")."""
+    return sorted({t for phrase in phrases for t in tokenize(phrase)})
+
+
+class RelevanceIndex:
+    """Inverted index of weighted field terms with BM25 scoring. Not thread-safe."""
+
+    def __init__(self):
+        self.postings = {}  # term -> {doc_id: weighted tf}
+        self.docs = {}      # doc_id -> (fields key, length, terms)
+        self.total_len = 0
+
+    def update(self, doc_id, fields):
+        """Index fields ([(text, weight), ...]) under doc_id. Returns False if unchanged."""
+        key = tuple(fields)
+        old = self.docs.get(doc_id)
+        if old is not None:
+            if old[0] == key:
+                return False
+            self.remove(doc_id)
+        tf = {}
+        for text, weight in fields:
+            for term in tokenize(text):
+                tf[term] = tf.get(term, 0) + weight
+        length = sum(tf.values())
+        for term, count in tf.items():
+            self.postings.setdefault(term, {})[doc_id] = count
+        self.docs[doc_id] = (key, length, tuple(tf))
+        self.total_len += length
+        return True
+
+    def remove(self, doc_id):
+        entry = self.docs.pop(doc_id, None)
+        if entry is None:
+            return
+        _, length, terms = entry
+        self.total_len -= length
+        for term in terms:
+            docs = self.postings[term]
+            del docs[doc_id]
+            if not docs:
+                del self.postings[term]
+
+    def scores(self, doc_ids, terms):
+        """BM25 score of each doc_id against the query terms ({doc_id: score}, 0.0 if no match)."""
+        n = len(self.docs)
+        out = dict.fromkeys(doc_ids, 0.0)
+        if not n:
+            return out
+        avg_len = self.total_len / n or 1.0
+        docs = self.docs
+        for term in terms:
+            posting = self.postings.get(term)
+            if not posting:
+                continue
+            idf = math.log(1 + (n - len(posting) + 0.5) / (len(posting) + 0.5))
+            # Walk whichever side is smaller
+            if len(out) < len(posting):
+                pairs = [(d, posting[d]) for d in out if d in posting]
+            else:
+                pairs = [(d, tf) for d, tf in posting.items() if d in out]
+            for d, tf in pairs:
+                norm = K1 * (1 - B + B * docs[d][1] / avg_len)
+                out[d] += idf * tf * (K1 + 1) / (tf + norm)
+        return out
+
+    def __len__(self):
+        return len(self.docs)
+
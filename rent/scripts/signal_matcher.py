@@ -0,0 +1,87 @@
+"""
+Single-pass signal matching for the bounty scanner.
+
+One combined regex finds every signal of every list in a single scan of
+a bounty's text. Counts match `sum(1 for s in signals if s in text)` per
+list exactly, including signals that overlap or are prefixes of others.
+"""
+
+import re
+
+
+def _trie_pattern(words):
+    """Regex alternation with shared prefixes factored out, longest match first.
+
+    A flat `a|b|c` makes the engine retry every signal at every position;
+    the trie form rejects most positions on their first character.
+    """
+    trie = {}
+    for w in words:
+        node = trie
+        for ch in w:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node):
+        alts = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not alts:
+            return ""
+        body = alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+        # Greedy optional: a word ending here still prefers its longer extensions
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+def compile_matcher(groups):
+    """Compile {group: [signal, ...]} into match(text) -> {group: hit count}.
+
+    Each list entry counts at most once, like a substring `in` check.
+    """
+    signals = sorted({s for sigs in groups.values() for s in sigs if s}, key=len, reverse=True)
+    empty = {g: sigs.count("") for g, sigs in groups.items()}
+    if not signals:
+        return lambda text: dict(empty)
+
+    # Longest alternative wins at each start position, and every shorter signal
+    # matching there is one of its prefixes. Resuming one char past each match
+    # start (rather than at its end) also catches overlapping signals.
+    search = re.compile(_trie_pattern(signals)).search
+    prefixes = {s: [p for p in signals if s.startswith(p)] for s in signals}
+    owners = {s: [g for g, sigs in groups.items() for x in sigs if x == s] for s in signals}
+
+    def match(text):
+        counts = dict(empty)
+        found = set()
+        m = search(text)
+        while m:
+            found.update(prefixes[m.group()])
+            m = search(text, m.start() + 1)
+        for s in found:
+            for g in owners[s]:
+                counts[g] += 1
+        return counts
+
+    return match
+
+
+def compile_skill_matcher(my_skills):
+    """Compile my_skills into matches(skill) -> bool.
+
+    Same result as `any(ms in skill or skill in ms for ms in my_skills)`,
+    memoized per skill string since the same tags repeat across bounties.
+    """
+    contains = compile_matcher({"mine": my_skills})
+    # Every substring of every skill, for the `skill in ms` direction
+    substrings = {ms[i:j] for ms in my_skills for i in range(len(ms) + 1) for j in range(i, len(ms) + 1)}
+    memo = {}
+
+    def matches(skill):
+        hit = memo.get(skill)
+        if hit is None:
+            hit = memo[skill] = bool(my_skills) and (
+                skill in substrings or contains(skill)["mine"] > 0
+            )
+        return hit
+
+    return matches
@@ -0,0 +1,160 @@
+"""
+Cross-process single-flight lock: a lock file with a lease.
+
+The holder (host, pid, token) is written to a temporary file, which is
+then hard-linked into place. The link fails if the lock exists, so only
+one process can hold it, and the lock file is never seen empty. While the lock is held, a daemon
+thread refreshes the file's mtime every heartbeat_secs. A lock counts as
+stale, and can be taken over, in two cases:
+- its mtime is older than lease_secs (a hung or vanished holder);
+- its holder is a dead process on this host (a crashed run).
+
+To take over, a process renames the stale file aside and then checks that
+it moved the file it judged stale: the same token, or, for a stale file
+that couldn't be read, another unreadable file. Anything else is a new
+holder's lock and is linked back. Of several processes racing for the
+same stale lock, exactly one wins. Because a lock can go missing for that
+moment, a process re-reads it after linking before it counts itself the
+holder, and a missing lock is re-read rather than taken as lost.
+"""
+
+import os
+import json
+import time
+import uuid
+import socket
+import threading
+
+
+class LeaseLock:
+    """Non-blocking lock shared by every process that uses the same path."""
+
+    def __init__(self, path, lease_secs=300, heartbeat_secs=30):
+        self.path = path
+        self.lease_secs = lease_secs
+        self.heartbeat_secs = heartbeat_secs
+        self.token = None
+        self.lost = False  # Set if another process took the lock over while we held it
+        self._done = threading.Event()
+
+    def _read(self, path=None):
+        try:
+            return json.loads((path or self.path).read_text())
+        except (OSError, ValueError):
+            return None
+
+    def _read_settled(self, tries=5, pause=0.02):
+        """Like _read, but re-reads a missing lock a few times: a taker renames it
+        aside for a moment while it checks which file it moved."""
+        for _ in range(tries - 1):
+            info = self._read()
+            if info is not None:
+                return info
+            time.sleep(pause)
+        return self._read()
+
+    def _is_stale(self, info):
+        try:
+            age = time.time() - self.path.stat().st_mtime
+        except FileNotFoundError:
+            return False
+        if age > self.lease_secs:
+            return True
+        if info and info.get("host") == socket.gethostname() and info.get("pid"):
+            try:
+                os.kill(info["pid"], 0)
+            except ProcessLookupError:
+                return True
+            except PermissionError:
+                pass
+        # Locks are never written in place, so an unreadable one is left over from
+        # an older version or a damaged disk; give it a moment in case it's mid-write
+        return info is None and age > 5
+
+    def holder(self):
+        """The live holder's {host, pid, token, acquired}, or None if the lock is free or stale."""
+        info = self._read()
+        if info is None and not self.path.exists():
+            return None
+        return None if self._is_stale(info) else (info or {})
+
+    def _break_stale(self, info):
+        grave = self.path.with_name(f"{self.path.name}.{uuid.uuid4().hex}.stale")
+        try:
+            os.rename(self.path, grave)
+        except FileNotFoundError:
+            return
+        moved = self._read(grave)
+        if info is None:
+            judged = moved is None
+        else:
+            judged = moved is not None and moved.get("token") == info.get("token")
+        if not judged:
+            # A new holder slipped in between our check and the rename: hand it back
+            try:
+                os.link(grave, self.path)
+            except FileExistsError:
+                pass
+        grave.unlink(missing_ok=True)
+
+    def acquire(self):
+        """Take the lock if it's free or stale. Returns True if we now hold it."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        token = uuid.uuid4().hex
+        draft = self.path.with_name(f"{self.path.name}.{token}.tmp")
+        draft.write_text(json.dumps({"host": socket.gethostname(), "pid": os.getpid(), "token": token,
+                                     "acquired": time.time()}))
+        try:
+            for _ in range(2):
+                try:
+                    os.link(draft, self.path)
+                    break
+                except FileExistsError:
+                    info = self._read()
+                    if not self._is_stale(info):
+                        return False
+                    self._break_stale(info)
+            else:
+                return False
+        finally:
+            draft.unlink(missing_ok=True)
+        info = self._read_settled()
+        if not info or info.get("token") != token:
+            return False  # A racing taker's hand-back lost our link
+        self.token = token
+        self.lost = False
+        self._done.clear()
+        threading.Thread(target=self._heartbeat, name="lease-heartbeat", daemon=True).start()
+        return True
+
+    def _heartbeat(self):
+        while not self._done.wait(self.heartbeat_secs):
+            if not self._owned():
+                self.lost = True
+                return
+            try:
+                os.utime(self.path)
+            except FileNotFoundError:
+                pass  # Renamed aside by a taker; _owned() decides on the next beat
+
+    def _owned(self):
+        info = self._read_settled()
+        return bool(info) and info.get("token") == self.token
+
+    def release(self):
+        """Give the lock up (leaves it alone if another process took it over)."""
+        if self.token is None:
+            return
+        self._done.set()
+        if self._owned():
+            self.path.unlink(missing_ok=True)
+        self.token = None
+
+    def wait(self, timeout, poll=0.5):
+        """Block until the lock is free or stale, up to timeout seconds. Returns True if it is."""
+        deadline = time.monotonic() + timeout
+        while self.holder() is not None:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(poll)
+        return True
@@ -0,0 +1,130 @@
+"""
+Telegram delivery for the bounty scanner.
+
+Splits long digests at Markdown-safe boundaries, paces sends with token
+buckets (per chat and global), and reports which parts failed so the
+caller can queue them for retry instead of dropping them.
+"""
+
+import time
+import threading
+
+API_BASE = "https://api.telegram.org"
+MESSAGE_LIMIT = 4096        # Telegram's max characters per message
+GLOBAL_RATE = 30.0          # Messages/second across all chats
+CHAT_RATE = 1.0             # Messages/second to one chat
+CHAT_BURST = 3
+MAX_INLINE_WAIT = 30        # Honor a 429 retry_after inline up to this many seconds
+
+
+class TokenBucket:
+    """Blocking token bucket: take() waits until a token is available."""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self):
+        """Consume one token, sleeping if needed. Returns seconds waited."""
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+_global_bucket = TokenBucket(GLOBAL_RATE, GLOBAL_RATE)
+_chat_buckets = {}
+_chat_lock = threading.Lock()
+
+
+def _chat_bucket(chat_id):
+    with _chat_lock:
+        if chat_id not in _chat_buckets:
+            _chat_buckets[chat_id] = TokenBucket(CHAT_RATE, CHAT_BURST)
+        return _chat_buckets[chat_id]
+
+
+# ── Splitting ────────────────────────────────────────────
+
+def split_message(text, limit=MESSAGE_LIMIT):
+    """Split text into parts of at most `limit` chars.
+
+    Prefers blank lines (between bounties), then line breaks, then spaces,
+    so Markdown links and `code` spans — which never span lines in our
+    digests — stay intact. Only a single word longer than `limit` is cut.
+    """
+    return [p for p in _split(text, limit, ("\n\n", "\n", " ")) if p.strip()]
+
+
+def _split(text, limit, seps):
+    if len(text) <= limit:
+        return [text]
+    if not seps:
+        return [text[i:i + limit] for i in range(0, len(text), limit)]
+    sep, rest = seps[0], seps[1:]
+    parts, current = [], ""
+    for piece in text.split(sep):
+        for chunk in (_split(piece, limit, rest) if len(piece) > limit else [piece]):
+            candidate = f"{current}{sep}{chunk}" if current else chunk
+            if len(candidate) <= limit:
+                current = candidate
+            else:
+                parts.append(current)
+                current = chunk
+    if current:
+        parts.append(current)
+    return parts
+
+
+# ── Sending ──────────────────────────────────────────────
+
+def send_part(session, bot_token, chat_id, text, parse_mode="Markdown", api_base=API_BASE):
+    """Send one message, paced by the rate limiters.
+
+    Returns (ok, error, retry_after). A Markdown parse error is retried once
+    as plain text so the content still arrives.
+    """
+    _chat_bucket(chat_id).take()
+    _global_bucket.take()
+    payload = {"chat_id": chat_id, "text": text, "disable_web_page_preview": True}
+    if parse_mode:
+        payload["parse_mode"] = parse_mode
+    try:
+        r = session.post(f"{api_base}/bot{bot_token}/sendMessage", json=payload, timeout=10)
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}", None
+    if r.ok:
+        return True, "", None
+    try:
+        body = r.json()
+    except ValueError:
+        body = {}
+    error = f"HTTP {r.status_code}: {body.get('description', r.text[:200])}"
+    if r.status_code == 400 and parse_mode and "parse entities" in error:
+        return send_part(session, bot_token, chat_id, text, parse_mode=None, api_base=api_base)
+    retry_after = (body.get("parameters") or {}).get("retry_after")
+    return False, error, retry_after
+
+
+def deliver(session, bot_token, chat_id, text, api_base=API_BASE):
+    """Split and send text. Returns [(part, error, retry_after), ...] that failed."""
+    failed = []
+    for part in split_message(text):
+        ok, error, retry_after = send_part(session, bot_token, chat_id, part, api_base=api_base)
+        if not ok and retry_after and retry_after <= MAX_INLINE_WAIT:
+            time.sleep(retry_after)
+            ok, error, retry_after = send_part(session, bot_token, chat_id, part, api_base=api_base)
+        if not ok:
+            failed.append((part, error, retry_after))
+    return failed
@@ -0,0 +1,9 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(ROOT / "rent" / "scripts"), str(ROOT / "bench")]
+# Keep anything the scanner writes out of rent/cache
+os.environ.setdefault("RENT_CACHE_DIR", tempfile.mkdtemp(prefix="rent-tests-"))
@@ -0,0 +1,62 @@
+"""score_bounties() (vectorized, or its scalar fallback) must match score_bounty() on every bounty."""
+
+import sys
+import random
+
+import pytest
+
+import bounty_hunter as bh
+from synthetic import make_board
+
+CATEGORIES = ["research", "physical-tasks", "errands", "development", "design", "", None]
+
+
+def random_board(n, seed):
+    """A synthetic board with the numeric and location edge cases score_bounty() handles."""
+    rng = random.Random(seed)
+    board = make_board(n, seed=seed, scam_signals=bh.SCAM_SIGNALS, for_hire_signals=bh.FOR_HIRE_SIGNALS)
+    for b in board:
+        b["price"] = rng.choice([None, 0, 5, 20, 49.5, 75, 400, rng.uniform(0, 2000)])
+        b["estimatedHours"] = rng.choice([None, 0, 0.5, 1, 4, 40])
+        b["spotsAvailable"] = rng.choice([None, 0, 1, 2, 5])
+        b["spotsFilled"] = rng.choice([None, 0, 1, 3, 6])
+        b["category"] = rng.choice(CATEGORIES)
+        b["location"] = rng.choice([{"isRemoteAllowed": True}, {"isRemoteAllowed": None}, {}, None])
+        if b["location"] is None:
+            del b["location"]
+        if rng.random() < 0.1:
+            b["skillsNeeded"] = rng.choice([[], ["python"], ["plumbing", "welding"]])
+        for key in ("description", "price", "estimatedHours", "spotsAvailable", "spotsFilled", "category"):
+            if rng.random() < 0.05:
+                b.pop(key, None)
+    return board
+
+
+def scalar_scores(board, skills=None):
+    return [bh.score_bounty(dict(b), skills) for b in board]
+
+
+@pytest.fixture(params=["numpy", "fallback"])
+def scorer(request, monkeypatch):
+    """score_bounties() with numpy, and with batch_score unimportable (numpy not installed)."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setitem(sys.modules, "batch_score", None)
+    return lambda board, skills=None: bh.score_bounties([dict(b) for b in board], skills)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_scalar(scorer, seed):
+    board = random_board(500, seed)
+    assert scorer(board) == scalar_scores(board)
+
+
+def test_matches_scalar_with_profile_skills(scorer):
+    board = random_board(300, seed=11)
+    skills = ["react", "design", "plumbing"]
+    assert scorer(board, skills) == scalar_scores(board, skills)
+
+
+def test_empty_board(scorer):
+    assert scorer([]) == []
@@ -0,0 +1,117 @@
+"""Streamed Grok replies (_sse_deltas + _iter_json_objects via _grok_call) against a local SSE stub."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+import requests
+
+import bounty_hunter as bh
+import metrics
+
+
+class SSEStub:
+    """Answers every POST with body (bytes). With truncate=True the connection is dropped
+    before the Content-Length it announced, like a reply cut off mid-stream."""
+
+    def __init__(self):
+        self.body, self.truncate = b"", False
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Content-Length", str(len(stub.body) + (100 if stub.truncate else 0)))
+                self.end_headers()
+                self.wfile.write(stub.body)
+                self.wfile.flush()
+                self.close_connection = True
+
+        self.server = HTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/v1/chat/completions"
+        threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def sse(fragments, usage=None):
+    """An OpenAI-style SSE body delivering content as the given fragments."""
+    events = [{"choices": [{"delta": {"content": frag}}]} for frag in fragments]
+    if usage:
+        events.append({"choices": [], "usage": usage})
+    lines = [f"data: {json.dumps(e)}\n\n" for e in events]
+    return "".join(lines).encode()
+
+
+def split(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    server = SSEStub()
+    monkeypatch.setattr(bh, "XAI_CHAT_URL", server.url)
+    monkeypatch.setattr(bh, "XAI_API_KEY", "test-key")
+    yield server
+    server.close()
+
+
+def call(chunk):
+    payload = {"model": "test", "messages": [], "stream": True}
+    return {b["id"]: (s, b.get("_grok_reason")) for b, s in bh._grok_call(chunk, payload, True, None)}
+
+
+def chunk_of(n):
+    return [{"id": f"b{i}"} for i in range(n)]
+
+
+REPLY = [
+    {"idx": 0, "score": 82, "reason": 'set up {"x": 1} for the "client"'},
+    {"idx": 1, "score": 40, "reason": "ends in a backslash \\"},
+    {"idx": 2, "score": 65, "reason": "} stray closers { and ] brackets"},
+]
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 1000])
+def test_fenced_array_with_braces_and_escapes(stub, size):
+    text = "```json\n" + json.dumps(REPLY, indent=1) + "\n```"
+    stub.body = sse(split(text, size)) + b"data: [DONE]\n\n"
+    assert call(chunk_of(3)) == {f"b{i}": (r["score"], r["reason"]) for i, r in enumerate(REPLY)}
+
+
+def test_usage_event_with_empty_choices(stub, monkeypatch):
+    metrics.reset()
+    monkeypatch.setattr(metrics, "_enabled", True)
+    stub.body = sse(split(json.dumps(REPLY), 5), usage={"prompt_tokens": 120, "completion_tokens": 30})
+    stub.body += b"data: [DONE]\n\n"
+    assert len(call(chunk_of(3))) == 3
+    counters = metrics.report()["counters"]
+    assert counters['grok_tokens{kind="prompt"}'] == 120
+    assert counters['grok_tokens{kind="completion"}'] == 30
+
+
+def test_truncated_mid_object_keeps_parsed_scores(stub):
+    text = json.dumps(REPLY)
+    cut = text.index('"reason": "ends in')  # Inside the second object
+    stub.body, stub.truncate = sse(split(text[:cut], 4)), True
+    assert call(chunk_of(3)) == {"b0": (82, REPLY[0]["reason"])}
+
+
+def test_truncated_before_any_score_raises(stub):
+    stub.body, stub.truncate = sse(['[{"idx": 0, "sco']), True
+    with pytest.raises(requests.exceptions.RequestException):
+        call(chunk_of(3))
+
+
+def test_stream_without_scores_raises(stub):
+    stub.body = sse(["I can't score these."]) + b"data: [DONE]\n\n"
+    with pytest.raises(ValueError):
+        call(chunk_of(3))
@@ -0,0 +1,89 @@
+"""LeaseLock takeovers of a stale lease, raced by several takers at once."""
+
+import os
+import json
+import time
+import threading
+
+import pytest
+
+from singleflight import LeaseLock
+
+TAKERS = 8
+
+
+def stale_lock(path):
+    """A lock left by a hung holder: a live pid, but an mtime an hour past the lease."""
+    path.write_text(json.dumps({"host": "elsewhere", "pid": os.getpid(), "token": "old", "acquired": 0}))
+    an_hour_ago = time.time() - 3600
+    os.utime(path, (an_hour_ago, an_hour_ago))
+
+
+def race(path, refresh):
+    """Start TAKERS acquires together (and a process refreshing the old lease, if refresh).
+    Returns the locks that think they hold it."""
+    locks = [LeaseLock(path, lease_secs=60, heartbeat_secs=60) for _ in range(TAKERS)]
+    results = [None] * TAKERS
+    start = threading.Barrier(TAKERS + 1)
+    done = threading.Event()
+
+    def take(i):
+        start.wait()
+        results[i] = locks[i].acquire()
+
+    def refresher():
+        start.wait()
+        while not done.is_set():
+            try:
+                os.utime(path)
+            except FileNotFoundError:
+                pass
+
+    threads = [threading.Thread(target=take, args=(i,)) for i in range(TAKERS)]
+    threads.append(threading.Thread(target=refresher if refresh else start.wait))
+    for t in threads:
+        t.start()
+    for t in threads[:-1]:
+        t.join()
+    done.set()
+    threads[-1].join()
+    return [lock for lock, won in zip(locks, results) if won]
+
+
+@pytest.mark.parametrize("refresh", [False, True])
+def test_concurrent_takeovers_of_a_stale_lease(tmp_path, refresh):
+    path = tmp_path / "scan.lock"
+    for _ in range(40):
+        stale_lock(path)
+        holders = race(path, refresh)
+        token = json.loads(path.read_text())["token"]
+        assert len(holders) <= 1
+        if not refresh:
+            assert len(holders) == 1
+        if holders:
+            assert holders[0].token == token
+            assert holders[0]._owned()
+        else:
+            assert token == "old"  # Refreshed before anyone broke it
+        for lock in holders:
+            lock.release()
+        path.unlink(missing_ok=True)
+        assert not list(tmp_path.glob("*.tmp")) and not list(tmp_path.glob("*.stale"))
+
+
+def test_holder_survives_takers_renaming_it_aside(tmp_path):
+    path = tmp_path / "scan.lock"
+    holder = LeaseLock(path, heartbeat_secs=0.002)
+    assert holder.acquire()
+    taker = LeaseLock(path)
+    deadline = time.monotonic() + 0.5
+    while time.monotonic() < deadline:
+        # A taker that judged a different (earlier) holder stale: it moves the
+        # lock aside, sees the token changed, and hands it back
+        taker._break_stale({"token": "earlier"})
+        time.sleep(0.001)
+    time.sleep(0.05)
+    assert not holder.lost
+    assert holder._owned()
+    holder.release()
+    assert not path.exists()